@@ -1,12 +1,62 @@
 """ Apex Legends API Python Module """
-from .al_api import ApexLegendsAPI
-from .al_base import ALPlatform, ALAction, ALHTTPExceptionFromResponse
-from .al_domain import ALPlayer
+import importlib
+from typing import TYPE_CHECKING
+from .al_base import ALPlatform, ALAction, ALHTTPExceptionFromResponse, ALPlayerNotFoundError
+from .al_base import ALUnexpectedResponseError
+
+if TYPE_CHECKING:
+    from .al_api import ApexLegendsAPI, PlayerResult
+    from .al_cache import ResponseCache
+    from .al_domain import ALPlayer
+    from .al_identity import IdentityStore, SQLiteIdentityStore
+    from .al_metrics import ClientStats, RequestInfo
+    from .al_ratelimit import RetryPolicy, TokenBucket
+    from .al_tracking import TrackedPlayerIndex
+
+_LAZY_ATTRIBUTES: dict = {
+    'ApexLegendsAPI': '.al_api',
+    'PlayerResult': '.al_api',
+    'ResponseCache': '.al_cache',
+    'ALPlayer': '.al_domain',
+    'IdentityStore': '.al_identity',
+    'SQLiteIdentityStore': '.al_identity',
+    'ClientStats': '.al_metrics',
+    'RequestInfo': '.al_metrics',
+    'RetryPolicy': '.al_ratelimit',
+    'TokenBucket': '.al_ratelimit',
+    'TrackedPlayerIndex': '.al_tracking',
+}
+""" attribute -> module it is imported from on first access (the http stack is only loaded
+when the client is used) """
 
 __all__ = [
     'ApexLegendsAPI',
     'ALPlatform',
     'ALAction',
     'ALPlayer',
-    'ALHTTPExceptionFromResponse'
+    'ALHTTPExceptionFromResponse',
+    'ALPlayerNotFoundError',
+    'ALUnexpectedResponseError',
+    'PlayerResult',
+    'ResponseCache',
+    'IdentityStore',
+    'SQLiteIdentityStore',
+    'RetryPolicy',
+    'TokenBucket',
+    'TrackedPlayerIndex',
+    'ClientStats',
+    'RequestInfo'
 ]
+
+
+def __getattr__(name: str):
+    """ import the module of a public attribute on first access """
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
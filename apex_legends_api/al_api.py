@@ -4,47 +4,249 @@ Apex Legends API
 | The ApexLegendsAPI wraps the api at: https://apexlegendsapi.com
 | Get your API Key Here: https://apexlegendsapi.com
 """
-import json
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed as futures_as_completed
+from functools import partial
+from typing import Callable, Iterable, Iterator, List, Tuple, Union
 import requests
+from requests.adapters import HTTPAdapter
 from deprecated import deprecated
-from .al_domain import ALPlayer  # noqa E0402
-from .al_base import ALPlatform, ALAction, ALHTTPExceptionFromResponse  # noqa E0402
+from .al_domain import ALPlayer, Event  # noqa E0402
+from .al_base import ALPlatform, ALAction, ALEventType, ALHTTPExceptionFromResponse  # noqa E0402
+from .al_base import ALPlayerNotFoundError, ALUnexpectedResponseError  # noqa E0402
+from .al_cache import ResponseCache  # noqa E0402
+from .al_client import ALClientBase  # noqa E0402
+from .al_identity import IdentityStore  # noqa E0402
+from .al_json import JSONDecoder, decode_response  # noqa E0402
+from .al_metrics import ClientStats, RequestInfo  # noqa E0402
+from .al_ratelimit import RetryPolicy, TokenBucket  # noqa E0402
+from .al_singleflight import SingleFlight  # noqa E0402
+from .al_stream import iter_events, iter_json_array  # noqa E0402
+from .al_tracking import TrackedPlayerIndex  # noqa E0402
 
 
-class ApexLegendsAPI:
+# pylint: disable=too-few-public-methods
+class PlayerResult:
+    """
+    Result of a single player lookup in a bulk fetch (see: ApexLegendsAPI.get_players)
+
+    Note:
+        Exactly one of ``player`` or ``error`` is set
+    """
+    def __init__(self, index: int, query: tuple, player: ALPlayer = None, error: Exception = None):
+        self.index: int = index
+        """ Position of the query in the input list """
+        self.query: tuple = query
+        """ The (name or uid, platform) tuple that was requested """
+        self.player: ALPlayer = player
+        """ The ALPlayer if the lookup succeeded """
+        self.error: Exception = error
+        """
+        The exception if the lookup failed: ALHTTPExceptionFromResponse, ALPlayerNotFoundError,
+        a requests.RequestException (ex: a timeout) or an ALUnexpectedResponseError for a
+        response without the expected shape
+        """
+
+    @property
+    def ok(self) -> bool:
+        """ True if the lookup succeeded """
+        return self.error is None
+
+
+class ApexLegendsAPI(ALClientBase):
     """
     Main class that wraps the API calls
+
+    Discussion:
+        One instance can be shared by many threads. The ``requests.Session`` and its adapters are
+        set up once in the constructor and only read afterwards (the connection pools are thread
+        safe), and the cache, identity store, rate limiter and tracked player index all lock
+        internally. Size the connection pool (``pool_maxsize``) to the number of threads using
+        the client (including the ``max_workers`` of get_players), otherwise connections are
+        closed when returned to a full pool and reopened by the next request.
     """
-    api_version: str = "5"
-    base_params: dict = {'version': api_version}
-    base_url: str = "https://api.mozambiquehe.re/bridge"
+    # pylint: disable=too-many-instance-attributes
+    stream_chunk_size: int = 64 * 1024
+    """ bytes read at a time by the streaming methods (iter_events / iter_events_by_uid) """
+
+    # pylint: disable=too-many-arguments,too-many-locals
+    def __init__(
+            self,
+            api_key: str,
+            cache: ResponseCache = None,
+            identity_store: IdentityStore = None,
+            rate_limiter: TokenBucket = None,
+            retry: RetryPolicy = None,
+            tracked_players: TrackedPlayerIndex = None,
+            json_decoder: JSONDecoder = None,
+            pool_connections: int = 10,
+            pool_maxsize: int = 10,
+            pool_block: bool = False,
+            timeout: Union[float, Tuple[float, float]] = None,
+            keep_alive: bool = True,
+            coalesce: bool = True,
+            stats: ClientStats = None,
+            hooks: List[Callable[[RequestInfo], None]] = None,
+            base_url: str = None,
+            nametouid_url: str = None,
+            origin_url: str = None
+    ):
+        """
+        Initialize with the API Key
 
-    def __init__(self, api_key: str):
-        """ Initialize with the API Key """
+        :param api_key: your API Key
+        :param cache: optional ResponseCache, responses are cached per endpoint when set
+        :param identity_store: optional IdentityStore (ex: SQLiteIdentityStore) checked before
+            calling the api in ``nametouid`` and ``get_player_origin``
+        :param rate_limiter: optional TokenBucket every request has to take a token from, use
+            ``TokenBucket.for_key(api_key, rate)`` to share it with all clients using the key
+        :param retry: optional RetryPolicy for 429 / 5xx responses (no retries when not set)
+        :param tracked_players: TrackedPlayerIndex used by get_player / get_player_by_uid
+            (defaults to one refreshing every 5 minutes)
+        :param json_decoder: function decoding the response bytes (ex: ``orjson.loads``),
+            defaults to the fastest installed json library
+        :param pool_connections: number of host connection pools to keep
+        :param pool_maxsize: connections kept open per host, set it to the number of threads
+            sharing the client
+        :param pool_block: if True a request waits for a free connection instead of opening
+            one more than ``pool_maxsize``
+        :param timeout: seconds to wait for the server, a (connect, read) tuple or None to wait
+            forever
+        :param keep_alive: if False every connection is closed after its request
+        :param coalesce: if True identical requests in flight at the same time (from different
+            threads) share one upstream request
+        :param stats: optional ClientStats aggregating every request per endpoint
+        :param hooks: functions called with the RequestInfo of every request (see add_hook)
+        :param base_url: url of the ``/bridge`` endpoint (ex: a local MockAPIServer)
+        :param nametouid_url: url of the ``/nametouid`` endpoint
+        :param origin_url: url of the ``/origin`` endpoint
+        """
+        super().__init__(base_url=base_url, nametouid_url=nametouid_url, origin_url=origin_url)
         self.session: requests.Session = requests.Session()
         self.session.headers.update({'Authorization': api_key})
+        if not keep_alive:
+            self.session.headers.update({'Connection': 'close'})
+        self.pool_connections: int = pool_connections
+        """ number of host connection pools kept by the session """
+        self.pool_maxsize: int = pool_maxsize
+        """ connections kept open per host """
+        self.pool_block: bool = pool_block
+        """ True if requests wait for a free connection when the pool is full """
+        self.timeout: Union[float, Tuple[float, float]] = timeout
+        """ timeout of every request (None to wait forever) """
+        self.single_flight: SingleFlight = SingleFlight() if coalesce else None
+        """ SingleFlight coalescing identical requests (or None if requests are not coalesced) """
+        self._mount_adapters()
+        self.cache: ResponseCache = cache
+        """ ResponseCache (or None if responses are not cached) """
+        self.identity_store: IdentityStore = identity_store
+        """ IdentityStore (or None if identities are not persisted) """
+        self.rate_limiter: TokenBucket = rate_limiter
+        """ TokenBucket (or None if requests are not rate limited) """
+        self.retry: RetryPolicy = retry
+        """ RetryPolicy (or None if failed requests are not retried) """
+        self.tracked_players: TrackedPlayerIndex = tracked_players or TrackedPlayerIndex()
+        """ Index of the players tracked for event collection """
+        self.json_decoder: JSONDecoder = json_decoder
+        """ json decoder for the responses (None for the default one) """
+        self.stats: ClientStats = stats
+        """ ClientStats (or None if requests are not counted) """
+        self.hooks: List[Callable[[RequestInfo], None]] = list(hooks or [])
+        """ functions called with the RequestInfo of every request """
+
+    def add_hook(self, hook: Callable[[RequestInfo], None]):
+        """
+        Register a function called with the RequestInfo of every request once it finished
+
+        Note:
+            Hooks run in the thread that made the request, keep them fast and do not raise.
+            Without hooks and stats requests are not instrumented at all.
+        """
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook: Callable[[RequestInfo], None]):
+        """ Unregister a hook added with add_hook """
+        self.hooks.remove(hook)
 
-    def _make_request(self, additional_params: dict, new_base_url: str = None) -> list:
+    def _make_request(
+            self, additional_params: dict, new_base_url: str = None, endpoint: str = 'basic'
+    ) -> list:
         """ Send the request to the apex legends api """
-        if new_base_url:
-            url: str = new_base_url
-            params: dict = additional_params
-        else:
-            url: str = self.base_url
-            params: dict = dict(self.base_params, **additional_params)
-        response: requests.Response = self.session.get(url, params=params)
-        if response.status_code == 200:
-            try:
-                response_text = json.loads(response.text)
-            except ValueError:
-                response_text = response.text
-        else:
-            raise ALHTTPExceptionFromResponse(response)
+        url, params = self._request_url(additional_params, new_base_url)
+        if self.stats is None and not self.hooks:
+            return self._fetch(endpoint, url, params, None)
+        info: RequestInfo = RequestInfo(endpoint, url, params)
+        start: float = time.perf_counter()
+        try:
+            return self._fetch(endpoint, url, params, info)
+        except Exception as error:
+            info.error = error
+            raise
+        finally:
+            info.elapsed = time.perf_counter() - start
+            if self.stats is not None:
+                self.stats.record(info)
+            for hook in self.hooks:
+                hook(info)
+
+    def _fetch(self, endpoint: str, url: str, params: dict, info: RequestInfo) -> list:
+        """ answer the request from the cache, an identical request in flight or the api """
+        cacheable: bool = self.cache is not None and self.cache.is_cacheable(endpoint)
+        if cacheable:
+            hit, response_text = self.cache.get(url, params)
+            if info is not None:
+                info.cache_hit = hit
+            if hit:
+                return response_text
+
+        def send() -> list:
+            if info is not None:
+                info.coalesced = False
+            response: list = self._send_request(url, params, info)
+            if cacheable:
+                self.cache.set(endpoint, url, params, response)
+            return response
+        if self.single_flight is None:
+            return send()
+        if info is not None:
+            # reset by send() unless another caller's request is used
+            info.coalesced = True
+        return self.single_flight.do(ResponseCache.make_key(url, params), send)
 
-        # sometimes we get a pure dictionary back, let's wrap it in a list for consistency
-        if isinstance(response_text, dict):
-            response_text = [response_text]
-        return response_text
+    def _send_request(self, url: str, params: dict, info: RequestInfo = None) -> list:
+        """ Send the GET request and decode the response """
+        response: requests.Response = self._get(url, params, info=info)
+        if info is not None:
+            info.response_bytes = len(response.content)
+        return decode_response(response.content, lambda: response.text, self.json_decoder)
+
+    def _get(
+            self, url: str, params: dict, stream: bool = False, info: RequestInfo = None
+    ) -> requests.Response:
+        """ Send the GET request (rate limited / retried if configured) """
+        attempt: int = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            response: requests.Response = self.session.get(
+                url, params=params, stream=stream, timeout=self.timeout
+            )
+            if info is not None:
+                info.status_code = response.status_code
+                info.retries = attempt
+            if response.status_code == 200:
+                return response
+            if self.retry is None or not self.retry.should_retry(response.status_code, attempt):
+                raise ALHTTPExceptionFromResponse(response)
+            response.close()
+            delay: float = self.retry.backoff(
+                attempt, RetryPolicy.parse_retry_after(response.headers.get('Retry-After'))
+            )
+            if response.status_code == 429 and self.rate_limiter is not None:
+                # everyone sharing the bucket backs off, not just this thread
+                self.rate_limiter.pause(delay)
+            time.sleep(delay)
+            attempt += 1
 
     def nametouid(self, player: str, platform: ALPlatform) -> int:
         """
@@ -54,18 +256,35 @@ class ApexLegendsAPI:
         :type player: str
         :parameter platform: see [ALPlatform] for all types
         :type platform: ALPlatform
+        :raises ALPlayerNotFoundError: if the api has no uid for the player
         """
+        store_key: str = f'{platform.value}:{player}'
+        if self.identity_store is not None:
+            hit, uid = self.identity_store.get('nametouid', store_key)
+            if hit:
+                if uid is None:
+                    raise ALPlayerNotFoundError(player, platform)
+                return uid
 
-        new_base_url: str = "https://api.mozambiquehe.re/nametouid?"
-        additional_params = {
-            'player': player,
-            'platform': platform.value
-        }
-        result = self._make_request(additional_params=additional_params, new_base_url=new_base_url)
-        assert len(result) == 1
-        return result[0]['result']
+        try:
+            result = self._make_request(
+                additional_params=self._player_params(platform, player_name=player),
+                new_base_url=self.nametouid_url, endpoint='nametouid'
+            )
+        except ALHTTPExceptionFromResponse as exception:
+            if self.identity_store is not None and exception.status_code == 404:
+                self.identity_store.set('nametouid', store_key, None, negative=True)
+            raise
+        uid: int = self._nametouid_result(result)
+        if self.identity_store is not None:
+            self.identity_store.set('nametouid', store_key, uid, negative=uid is None)
+        if uid is None:
+            raise ALPlayerNotFoundError(player, platform)
+        return uid
 
-    def get_player(self, name: str, platform: ALPlatform, skip_tracker_rank=False) -> ALPlayer:
+    def get_player(
+            self, name: str, platform: ALPlatform, skip_tracker_rank=False, lazy: bool = False
+    ) -> ALPlayer:
         """
         Retrieve the ALPlayer object populated with data from the api.
 
@@ -76,29 +295,29 @@ class ApexLegendsAPI:
         :type name: str
         :parameter platform: see ALPlatform for all types
         :parameter skip_tracker_rank: if set to True, this will skip fetching the legend ranks
+        :parameter lazy: if True the player's legends and events are built on first access
         :return: a single player or None if no player is found
         """
-        basic_player_stats: list = self.basic_player_stats(name, platform, skip_tracker_rank)
-        assert len(basic_player_stats) == 1
-        event_info: list = self.events(
-            player_name=name,
-            platform=platform,
-            action=ALAction.INFO
+        basic_player_stats: dict = self._player_stats_result(
+            self.basic_player_stats(name, platform, skip_tracker_rank)
+        )
+        if basic_player_stats is None:
+            return None
+        if self.tracked_players.is_stale:
+            self.events(player_name=name, platform=platform, action=ALAction.INFO)
+        events: list = []
+        if self.tracked_players.is_tracked(platform, name=name):
+            events = self.events(
+                player_name=name,
+                platform=platform,
+                action=ALAction.GET
+            )
+        return ALPlayer(
+            basic_player_stats_data=basic_player_stats, events=events, lazy=lazy
         )
-        events: list = list()
-        tracked_player: dict
-        for tracked_player in event_info[0].get('data'):
-            if name == tracked_player.get('name') and \
-                    platform.value == tracked_player.get('platform'):
-                events = self.events(
-                    player_name=name,
-                    platform=platform,
-                    action=ALAction.GET
-                )
-        return ALPlayer(basic_player_stats_data=basic_player_stats[0], events=events)
 
     def get_player_by_uid(
-            self, uid: str, platform: ALPlatform, skip_tracker_rank=False
+            self, uid: str, platform: ALPlatform, skip_tracker_rank=False, lazy: bool = False
     ) -> ALPlayer:
         """
         Retrieve the ALPlayer object populated with data from the api.
@@ -109,26 +328,131 @@ class ApexLegendsAPI:
         :parameter uid: UID of the player
         :parameter platform: see ALPlatform for all types
         :parameter skip_tracker_rank: if set to True, this will skip fetching the legend ranks
+        :parameter lazy: if True the player's legends and events are built on first access
         :return: a single player or None if no player is found
         """
-        basic_player_stats: list = self.basic_player_stats_by_uid(uid, platform, skip_tracker_rank)
-        assert len(basic_player_stats) == 1
-        event_info: list = self.events_by_uid(
-            uid=uid,
-            platform=platform,
-            action=ALAction.INFO
+        basic_player_stats: dict = self._player_stats_result(
+            self.basic_player_stats_by_uid(uid, platform, skip_tracker_rank)
+        )
+        if basic_player_stats is None:
+            return None
+        if self.tracked_players.is_stale:
+            self.events_by_uid(uid=uid, platform=platform, action=ALAction.INFO)
+        events: list = []
+        if self.tracked_players.is_tracked(platform, uid=uid):
+            events = self.events_by_uid(
+                uid=uid,
+                platform=platform,
+                action=ALAction.GET
+            )
+        return ALPlayer(
+            basic_player_stats_data=basic_player_stats, events=events, lazy=lazy
+        )
+
+    def get_players(
+            self,
+            players: Iterable[Tuple[str, ALPlatform]],
+            skip_tracker_rank=False,
+            max_workers: int = 8,
+            as_completed: bool = False,
+            lazy: bool = False
+    ) -> Union[List[PlayerResult], Iterator[PlayerResult]]:
+        """
+        Retrieve many ALPlayer objects at once, fanning the lookups out over a thread pool.
+
+        NOTE:
+            * All workers share this client's session (and connection pool)
+            * A failed lookup does not stop the batch, it is reported on its PlayerResult
+
+        :parameter players: iterable of (name, platform) tuples
+        :parameter skip_tracker_rank: if set to True, this will skip fetching the legend ranks
+        :parameter max_workers: number of lookups in flight at the same time (keep it at most
+            ``pool_maxsize`` for every lookup to reuse a pooled connection)
+        :parameter as_completed: if True return an iterator yielding results as they finish
+        :parameter lazy: if True the players' legends and events are built on first access
+        :return: list of PlayerResult in input order (or an iterator, see as_completed)
+        """
+        return self._get_players(
+            partial(self.get_player, lazy=lazy), players, skip_tracker_rank, max_workers,
+            as_completed
+        )
+
+    def get_players_by_uid(
+            self,
+            players: Iterable[Tuple[str, ALPlatform]],
+            skip_tracker_rank=False,
+            max_workers: int = 8,
+            as_completed: bool = False,
+            lazy: bool = False
+    ) -> Union[List[PlayerResult], Iterator[PlayerResult]]:
+        """
+        Retrieve many ALPlayer objects by UID at once, fanning the lookups out over a thread pool.
+
+        NOTE:
+            * All workers share this client's session (and connection pool)
+            * A failed lookup does not stop the batch, it is reported on its PlayerResult
+
+        :parameter players: iterable of (uid, platform) tuples
+        :parameter skip_tracker_rank: if set to True, this will skip fetching the legend ranks
+        :parameter max_workers: number of lookups in flight at the same time (keep it at most
+            ``pool_maxsize`` for every lookup to reuse a pooled connection)
+        :parameter as_completed: if True return an iterator yielding results as they finish
+        :parameter lazy: if True the players' legends and events are built on first access
+        :return: list of PlayerResult in input order (or an iterator, see as_completed)
+        """
+        return self._get_players(
+            partial(self.get_player_by_uid, lazy=lazy), players, skip_tracker_rank, max_workers,
+            as_completed
         )
-        events: list = list()
-        tracked_player: dict
-        for tracked_player in event_info[0].get('data'):
-            if uid == tracked_player.get('uid') and \
-                    platform.value == tracked_player.get('platform'):
-                events = self.events_by_uid(
-                    uid=uid,
-                    platform=platform,
-                    action=ALAction.GET
-                )
-        return ALPlayer(basic_player_stats_data=basic_player_stats[0], events=events)
+
+    def _get_players(
+            self, fetch: Callable, players: Iterable, skip_tracker_rank: bool,
+            max_workers: int, as_completed: bool
+    ) -> Union[List[PlayerResult], Iterator[PlayerResult]]:
+        """ shared implementation of get_players / get_players_by_uid """
+        queries: list = list(players)
+        results: Iterator[PlayerResult] = self._iter_players(
+            fetch, queries, skip_tracker_rank, max_workers
+        )
+        if as_completed:
+            return results
+        ordered_results: List[PlayerResult] = [None] * len(queries)
+        for result in results:
+            ordered_results[result.index] = result
+        return ordered_results
+
+    @staticmethod
+    def _iter_players(
+            fetch: Callable, queries: list, skip_tracker_rank: bool, max_workers: int
+    ) -> Iterator[PlayerResult]:
+        """ yield PlayerResults as the lookups complete """
+        def fetch_one(index: int, query: tuple) -> PlayerResult:
+            key, platform = query
+            try:
+                player: ALPlayer = fetch(key, platform, skip_tracker_rank)
+            except (
+                    ALHTTPExceptionFromResponse, ALUnexpectedResponseError,
+                    requests.RequestException
+            ) as exception:
+                return PlayerResult(index, query, error=exception)
+            if player is None:
+                return PlayerResult(index, query, error=ALPlayerNotFoundError(key, platform))
+            return PlayerResult(index, query, player=player)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(fetch_one, index, query) for index, query in enumerate(queries)
+            ]
+            for future in futures_as_completed(futures):
+                yield future.result()
+
+    def _mount_adapters(self):
+        """ mount http / https adapters with the configured pool sizes """
+        for prefix in ('https://', 'http://'):
+            self.session.mount(prefix, HTTPAdapter(
+                pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize,
+                pool_block=self.pool_block
+            ))
 
     def add_player_by_uid(self, player_uid: int, platform: ALPlatform) -> list:
         """
@@ -155,10 +479,9 @@ class ApexLegendsAPI:
         :param skip_tracker_rank: if set to true, this will not fetch the legend's tracker rank
         :return: List of player stats created from response json
         """
-        params: dict = {'platform': platform.value, 'player': player_name}
-        if skip_tracker_rank:
-            params.update({'skipRank': True})
-        return self._make_request(additional_params=params)
+        return self._make_request(additional_params=self._stats_params(
+            platform, player_name=player_name, skip_tracker_rank=skip_tracker_rank
+        ))
 
     def basic_player_stats_by_uid(
             self, uid: str,
@@ -174,10 +497,9 @@ class ApexLegendsAPI:
         :param skip_tracker_rank: if set to true, this will not fetch the legend's tracker rank
         :return: List of player stats created from response json
         """
-        params: dict = {'platform': platform.value, 'uid': uid}
-        if skip_tracker_rank:
-            params.update({'skipRank': True})
-        return self._make_request(additional_params=params)
+        return self._make_request(additional_params=self._stats_params(
+            platform, uid=uid, skip_tracker_rank=skip_tracker_rank
+        ))
 
     @deprecated(reason="use `events` instead")
     def match_history(self, player_name: str, platform: ALPlatform, action: ALAction) -> list:
@@ -202,13 +524,9 @@ class ApexLegendsAPI:
         :param action: see Action enum for values
         :return: List of history created from response json
         """
-        params: dict = {
-            'platform': platform.value,
-            'player': player_name,
-            'history': 1,
-            'action': action.value
-        }
-        return self._make_request(additional_params=params)
+        return self._events_request(
+            params=self._events_params(platform, action, player_name=player_name), action=action
+        )
 
     def events_by_uid(self, uid: str, platform: ALPlatform, action: ALAction) -> list:
         """
@@ -225,13 +543,102 @@ class ApexLegendsAPI:
         :param action: see Action enum for values
         :return: List of history created from response json
         """
-        params: dict = {
-            'platform': platform.value,
-            'uid': uid,
-            'history': 1,
-            'action': action.value
-        }
-        return self._make_request(additional_params=params)
+        return self._events_request(
+            params=self._events_params(platform, action, uid=uid), action=action
+        )
+
+    def iter_events(
+            self,
+            player_name: str,
+            platform: ALPlatform,
+            event_types: Iterable[ALEventType] = None,
+            start: int = None,
+            end: int = None
+    ) -> Iterator[Event]:
+        """
+        Stream the tracked events (ALAction.GET) of a player, yielding Event objects one at a time
+
+        NOTE:
+            The response body is read and parsed incrementally, so memory use stays flat no
+            matter how long the event history is. Responses are never cached.
+
+        :param player_name: Player Name for match history
+        :param platform: see Platform enum for values
+        :param event_types: only yield events of these types (see ALEventType)
+        :param start: only yield events with a timestamp >= start
+        :param end: only yield events with a timestamp < end
+        :return: generator of Event objects
+        """
+        return iter_events(
+            self.iter_event_dicts(platform, player_name=player_name),
+            event_types=event_types, start=start, end=end
+        )
+
+    def iter_events_by_uid(
+            self,
+            uid: str,
+            platform: ALPlatform,
+            event_types: Iterable[ALEventType] = None,
+            start: int = None,
+            end: int = None
+    ) -> Iterator[Event]:
+        """
+        Stream the tracked events (ALAction.GET) of a player by UID, yielding Event objects one at
+        a time
+
+        NOTE:
+            The response body is read and parsed incrementally, so memory use stays flat no
+            matter how long the event history is. Responses are never cached.
+
+        :param uid: Player UID for match history
+        :param platform: see Platform enum for values
+        :param event_types: only yield events of these types (see ALEventType)
+        :param start: only yield events with a timestamp >= start
+        :param end: only yield events with a timestamp < end
+        :return: generator of Event objects
+        """
+        return iter_events(
+            self.iter_event_dicts(platform, uid=uid),
+            event_types=event_types, start=start, end=end
+        )
+
+    def iter_event_dicts(
+            self, platform: ALPlatform, uid: str = None, player_name: str = None
+    ) -> Iterator[dict]:
+        """
+        Stream the raw tracked events (ALAction.GET) of a player by UID or by name, yielding the
+        event dictionaries one at a time as they are read from the response
+
+        :param platform: see Platform enum for values
+        :param uid: Player UID (takes precedence over the name)
+        :param player_name: Player Name
+        :return: generator of event dictionaries
+        """
+        return self._iter_json_request(
+            self._events_params(platform, ALAction.GET, uid=uid, player_name=player_name)
+        )
+
+    def _iter_json_request(self, params: dict) -> Iterator:
+        """ stream the elements of a json array response """
+        response: requests.Response = self._get(*self._request_url(params), stream=True)
+        with response:
+            yield from iter_json_array(response.iter_content(chunk_size=self.stream_chunk_size))
+
+    def _events_request(self, params: dict, action: ALAction) -> list:
+        """ send an events request, keeping the tracked player index / cache up to date """
+        result: list = self._make_request(
+            additional_params=params, endpoint=f'events_{action.value}'
+        )
+        platform: ALPlatform = ALPlatform(params['platform'])
+        if action == ALAction.INFO and result and isinstance(result[0], dict):
+            self.tracked_players.update(result[0].get('data'))
+        elif action == ALAction.ADD:
+            self.tracked_players.add(platform, uid=params.get('uid'), name=params.get('player'))
+        elif action == ALAction.DELETE:
+            self.tracked_players.remove(platform, uid=params.get('uid'), name=params.get('player'))
+        if self.cache is not None and action in (ALAction.ADD, ALAction.DELETE):
+            self.cache.invalidate_endpoint(f'events_{ALAction.INFO.value}')
+        return result
 
     def get_player_origin(self, player_name: str, show_all_hits: bool = False) -> list:
         """
@@ -242,8 +649,19 @@ class ApexLegendsAPI:
         :param show_all_hits: True to 'search' for player (show multiple hits), default False
         :return: list of results
         """
-        new_base_url: str = "https://api.mozambiquehe.re/origin?"
-        new_base_url += f"&player={player_name}"
-        if show_all_hits:
-            new_base_url += "&showAllHits"
-        return self._make_request(additional_params={}, new_base_url=new_base_url)
+        store_key: str = f'{player_name}:{int(show_all_hits)}'
+        if self.identity_store is not None:
+            hit, result = self.identity_store.get('origin', store_key)
+            if hit:
+                return result
+
+        result: list = self._make_request(
+            additional_params={}, new_base_url=self._origin_request_url(player_name, show_all_hits),
+            endpoint='origin'
+        )
+        if self.identity_store is not None:
+            failed: bool = not isinstance(result, list) or any(
+                'Error' in entry for entry in result if isinstance(entry, dict)
+            )
+            self.identity_store.set('origin', store_key, result, negative=failed)
+        return result
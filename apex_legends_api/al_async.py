@@ -0,0 +1,304 @@
+"""
+Apex Legends API (asyncio)
+
+| The AsyncApexLegendsAPI mirrors ApexLegendsAPI with coroutines on a pooled ``aiohttp`` client
+| Install the optional dependency with: ``pip install apex-legends-api[async]``
+"""
+import asyncio
+import aiohttp
+from .al_domain import ALPlayer  # noqa E0402
+from .al_base import ALPlatform, ALAction, ALHTTPExceptionFromResponse  # noqa E0402
+from .al_base import ALPlayerNotFoundError  # noqa E0402
+from .al_cache import ResponseCache  # noqa E0402
+from .al_client import ALClientBase  # noqa E0402
+from .al_json import JSONDecoder, decode_response  # noqa E0402
+from .al_singleflight import AsyncSingleFlight  # noqa E0402
+
+
+class AsyncApexLegendsAPI(ALClientBase):
+    """
+    Asyncio version of ApexLegendsAPI
+
+    Discussion:
+        All requests share one ``aiohttp.ClientSession`` (and its connection pool), and at most
+        ``max_concurrency`` requests are in flight at the same time, so thousands of lookups can
+        be awaited together with ``asyncio.gather`` inside a single event loop.
+
+    Example::
+
+        async with AsyncApexLegendsAPI(api_key='<api_key>') as api:
+            players = await asyncio.gather(
+                *[api.get_player(name, ALPlatform.PC) for name in names]
+            )
+    """
+    # pylint: disable=too-many-instance-attributes
+    # pylint: disable=too-many-arguments
+    def __init__(
+            self, api_key: str, max_concurrency: int = 100, json_decoder: JSONDecoder = None,
+            coalesce: bool = True, base_url: str = None, nametouid_url: str = None,
+            origin_url: str = None
+    ):
+        """
+        Initialize with the API Key
+
+        :param api_key: your API Key
+        :param max_concurrency: maximum number of requests in flight at the same time
+        :param json_decoder: function decoding the response bytes (ex: ``orjson.loads``),
+            defaults to the fastest installed json library
+        :param coalesce: if True identical requests in flight at the same time share one
+            upstream request
+        :param base_url: url of the ``/bridge`` endpoint (ex: a local MockAPIServer)
+        :param nametouid_url: url of the ``/nametouid`` endpoint
+        :param origin_url: url of the ``/origin`` endpoint
+        """
+        super().__init__(base_url=base_url, nametouid_url=nametouid_url, origin_url=origin_url)
+        self.api_key: str = api_key
+        self.max_concurrency: int = max_concurrency
+        self.json_decoder: JSONDecoder = json_decoder
+        self.single_flight: AsyncSingleFlight = AsyncSingleFlight() if coalesce else None
+        self._session: aiohttp.ClientSession = None
+        self._semaphore: asyncio.Semaphore = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        """ Close the underlying http session (and its pooled connections) """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """ lazily create the session, it has to be created inside a running event loop """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_concurrency)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={'Authorization': self.api_key}
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    async def _make_request(self, additional_params: dict, new_base_url: str = None) -> list:
+        """ Send the request to the apex legends api """
+        url, params = self._request_url(additional_params, new_base_url)
+        # aiohttp refuses bool query values, send them the same way requests does
+        params = {key: str(value) if isinstance(value, bool) else value
+                  for key, value in params.items()}
+        if self.single_flight is None:
+            return await self._send_request(url, params)
+        return await self.single_flight.do(
+            ResponseCache.make_key(url, params), lambda: self._send_request(url, params)
+        )
+
+    async def _send_request(self, url: str, params: dict) -> list:
+        """ Send the GET request and decode the response """
+        session: aiohttp.ClientSession = self._get_session()
+        async with self._semaphore:
+            async with session.get(url, params=params) as response:
+                content: bytes = await response.read()
+                if response.status != 200:
+                    raise ALHTTPExceptionFromResponse(
+                        response, status_code=response.status,
+                        text=content.decode(response.get_encoding(), errors='replace')
+                    )
+        return decode_response(
+            content,
+            lambda: content.decode(response.get_encoding(), errors='replace'),
+            self.json_decoder
+        )
+
+    async def nametouid(self, player: str, platform: ALPlatform) -> int:
+        """
+        Retrieve a player's uid given they're name and platform
+
+        :parameter player: Name of the player
+        :type player: str
+        :parameter platform: see [ALPlatform] for all types
+        :type platform: ALPlatform
+        :raises ALPlayerNotFoundError: if the api has no uid for the player
+        """
+        result = await self._make_request(
+            additional_params=self._player_params(platform, player_name=player),
+            new_base_url=self.nametouid_url
+        )
+        uid: int = self._nametouid_result(result)
+        if uid is None:
+            raise ALPlayerNotFoundError(player, platform)
+        return uid
+
+    async def get_player(
+            self, name: str, platform: ALPlatform, skip_tracker_rank=False, lazy: bool = False
+    ) -> ALPlayer:
+        """
+        Retrieve the ALPlayer object populated with data from the api.
+
+        NOTE:
+            The basic stats and the tracked player list are requested concurrently, method will
+            return None if the player cannot be found
+
+        :parameter name: Name of the player
+        :type name: str
+        :parameter platform: see ALPlatform for all types
+        :parameter skip_tracker_rank: if set to True, this will skip fetching the legend ranks
+        :parameter lazy: if True the player's legends and events are built on first access
+        :return: a single player or None if no player is found
+        """
+        basic_player_stats, event_info = await asyncio.gather(
+            self.basic_player_stats(name, platform, skip_tracker_rank),
+            self.events(player_name=name, platform=platform, action=ALAction.INFO)
+        )
+        player_stats: dict = self._player_stats_result(basic_player_stats)
+        if player_stats is None:
+            return None
+        events: list = []
+        tracked_player: dict
+        for tracked_player in event_info[0].get('data'):
+            if name == tracked_player.get('name') and \
+                    platform.value == tracked_player.get('platform'):
+                events = await self.events(
+                    player_name=name,
+                    platform=platform,
+                    action=ALAction.GET
+                )
+        return ALPlayer(
+            basic_player_stats_data=player_stats, events=events, lazy=lazy
+        )
+
+    async def get_player_by_uid(
+            self, uid: str, platform: ALPlatform, skip_tracker_rank=False, lazy: bool = False
+    ) -> ALPlayer:
+        """
+        Retrieve the ALPlayer object populated with data from the api.
+
+        NOTE:
+            The basic stats and the tracked player list are requested concurrently, method will
+            return None if the player cannot be found
+
+        :parameter uid: UID of the player
+        :parameter platform: see ALPlatform for all types
+        :parameter skip_tracker_rank: if set to True, this will skip fetching the legend ranks
+        :parameter lazy: if True the player's legends and events are built on first access
+        :return: a single player or None if no player is found
+        """
+        basic_player_stats, event_info = await asyncio.gather(
+            self.basic_player_stats_by_uid(uid, platform, skip_tracker_rank),
+            self.events_by_uid(uid=uid, platform=platform, action=ALAction.INFO)
+        )
+        player_stats: dict = self._player_stats_result(basic_player_stats)
+        if player_stats is None:
+            return None
+        events: list = []
+        tracked_player: dict
+        for tracked_player in event_info[0].get('data'):
+            if uid == tracked_player.get('uid') and \
+                    platform.value == tracked_player.get('platform'):
+                events = await self.events_by_uid(
+                    uid=uid,
+                    platform=platform,
+                    action=ALAction.GET
+                )
+        return ALPlayer(
+            basic_player_stats_data=player_stats, events=events, lazy=lazy
+        )
+
+    async def add_player_by_uid(self, player_uid: int, platform: ALPlatform) -> list:
+        """
+        Adds the given player's UUID to the list of tracked players
+
+        :param player_uid: UUID of the player to add
+        :type player_uid: int
+        :param platform: ALPlatform of player to add
+        :type platform: ALPlatform
+        """
+        return await self.events_by_uid(str(player_uid), platform=platform, action=ALAction.ADD)
+
+    async def basic_player_stats(
+            self, player_name: str,
+            platform: ALPlatform,
+            skip_tracker_rank=False) -> list:
+        """
+        Query the server for the given player / platform and returns a dictionary of their
+        stats.
+        More here: https://apexlegendsapi.com/#basic
+
+        :param player_name: Player Name to search for
+        :param platform: (see Platform enum for values)
+        :param skip_tracker_rank: if set to true, this will not fetch the legend's tracker rank
+        :return: List of player stats created from response json
+        """
+        return await self._make_request(additional_params=self._stats_params(
+            platform, player_name=player_name, skip_tracker_rank=skip_tracker_rank
+        ))
+
+    async def basic_player_stats_by_uid(
+            self, uid: str,
+            platform: ALPlatform,
+            skip_tracker_rank=False) -> list:
+        """
+        Query the server for the given player / platform and returns a dictionary of their
+        stats.
+        More here: https://apexlegendsapi.com/#basic
+
+        :param uid: Player UID to search for
+        :param platform: (see Platform enum for values)
+        :param skip_tracker_rank: if set to true, this will not fetch the legend's tracker rank
+        :return: List of player stats created from response json
+        """
+        return await self._make_request(additional_params=self._stats_params(
+            platform, uid=uid, skip_tracker_rank=skip_tracker_rank
+        ))
+
+    async def events(self, player_name: str, platform: ALPlatform, action: ALAction) -> list:
+        """
+        Query the server for the given player / platform and return a list of their
+        events
+
+        NOTE:
+          * Match history is only available for supporters
+          * Match history must be tracked by the server otherwise this will return nothing
+          * In order to add a player to be tracked, you need to call this passing 'add' action.
+
+        :param player_name: Player Name for match history
+        :param platform: see Platform enum for values
+        :param action: see Action enum for values
+        :return: List of history created from response json
+        """
+        return await self._make_request(
+            additional_params=self._events_params(platform, action, player_name=player_name)
+        )
+
+    async def events_by_uid(self, uid: str, platform: ALPlatform, action: ALAction) -> list:
+        """
+        Query the server for the given player's UID / platform and return a list of their
+        events
+
+        NOTE:
+          * Match history is only available for supporters
+          * Match history must be tracked by the server otherwise this will return nothing
+          * In order to add a player to be tracked, you need to call this passing 'add' action.
+
+        :param uid: Player UID for match history
+        :param platform: see Platform enum for values
+        :param action: see Action enum for values
+        :return: List of history created from response json
+        """
+        return await self._make_request(
+            additional_params=self._events_params(platform, action, uid=uid)
+        )
+
+    async def get_player_origin(self, player_name: str, show_all_hits: bool = False) -> list:
+        """
+        Query the server for the origin user and returns Origin UID, real username, PID and avatar
+         for a given username
+
+        :param player_name: Player Name for match history
+        :param show_all_hits: True to 'search' for player (show multiple hits), default False
+        :return: list of results
+        """
+        return await self._make_request(
+            additional_params={}, new_base_url=self._origin_request_url(player_name, show_all_hits)
+        )
@@ -3,20 +3,40 @@ al_base.py
 contains some of the base / utility classes and Enums
 """
 from enum import Enum
-import requests
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # requests is only loaded by the client (see al_api)
+    import requests
+
+
+def instance_attributes(___class) -> dict:
+    """ returns the attributes of an object, supporting both __dict__ and __slots__ classes """
+    attributes: dict = {}
+    for klass in reversed(type(___class).__mro__):
+        for name in klass.__dict__.get('__slots__', ()):
+            if hasattr(___class, name):
+                attributes[name] = getattr(___class, name)
+    attributes.update(getattr(___class, '__dict__', {}))
+    return attributes
 
 
 def print_description(___class, indent=0, hide_values=False):
     """ prints the schema for the current object """
     print(' ' * indent + type(___class).__name__ + ':')
     indent += 4
-    for k, value in ___class.__dict__.items():
+    for k, value in instance_attributes(___class).items():
+        if k.startswith('_'):
+            # private attributes are only shown through the property that exposes them
+            public_name: str = k.lstrip('_')
+            if not isinstance(getattr(type(___class), public_name, None), property):
+                continue
+            k, value = public_name, getattr(___class, public_name)
         if not isinstance(value, list):
             v_list = [value]
         else:
             v_list = value
         for val in v_list:
-            if '__dict__' in dir(val):
+            if '__dict__' in dir(val) or '__slots__' in dir(val):
                 print_description(val, indent)
             else:
                 if hide_values:
@@ -77,7 +97,42 @@ class ALEventType(Enum):
 
 
 class ALHTTPExceptionFromResponse(Exception):
-    """ Exception raised for errors in the http request. """
-    def __init__(self, response: requests.Response):
-        self.message = f'Return Code: {response.status_code} - {response.text}'
+    """
+    Exception raised for errors in the http request.
+
+    Note:
+        ``status_code`` and ``text`` only need to be passed in when the response is not a
+        ``requests.Response`` (for example an ``aiohttp`` response, whose body is read
+        asynchronously)
+    """
+    def __init__(self, response: 'requests.Response', status_code: int = None, text: str = None):
+        self.response = response
+        """ The response that caused the exception """
+        self.status_code: int = response.status_code if status_code is None else status_code
+        """ HTTP status code of the response """
+        if text is None:
+            text = response.text
+        self.message = f'Return Code: {self.status_code} - {text}'
+        super().__init__(self.message)
+
+
+class ALPlayerNotFoundError(Exception):
+    """ Exception raised when the api cannot find the requested player. """
+    def __init__(self, player: str, platform: ALPlatform):
+        self.player: str = player
+        """ Name or UID of the player that was not found """
+        self.platform: ALPlatform = platform
+        """ Platform that was searched """
+        self.message = f'Player not found: {player} ({platform.value})'
+        super().__init__(self.message)
+
+
+class ALUnexpectedResponseError(ValueError):
+    """ Exception raised when a response does not have the expected shape. """
+    def __init__(self, endpoint: str, response):
+        self.endpoint: str = endpoint
+        """ Name of the endpoint that returned the response """
+        self.response = response
+        """ The decoded response """
+        self.message = f'Unexpected {endpoint} response: {response!r:.200}'
         super().__init__(self.message)
@@ -0,0 +1,158 @@
+"""
+al_cache.py
+in-memory response cache (TTL per endpoint + LRU size cap) used by ApexLegendsAPI
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Tuple
+from urllib.parse import parse_qsl
+
+
+# pylint: disable=too-few-public-methods
+class CacheStats:
+    """ counters for the response cache """
+    def __init__(self):
+        self.hits: int = 0
+        """ Number of requests answered from the cache """
+        self.misses: int = 0
+        """ Number of requests that were not in the cache (or had expired) """
+        self.evictions: int = 0
+        """ Number of entries dropped because the cache was full """
+        self.expirations: int = 0
+        """ Number of entries dropped because their TTL was up """
+        self.invalidations: int = 0
+        """ Number of entries dropped by an explicit invalidate call """
+
+
+class ResponseCache:
+    """
+    Thread safe in-memory cache of decoded api responses
+
+    Discussion:
+        Entries are keyed on the normalized (url, params) of the request and every endpoint
+        has its own time to live (in seconds). Endpoints without a TTL are never cached (this is
+        always the case for the 'add' and 'delete' event actions). When ``max_size`` is reached
+        the least recently used entry is evicted.
+
+    Note:
+        Cached responses are shared between callers, treat them as read-only
+
+    Endpoints:
+        - basic: basic_player_stats / basic_player_stats_by_uid (includes the realtime info)
+        - events_info / events_get: events / events_by_uid with ALAction.INFO / ALAction.GET
+        - nametouid: nametouid
+        - origin: get_player_origin
+    """
+    default_ttls: dict = {
+        'basic': 5,
+        'events_info': 60,
+        'events_get': 60,
+        'nametouid': 6 * 60 * 60,
+        'origin': 6 * 60 * 60,
+    }
+
+    def __init__(self, max_size: int = 1024, ttls: dict = None):
+        """
+        :param max_size: maximum number of responses kept in the cache
+        :param ttls: TTL in seconds per endpoint, merged over ``default_ttls``
+            (use None or 0 to disable caching of an endpoint)
+        """
+        self.max_size: int = max_size
+        self.ttls: dict = dict(self.default_ttls, **(ttls or {}))
+        self.stats: CacheStats = CacheStats()
+        """ hit / miss / eviction counters """
+        self._entries: OrderedDict = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(url: str, params: dict) -> tuple:
+        """
+        normalize the request into a hashable cache key, a query in the url (ex: the player of an
+        origin request) is merged with the params
+        """
+        url, _separator, query = url.partition('?')
+        items: list = parse_qsl(query, keep_blank_values=True)
+        items.extend((key, str(value)) for key, value in params.items())
+        return url, tuple(sorted(items))
+
+    def is_cacheable(self, endpoint: str) -> bool:
+        """ True if responses for the given endpoint are cached """
+        return bool(self.ttls.get(endpoint))
+
+    def get(self, url: str, params: dict) -> Tuple[bool, Any]:
+        """
+        Look up a response
+
+        :return: (True, response) on a hit, (False, None) on a miss
+        """
+        key: tuple = self.make_key(url, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return False, None
+            expires_at, _endpoint, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return True, value
+
+    def set(self, endpoint: str, url: str, params: dict, value: Any):
+        """ store a response (ignored if the endpoint is not cacheable) """
+        ttl: float = self.ttls.get(endpoint)
+        if not ttl:
+            return
+        key: tuple = self.make_key(url, params)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, endpoint, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def invalidate_player(self, player: str = None, uid: str = None) -> int:
+        """
+        Drop every cached response for the given player name and / or uid
+
+        :return: number of entries removed
+        """
+        targets: set = set()
+        if player is not None:
+            targets.add(('player', str(player)))
+        if uid is not None:
+            targets.add(('uid', str(uid)))
+        return self._invalidate(lambda endpoint, params: not targets.isdisjoint(params))
+
+    def invalidate_endpoint(self, endpoint: str) -> int:
+        """
+        Drop every cached response for the given endpoint
+
+        :return: number of entries removed
+        """
+        return self._invalidate(lambda entry_endpoint, params: entry_endpoint == endpoint)
+
+    def clear(self):
+        """ Drop every cached response """
+        with self._lock:
+            self.stats.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def _invalidate(self, predicate) -> int:
+        """ drop every entry for which predicate(endpoint, params) is True """
+        with self._lock:
+            keys: list = [
+                key for key, (_expires_at, endpoint, _value) in self._entries.items()
+                if predicate(endpoint, key[1])
+            ]
+            for key in keys:
+                del self._entries[key]
+            self.stats.invalidations += len(keys)
+        return len(keys)
@@ -0,0 +1,105 @@
+"""
+al_client.py
+endpoints, request parameters and response checks shared by the ApexLegendsAPI (requests) and
+AsyncApexLegendsAPI (aiohttp) clients
+"""
+from typing import Tuple
+from urllib.parse import urlencode
+from .al_base import ALPlatform, ALAction, ALUnexpectedResponseError  # noqa E0402
+
+
+# pylint: disable=too-few-public-methods
+class ALClientBase:
+    """
+    Base class of the api clients
+
+    Discussion:
+        Builds the urls and query parameters of every endpoint and checks the responses, sending
+        the requests is left to the subclasses, so the sync and asyncio clients always call the
+        api the same way.
+    """
+    api_version: str = "5"
+    base_params: dict = {'version': api_version}
+    base_url: str = "https://api.mozambiquehe.re/bridge"
+    nametouid_url: str = "https://api.mozambiquehe.re/nametouid"
+    origin_url: str = "https://api.mozambiquehe.re/origin"
+
+    def __init__(self, base_url: str = None, nametouid_url: str = None, origin_url: str = None):
+        """
+        :param base_url: url of the ``/bridge`` endpoint (ex: a local MockAPIServer)
+        :param nametouid_url: url of the ``/nametouid`` endpoint
+        :param origin_url: url of the ``/origin`` endpoint
+        """
+        if base_url is not None:
+            self.base_url = base_url
+        if nametouid_url is not None:
+            self.nametouid_url = nametouid_url
+        if origin_url is not None:
+            self.origin_url = origin_url
+
+    def _request_url(self, additional_params: dict, new_base_url: str = None) -> Tuple[str, dict]:
+        """ url and query parameters of a request, base_params are only sent to ``/bridge`` """
+        if new_base_url:
+            return new_base_url, additional_params
+        return self.base_url, dict(self.base_params, **additional_params)
+
+    @staticmethod
+    def _player_params(platform: ALPlatform, uid: str = None, player_name: str = None) -> dict:
+        """ query parameters selecting a player by UID (if given) or by name """
+        params: dict = {'platform': platform.value}
+        if uid is not None:
+            params['uid'] = uid
+        else:
+            params['player'] = player_name
+        return params
+
+    @classmethod
+    def _stats_params(
+            cls, platform: ALPlatform, uid: str = None, player_name: str = None,
+            skip_tracker_rank: bool = False
+    ) -> dict:
+        """ query parameters of a basic player stats request """
+        params: dict = cls._player_params(platform, uid=uid, player_name=player_name)
+        if skip_tracker_rank:
+            params.update({'skipRank': True})
+        return params
+
+    @classmethod
+    def _events_params(
+            cls, platform: ALPlatform, action: ALAction, uid: str = None, player_name: str = None
+    ) -> dict:
+        """ query parameters of an events (match history) request """
+        params: dict = cls._player_params(platform, uid=uid, player_name=player_name)
+        params.update({'history': 1, 'action': action.value})
+        return params
+
+    def _origin_request_url(self, player_name: str, show_all_hits: bool) -> str:
+        """ url (query included) of an origin request """
+        url: str = self.origin_url + "?" + urlencode({'player': player_name})
+        if show_all_hits:
+            url += "&showAllHits"
+        return url
+
+    @staticmethod
+    def _nametouid_result(result: list) -> int:
+        """
+        the uid in a nametouid response (None if the api has no uid for the player)
+
+        :raises ALUnexpectedResponseError: if the response is not a list of one result
+        """
+        if not isinstance(result, list) or len(result) != 1:
+            raise ALUnexpectedResponseError('nametouid', result)
+        return result[0].get('result') if isinstance(result[0], dict) else None
+
+    @staticmethod
+    def _player_stats_result(basic_player_stats: list) -> dict:
+        """
+        the stats in a basic player stats response (None if the player was not found)
+
+        :raises ALUnexpectedResponseError: if the response is not a list of one player
+        """
+        if not isinstance(basic_player_stats, list) or len(basic_player_stats) != 1:
+            raise ALUnexpectedResponseError('player stats', basic_player_stats)
+        if 'Error' in basic_player_stats[0]:
+            return None
+        return basic_player_stats[0]
@@ -1,9 +1,13 @@
 """
 Player class for the Apex Legends API Python package
 """
-from typing import List
-import arrow
+import itertools
+import time
+from array import array
+from bisect import bisect_right
+from typing import Dict, Iterator, List
 from .al_base import ALEventType, ALPlatform  # noqa E0402
+from .al_tracker_keys import TrackerKey, tracker_keys  # noqa E0402
 
 
 # pylint: disable=too-few-public-methods
@@ -18,7 +22,14 @@ class GameInfo:
         - intro=Run fast, hit fast, win fast
     """
     class Badge:
-        """ data structure for badges """
+        """
+        data structure for badges
+
+        Note:
+            ``category`` is only set when the api provides it
+        """
+        __slots__ = ('name', 'value', 'category')
+
         def __init__(self, badge_dict: dict):
             self.name: str = badge_dict.get('name')
             """ Name of the badge """
@@ -54,6 +65,8 @@ class GameInfo:
 
 class Event:
     """ Parent class for apex-legend events """
+    __slots__ = ('uid', 'player', 'timestamp', 'event_type')
+
     def __init__(self, event_dict: dict):
         self.uid: int = event_dict.get('uid')
         """ Origin / EA UUID of the player """
@@ -67,6 +80,9 @@ class Event:
 
 class GameEvent(Event):
     """ Event sub class for 'game' events """
+    __slots__ = ('xp_progress', 'game_length', 'legend_played', 'rank_score_change',
+                 'game_data_trackers')
+
     def __init__(self, event_dict: dict):
         super().__init__(event_dict)
         self.xp_progress: int = event_dict.get('xpProgress')
@@ -86,6 +102,8 @@ class GameEvent(Event):
 
 class SessionEvent(Event):
     """ event subclass for "session" events (leave / join) """
+    __slots__ = ('action', 'session_duration')
+
     def __init__(self, event_dict: dict):
         super().__init__(event_dict)
         event_detail: dict = event_dict.get('event')
@@ -99,6 +117,8 @@ class SessionEvent(Event):
 
 class LevelEvent(Event):
     """ event subclass for 'level' events (level up) """
+    __slots__ = ('new_level',)
+
     def __init__(self, event_dict: dict):
         super().__init__(event_dict)
         self.new_level = event_dict.get('event').get('newLevel')
@@ -107,6 +127,8 @@ class LevelEvent(Event):
 
 class RankEvent(Event):
     """ event subclass for 'rank' events (ranked progression)"""
+    __slots__ = ('new_rank',)
+
     def __init__(self, event_dict: dict):
         super().__init__(event_dict)
         self.new_rank: str = event_dict.get('event').get('newRank')
@@ -124,6 +146,53 @@ def event_factory(event_dict: dict) -> Event:
     return event_classes[event_dict.get('eventType')](event_dict)
 
 
+def event_timestamp(event: Event) -> int:
+    """ sort key of the events (events without a timestamp sort as the oldest) """
+    return event.timestamp or 0
+
+
+class EventTimeline:
+    """
+    Events sorted newest first (like the api) with binary search time range queries
+
+    Note:
+        the timestamps are kept negated so that they are ascending for ``bisect``, every query is
+        O(log n) plus the number of events returned
+    """
+    __slots__ = ('events', '_keys')
+
+    def __init__(self, events: List[Event]):
+        """
+        :param events: events sorted newest first
+        """
+        self.events: List[Event] = events
+        """ the events, newest first """
+        self._keys: array = array('q', [-event_timestamp(event) for event in events])
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def _index(self, timestamp: int) -> int:
+        """ index of the first event with ``event.timestamp <= timestamp`` """
+        return bisect_right(self._keys, -timestamp - 1)
+
+    def between(self, start: int = None, end: int = None) -> List[Event]:
+        """ the events with ``start <= timestamp < end``, newest first (None for no bound) """
+        first: int = 0 if end is None else self._index(end - 1)
+        last: int = len(self.events) if start is None else self._index(start - 1)
+        return self.events[first:last]
+
+    def first_after(self, timestamp: int) -> Event:
+        """ the oldest event after the timestamp (None if there is none) """
+        index: int = self._index(timestamp)
+        return self.events[index - 1] if index else None
+
+    def last_before(self, timestamp: int = None) -> Event:
+        """ the newest event before the timestamp (or the newest event, None if there is none) """
+        index: int = 0 if timestamp is None else self._index(timestamp - 1)
+        return self.events[index] if index < len(self.events) else None
+
+
 class GlobalInfo:
     """ a data structure for the global player info """
     # pylint: disable=too-many-instance-attributes
@@ -131,6 +200,8 @@ class GlobalInfo:
     # Definition of local data structures
     class Bans:
         """ data structure for player bans """
+        __slots__ = ('reason', 'is_active', 'seconds_remaining')
+
         def __init__(self, bans_dict: dict):
             self.reason: str = bans_dict.get('last_banReason')
             """ Reason of last ban (still has value even when ban is over) """
@@ -141,6 +212,8 @@ class GlobalInfo:
 
     class Rank:
         """ data structure for player rank information """
+        __slots__ = ('score', 'tier', 'division', 'ladder_pos_platform', 'image_url', 'season')
+
         def __init__(self, rank_dict: dict):
             self.score: int = rank_dict.get('rankScore')
             """ Current rank score """
@@ -194,6 +267,9 @@ class GlobalInfo:
 
 class RealtimeInfo:
     """ a data structure for the player's real time information """
+    __slots__ = ('lobby_state', 'is_online', 'is_in_game', 'can_join', 'party_full',
+                 'selected_legend')
+
     def __init__(self, realtime_dict: dict):
         self.lobby_state: str = realtime_dict.get('lobbyState')
         """ open if lobby is open """
@@ -216,8 +292,12 @@ class DataTracker:
     Note:
         if the tracker's rank is not available, and empty dictionary will be used
     """
+    __slots__ = ('name', 'value', 'key', 'key_id', 'category', 'tracker_rank')
+
     class TrackerRank:
         """ Data structure for the rank for the stat being tracked """
+        __slots__ = ('position', 'percent')
+
         def __init__(self, tracker_rank_dict: dict):
             self.position: int = 0
             """ Position of rank """
@@ -233,9 +313,12 @@ class DataTracker:
         """ Descriptive name of the tracker """
         self.value: int = data_trackers_dict.get('value')
         """ Numerical value of the tracker """
-        self.key: str = str(data_trackers_dict.get('key'))
+        tracker_key: TrackerKey = tracker_keys.lookup(str(data_trackers_dict.get('key')))
+        self.key: str = tracker_key.key
         """ Unique 'key' for the tracker """
-        self.category: str = self.key.removeprefix('specialEvent_')
+        self.key_id: int = tracker_key.key_id
+        """ id of the key in the process wide tracker key registry (see al_tracker_keys) """
+        self.category: str = tracker_key.category
         """
         Aggregate key for combining 'specialEvent' and 'season' data with regular data
 
@@ -244,12 +327,6 @@ class DataTracker:
             statistical purposes it makes sense to just drop the 'specialEvent' prefix
             or any 'season' suffix
         """
-        self.category = self.category.removeprefix('arenas_')
-        self.category = self.category.removeprefix('grandsoiree_')
-        if self.category.startswith('wins_') or self.category.endswith('_wins'):
-            self.category = 'wins'
-        if self.category.startswith('kills_') or self.category.endswith('_kills'):
-            self.category = 'kills'
         rank_dict: dict = data_trackers_dict.get('rank')
         if not rank_dict:
             rank_dict = {'rankPos': -1, 'topPercent': -1.0}
@@ -289,6 +366,18 @@ class Legend:
         if legend_dict.get('gameInfo'):
             self.game_info: GameInfo = GameInfo(legend_dict.get('gameInfo'))
             """ GameInfo for the legend """
+        self._trackers_by_key: Dict[str, DataTracker] = None
+
+    def tracker(self, key: str) -> DataTracker:
+        """
+        The legend's tracker with the given key (None if the legend does not have it)
+
+        Note:
+            the key index is built on the first call
+        """
+        if self._trackers_by_key is None:
+            self._trackers_by_key = {tracker.key: tracker for tracker in self.data_trackers}
+        return self._trackers_by_key.get(key)
 
 
 class ALPlayer:
@@ -297,31 +386,214 @@ class ALPlayer:
 
     Discussion:
         The player class is intended as an encapsulated representation of the data from the api.
+
+        In ``lazy`` mode only the GlobalInfo and RealtimeInfo are built up front, the player keeps
+        the raw data and builds ``selected_legend``, ``all_legends`` and ``events`` the first
+        time they are accessed.
+
+        ``events`` are sorted by timestamp, newest first. The time range queries
+        (``events_between``, ``first_event_after``, ``last_event``, ``iter_games``) use binary
+        search on per event type timelines built on the first query.
     """
+    # pylint: disable=too-many-instance-attributes
 
-    def __init__(self, basic_player_stats_data: dict, events: list = None):
-        """ Init the object with the player's name and platform """
+    def __init__(self, basic_player_stats_data: dict, events: list = None, lazy: bool = False):
+        """
+        Init the object with the player's basic stats and events
+
+        :param basic_player_stats_data: a basic_player_stats response for the player
+        :param events: list of events (an ALAction.GET response) for the player
+        :param lazy: if True the legends and events are built on first access
+        """
         self.global_info: GlobalInfo = GlobalInfo(global_dict=basic_player_stats_data['global'])
         """ Contains all the global info for the player """
         self.realtime_info: RealtimeInfo = RealtimeInfo(
             realtime_dict=basic_player_stats_data['realtime']
         )
         """ Contains the RealtimeInfo for the player """
-        self.timestamp_last_checked: int = arrow.utcnow().int_timestamp
+        self.timestamp_last_checked: int = int(time.time())
         """ Contains the timestamp (UTC) that the player was created / data loaded """
-        self.selected_legend: Legend = Legend(
-            legend_name=basic_player_stats_data['legends']['selected']['LegendName'],
-            legend_dict=basic_player_stats_data['legends']['selected']
+        self._legends_data: dict = basic_player_stats_data['legends']
+        self._events_data: list = events
+        self._selected_legend: Legend = None
+        self._all_legends: List[Legend] = None
+        self._events: List[Event] = None
+        self._legends_by_name: Dict[str, Legend] = None
+        self._trackers_by_category: Dict[str, List[DataTracker]] = None
+        self._totals: dict = {}
+        self._timelines: Dict[ALEventType, EventTimeline] = None
+        self._games_by_legend: Dict[str, List[Event]] = None
+        if not lazy:
+            self._build_legends()
+            self._build_events()
+
+    def _build_legends(self):
+        """ build the selected legend and all the legends from the raw data """
+        legends_data: dict = self._legends_data
+        self._selected_legend = Legend(
+            legend_name=legends_data['selected']['LegendName'],
+            legend_dict=legends_data['selected']
         )
-        """ Currently Selected Legend """
-        self.all_legends: List[Legend] = list()
-        """ List of all legends (and their stats) """
-        for legend_name, legend_dict in basic_player_stats_data['legends']['all'].items():
-            self.all_legends.append(Legend(legend_name=legend_name, legend_dict=legend_dict))
-        self.events: List[Event] = list()
-        """ List of all matches / events"""
-        if events:
+        all_legends: List[Legend] = []
+        for legend_name, legend_dict in legends_data['all'].items():
+            all_legends.append(Legend(legend_name=legend_name, legend_dict=legend_dict))
+        self._all_legends = all_legends
+        self._legends_data = None
+
+    def _build_events(self):
+        """ build the events from the raw data """
+        events: List[Event] = []
+        if self._events_data:
             event: dict
-            for event in events:
+            for event in self._events_data:
                 event_result = event_factory(event_dict=event)
-                self.events.append(event_result)
+                events.append(event_result)
+        # the api sends the events newest first, sorting is linear when they already are
+        events.sort(key=event_timestamp, reverse=True)
+        self._events = events
+        self._events_data = None
+
+    @property
+    def selected_legend(self) -> Legend:
+        """ Currently Selected Legend """
+        if self._selected_legend is None:
+            self._build_legends()
+        return self._selected_legend
+
+    @property
+    def all_legends(self) -> List[Legend]:
+        """ List of all legends (and their stats) """
+        if self._all_legends is None:
+            self._build_legends()
+        return self._all_legends
+
+    @property
+    def events(self) -> List[Event]:
+        """ List of all matches / events, newest first """
+        if self._events is None:
+            self._build_events()
+        return self._events
+
+    def to_dict(self) -> dict:
+        """ Convert the player to a dictionary of plain values (see al_snapshot.to_dict) """
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from .al_snapshot import to_dict
+        return to_dict(self)
+
+    @classmethod
+    def from_dict(cls, player_dict: dict) -> 'ALPlayer':
+        """ Restore a player converted with to_dict (see al_snapshot.from_dict) """
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from .al_snapshot import from_dict
+        return from_dict(player_dict)
+
+    def to_snapshot(self) -> bytes:
+        """ Compact binary snapshot of the player (see al_snapshot.dumps) """
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from .al_snapshot import dumps
+        return dumps(self)
+
+    @classmethod
+    def from_snapshot(cls, snapshot: bytes) -> 'ALPlayer':
+        """ Restore a player from a binary snapshot (see al_snapshot.loads) """
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from .al_snapshot import loads
+        return loads(snapshot)
+
+    def legend(self, name: str) -> Legend:
+        """ The legend with the given name (None if the player has no data for it) """
+        if self._legends_by_name is None:
+            self._legends_by_name = {legend.name: legend for legend in self.all_legends}
+        return self._legends_by_name.get(name)
+
+    def trackers(self, category: str) -> List[DataTracker]:
+        """
+        The trackers of every legend with the given DataTracker.category (ex: 'kills')
+
+        Note:
+            the category index is built on the first call
+        """
+        if self._trackers_by_category is None:
+            trackers_by_category: Dict[str, List[DataTracker]] = {}
+            for legend in self.all_legends:
+                for tracker in legend.data_trackers:
+                    trackers_by_category.setdefault(tracker.category, []).append(tracker)
+            self._trackers_by_category = trackers_by_category
+        return self._trackers_by_category.get(category, [])
+
+    def total(self, category: str):
+        """ Sum of the tracker values of a category across all legends (cached) """
+        total = self._totals.get(category)
+        if total is None:
+            total = sum(
+                tracker.value for tracker in self.trackers(category)
+                if isinstance(tracker.value, (int, float))
+            )
+            self._totals[category] = total
+        return total
+
+    def timeline(self, event_type: ALEventType = None) -> EventTimeline:
+        """
+        The player's events of one type (or all events) as an EventTimeline
+
+        Note:
+            the timelines of every event type are built on the first call
+        """
+        if self._timelines is None:
+            events_by_type: Dict[ALEventType, List[Event]] = {
+                event_type: [] for event_type in ALEventType
+            }
+            games_by_legend: Dict[str, List[Event]] = {}
+            for event in self.events:
+                events_by_type[event.event_type].append(event)
+                if event.event_type is ALEventType.GAME:
+                    games_by_legend.setdefault(event.legend_played, []).append(event)
+            timelines: Dict[ALEventType, EventTimeline] = {
+                event_type: EventTimeline(events) for event_type, events in events_by_type.items()
+            }
+            timelines[None] = EventTimeline(self.events)
+            self._games_by_legend = games_by_legend
+            self._timelines = timelines
+        return self._timelines[event_type]
+
+    def events_between(
+            self, start: int = None, end: int = None, event_type: ALEventType = None
+    ) -> List[Event]:
+        """
+        The events with ``start <= timestamp < end``, newest first
+
+        Example::
+
+            # events of the last 24 hours
+            player.events_between(start=int(time.time()) - 86400)
+            # games since the last rank change
+            rank_event = player.last_event(ALEventType.RANK)
+            player.events_between(start=rank_event.timestamp + 1, event_type=ALEventType.GAME)
+
+        :param start: oldest timestamp included (None for no lower bound)
+        :param end: timestamp excluded (None for no upper bound)
+        :param event_type: only events of this type (None for every event)
+        """
+        return self.timeline(event_type).between(start, end)
+
+    def first_event_after(self, timestamp: int, event_type: ALEventType = None) -> Event:
+        """ The oldest event (of a type) after the timestamp, None if there is none """
+        return self.timeline(event_type).first_after(timestamp)
+
+    def last_event(self, event_type: ALEventType = None, before: int = None) -> Event:
+        """ The newest event (of a type), before a timestamp if given, None if there is none """
+        return self.timeline(event_type).last_before(before)
+
+    def iter_games(self, legend: str = None, limit: int = None) -> Iterator[Event]:
+        """
+        Iterate the games (of one legend), newest first
+
+        :param legend: only the games played with this legend (None for every game)
+        :param limit: stop after this many games (ex: the last 10 games), None for all of them
+        """
+        if legend is None:
+            games: List[Event] = self.timeline(ALEventType.GAME).events
+        else:
+            self.timeline()
+            games = self._games_by_legend.get(legend, [])
+        return itertools.islice(games, limit)
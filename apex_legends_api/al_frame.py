@@ -0,0 +1,510 @@
+"""
+al_frame.py
+columnar storage for events with group-by aggregations
+"""
+import datetime
+import operator
+from array import array
+from collections import Counter
+from functools import partial
+from itertools import chain, compress, count, repeat
+from typing import Callable, Dict, Iterable, Sequence
+from .al_base import ALEventType  # noqa E0402
+from .al_domain import ALPlayer, DataTracker, Event, GameEvent  # noqa E0402
+from .al_tracker_keys import TrackerKeyRegistry, tracker_keys  # noqa E0402
+
+try:
+    import numpy
+except ImportError:  # optional, install with: pip install apex-legends-api[frame]
+    numpy = None
+
+SECONDS_PER_DAY: int = 24 * 60 * 60
+
+
+def parse_rank_score_change(rank_score_change) -> int:
+    """ parse the 'rankScoreChange' of a game ('116', '-12', None, '') into an int """
+    try:
+        return int(rank_score_change)
+    except (TypeError, ValueError):
+        return 0
+
+
+# pylint: disable=too-few-public-methods
+class _Categories:
+    """ maps values to small integer codes (and back) """
+    def __init__(self):
+        self.values: list = []
+        self.codes: dict = {}
+
+    def encode(self, value) -> int:
+        """ return the code for the value, adding it if needed """
+        code: int = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.codes[value] = code
+            self.values.append(value)
+        return code
+
+
+def _extend_recoded(column: array, codes: array, new_codes: list):
+    """ append codes to a column, translated with new_codes (code -> new code) """
+    if new_codes == list(range(len(new_codes))):
+        column.extend(codes)
+    else:
+        column.extend(new_codes[code] for code in codes)
+
+
+class EventFrame:
+    """
+    Columnar store of events from one or many players
+
+    Discussion:
+        Every event is one row, stored column by column in ``array.array`` objects. Strings
+        (uid, legend, tracker key) are stored as integer codes (tracker keys and categories use
+        the ids of the process wide tracker key registry), so group-by runs over flat integer
+        columns instead of walking Event objects. Values that do not apply to an event
+        type (ex: ``game_length`` of a level event) are stored as 0, filter on ``event_type``.
+
+        With numpy installed (``pip install apex-legends-api[frame]``) filters and group-by
+        are vectorized (masks, ``numpy.bincount`` over packed group codes), about 7x faster
+        than a loop over the Event objects. Without numpy they run in plain python at about the
+        speed of such a loop: tracker_group_by is a little faster, group_by on event columns a
+        little slower (see benchmarks/bench_frame.py).
+
+        Event columns:
+            - timestamp, uid, event_type, legend_played, game_length, xp_progress,
+              rank_score_change (parsed to an int)
+            - day (derived: UTC date of the timestamp)
+
+        The trackers of every game are kept in a long table (one row per tracker) with the
+        columns: row (index of the event), key, category, value
+
+    Example::
+
+        frame = EventFrame.from_players(players)
+        kills = frame.tracker_group_by('legend_played', 'day', category='kills').sum('value')
+        average_length = frame.group_by('legend_played', event_type=ALEventType.GAME).mean(
+            'game_length'
+        )
+    """
+    # pylint: disable=too-many-instance-attributes
+    vectorized: bool = numpy is not None
+    """ True if filters and group-by run as numpy kernels (the default when numpy is installed) """
+    event_types: tuple = tuple(ALEventType)
+    """ event_type codes are the index in this tuple """
+    event_columns: tuple = (
+        'timestamp', 'uid', 'event_type', 'legend_played', 'game_length', 'xp_progress',
+        'rank_score_change'
+    )
+    """ names of the stored event columns """
+
+    def __init__(self):
+        self.timestamp: array = array('q')
+        self.uid: array = array('l')
+        self.event_type: array = array('b')
+        self.legend_played: array = array('l')
+        self.game_length: array = array('l')
+        self.xp_progress: array = array('q')
+        self.rank_score_change: array = array('l')
+        self.tracker_row: array = array('l')
+        self.tracker_key: array = array('l')
+        self.tracker_value: array = array('d')
+        self._uids: _Categories = _Categories()
+        self._legends: _Categories = _Categories()
+        self._legends.encode(None)
+        self._tracker_keys: TrackerKeyRegistry = tracker_keys
+        self._event_type_codes: dict = {
+            event_type: code for code, event_type in enumerate(self.event_types)
+        }
+        self._day: array = array('q')
+        """ the day of every event (derived from the timestamp when the row is added) """
+        self._rows_by_key: Dict[int, array] = {}
+        """ tracker key id -> indexes of the trackers with that key """
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    @classmethod
+    def from_events(cls, events: Iterable[Event]) -> 'EventFrame':
+        """ Build a frame from Event objects """
+        frame: EventFrame = cls()
+        frame.extend(events)
+        return frame
+
+    @classmethod
+    def from_players(cls, players: Iterable[ALPlayer]) -> 'EventFrame':
+        """ Build a frame from the events of many players """
+        frame: EventFrame = cls()
+        for player in players:
+            frame.extend(player.events)
+        return frame
+
+    @classmethod
+    def from_columns(cls, columns: dict) -> 'EventFrame':
+        """ Build a frame from the columns of another frame (see to_columns) """
+        frame: EventFrame = cls()
+        frame.extend_columns(columns)
+        return frame
+
+    def to_columns(self) -> dict:
+        """
+        The frame as plain column arrays and value tables, ex: to send it to another process
+
+        Note:
+            registry ids are only valid in the process that created them, so the tracker keys are
+            stored as indexes into the 'tracker_keys' table of key strings
+        """
+        key_ids: _Categories = _Categories()
+        tracker_key: array = array('l', (key_ids.encode(key_id) for key_id in self.tracker_key))
+        columns: dict = {name: getattr(self, name) for name in self.event_columns}
+        columns.update(
+            tracker_row=self.tracker_row, tracker_key=tracker_key, tracker_value=self.tracker_value,
+            uids=self._uids.values, legends=self._legends.values,
+            tracker_keys=[self._tracker_keys.by_id(key_id).key for key_id in key_ids.values]
+        )
+        return columns
+
+    def extend_columns(self, columns: dict):
+        """ Append the rows of another frame (see to_columns) """
+        rows: int = len(self.timestamp)
+        uid_codes: list = [self._uids.encode(uid) for uid in columns['uids']]
+        legend_codes: list = [self._legends.encode(legend) for legend in columns['legends']]
+        key_ids: list = [self._tracker_keys.lookup(key).key_id for key in columns['tracker_keys']]
+        for name in ('timestamp', 'event_type', 'game_length', 'xp_progress', 'rank_score_change'):
+            getattr(self, name).extend(columns[name])
+        self._day.extend(map(operator.floordiv, columns['timestamp'], repeat(SECONDS_PER_DAY)))
+        _extend_recoded(self.uid, columns['uid'], uid_codes)
+        _extend_recoded(self.legend_played, columns['legend_played'], legend_codes)
+        trackers: int = len(self.tracker_key)
+        _extend_recoded(self.tracker_key, columns['tracker_key'], key_ids)
+        for index, key_id in enumerate(self.tracker_key[trackers:], trackers):
+            self._index_tracker(index, key_id)
+        self.tracker_row.extend(row + rows for row in columns['tracker_row'])
+        self.tracker_value.extend(columns['tracker_value'])
+
+    def extend(self, events: Iterable[Event]):
+        """ Append Event objects to the frame """
+        for event in events:
+            self.append(event)
+
+    def append(self, event: Event):
+        """ Append a single Event to the frame """
+        row: int = len(self.timestamp)
+        self.timestamp.append(event.timestamp or 0)
+        self._day.append(self.timestamp[row] // SECONDS_PER_DAY)
+        self.uid.append(self._uids.encode(str(event.uid)))
+        self.event_type.append(self._event_type_codes[event.event_type])
+        if isinstance(event, GameEvent):
+            self.legend_played.append(self._legends.encode(event.legend_played))
+            self.game_length.append(event.game_length or 0)
+            self.xp_progress.append(event.xp_progress or 0)
+            self.rank_score_change.append(parse_rank_score_change(event.rank_score_change))
+            tracker: DataTracker
+            for tracker in event.game_data_trackers:
+                self._append_tracker(row, tracker)
+        else:
+            self.legend_played.append(0)
+            self.game_length.append(0)
+            self.xp_progress.append(0)
+            self.rank_score_change.append(0)
+
+    def _append_tracker(self, row: int, tracker: DataTracker):
+        """ append one game tracker to the long table """
+        self._index_tracker(len(self.tracker_row), tracker.key_id)
+        self.tracker_row.append(row)
+        self.tracker_key.append(tracker.key_id)
+        self.tracker_value.append(tracker.value if isinstance(tracker.value, (int, float)) else 0)
+
+    def decode(self, name: str, code: int):
+        """ turn a stored code of the given column back into its value """
+        if name == 'day':
+            return datetime.datetime.fromtimestamp(
+                code * SECONDS_PER_DAY, tz=datetime.timezone.utc
+            ).date()
+        if name == 'key':
+            return self._tracker_keys.by_id(code).key
+        tables: dict = {
+            'uid': self._uids.values,
+            'legend_played': self._legends.values,
+            'event_type': self.event_types,
+            'category': self._tracker_keys.categories,
+        }
+        table = tables.get(name)
+        return code if table is None else table[code]
+
+    def _stored(self, column: array) -> Sequence:
+        """ a stored column, as a numpy array when the aggregations are vectorized """
+        return numpy.array(column) if self.vectorized else column
+
+    def _take(self, values: Sequence, rows: Sequence) -> Sequence:
+        """ values[row] for every row (every value if rows is None) """
+        if rows is None:
+            return values
+        if self.vectorized:
+            return values[rows]
+        if len(rows) < 2:
+            return tuple(values[row] for row in rows)
+        return operator.itemgetter(*rows)(values)
+
+    def _select(self, rows: Sequence, mask: Iterable) -> Sequence:
+        """ the rows (every row if None) for which the mask is true """
+        if self.vectorized:
+            return numpy.flatnonzero(mask) if rows is None else rows[mask]
+        if rows is None:
+            rows = count()
+        return list(compress(rows, mask))
+
+    def _equal(self, values: Sequence, value) -> Iterable:
+        """ mask of the values equal to value """
+        if self.vectorized:
+            return values == value
+        return map(partial(operator.eq, value), values)
+
+    def _key_rows(self, tracker_key: Sequence, key_ids: list) -> Sequence:
+        """ indexes of the trackers with one of the key ids """
+        if self.vectorized:
+            table = numpy.zeros(len(self._tracker_keys.key_categories), dtype=bool)
+            table[key_ids] = True
+            return numpy.flatnonzero(table[tracker_key])
+        rows_by_key: Dict[int, array] = self._rows_by_key
+        if len(key_ids) == 1:
+            return rows_by_key.get(key_ids[0], ())
+        return sorted(chain.from_iterable(rows_by_key.get(key_id, ()) for key_id in key_ids))
+
+    def _between(self, values: Sequence, start, end) -> Iterable:
+        """ mask of the values in [start, end) (either bound can be None) """
+        if self.vectorized:
+            mask = numpy.ones(len(values), dtype=bool)
+            if start is not None:
+                mask &= values >= start
+            if end is not None:
+                mask &= values < end
+            return mask
+        if end is None:
+            return map(partial(operator.le, start), values)
+        if start is None:
+            return map(partial(operator.gt, end), values)
+        return (start <= value < end for value in values)
+
+    def _index_tracker(self, index: int, key_id: int):
+        """ add a tracker to the rows of its key """
+        rows: array = self._rows_by_key.get(key_id)
+        if rows is None:
+            rows = self._rows_by_key[key_id] = array('l')
+        rows.append(index)
+
+    def _event_values(self, name: str, rows: Sequence) -> Sequence:
+        """ the values of an event column (including derived ones) at the given rows """
+        if name == 'day':
+            return self._take(self._stored(self._day), rows)
+        if name not in self.event_columns:
+            raise KeyError(f'Unknown event column: {name}')
+        return self._take(self._stored(getattr(self, name)), rows)
+
+    def _event_rows(self, event_type: ALEventType, start: int, end: int) -> Sequence:
+        """ indexes of the event rows passing the filters (None for every row) """
+        rows: Sequence = None
+        if event_type is not None:
+            rows = self._select(rows, self._equal(
+                self._stored(self.event_type), self._event_type_codes[event_type]
+            ))
+        if start is not None or end is not None:
+            rows = self._select(rows, self._between(
+                self._event_values('timestamp', rows), start, end
+            ))
+        return rows
+
+    def group_by(
+            self, *keys: str, event_type: ALEventType = None, start: int = None, end: int = None
+    ) -> 'EventGroupBy':
+        """
+        Group the events on one or more event columns
+
+        :param keys: event column names (or 'day')
+        :param event_type: only include events of this type
+        :param start: only include events with a timestamp >= start
+        :param end: only include events with a timestamp < end
+        :return: EventGroupBy to aggregate with count / sum / mean
+        """
+        rows: Sequence = self._event_rows(event_type, start, end)
+        return EventGroupBy(self, keys, lambda name: self._event_values(name, rows))
+
+    def tracker_group_by(
+            self, *keys: str, key: str = None, category: str = None,
+            start: int = None, end: int = None
+    ) -> 'EventGroupBy':
+        """
+        Group the game trackers on tracker columns ('key', 'category') and / or event columns
+
+        :param keys: column names to group on
+        :param key: only include trackers with this key
+        :param category: only include trackers of this category (ex: 'kills')
+        :param start: only include games with a timestamp >= start
+        :param end: only include games with a timestamp < end
+        :return: EventGroupBy to aggregate with count / sum / mean ('value' is the tracker value)
+        """
+        registry: TrackerKeyRegistry = self._tracker_keys
+        tracker_key: Sequence = self._stored(self.tracker_key)
+        key_category: Sequence = self._stored(registry.key_categories)
+        key_ids: list = None
+        if key is not None:
+            key_ids = [registry.lookup(key).key_id] if key in registry else []
+        if category is not None:
+            category_code: int = registry.category_id(category)
+            key_ids = [
+                key_id for key_id, key_category_code in enumerate(registry.key_categories)
+                if key_category_code == category_code and (key_ids is None or key_id in key_ids)
+            ]
+        rows: Sequence = None if key_ids is None else self._key_rows(tracker_key, key_ids)
+        tracker_row: Sequence = self._stored(self.tracker_row)
+        if start is not None or end is not None:
+            rows = self._select(rows, self._between(
+                self._event_values('timestamp', self._take(tracker_row, rows)), start, end
+            ))
+        event_rows: Sequence = self._take(tracker_row, rows)
+
+        def column(name: str) -> Sequence:
+            if name == 'value':
+                return self._take(self._stored(self.tracker_value), rows)
+            if name == 'key':
+                return self._take(tracker_key, rows)
+            if name == 'category':
+                return self._take(key_category, self._take(tracker_key, rows))
+            return self._event_values(name, event_rows)
+        return EventGroupBy(self, keys, column)
+
+
+class EventGroupBy:
+    """
+    Rows of an EventFrame grouped on one or more columns
+
+    Note:
+        Results are dictionaries keyed on the decoded group value, or on a tuple of decoded
+        values when grouping on more than one column
+    """
+    def __init__(self, frame: EventFrame, keys: tuple, column: Callable[[str], Sequence]):
+        if not keys:
+            raise ValueError('group by needs at least one column')
+        self._frame: EventFrame = frame
+        self._keys: tuple = keys
+        self._column: Callable[[str], Sequence] = column
+        self._vectorized: bool = frame.vectorized
+        self._groups = None
+
+    def _decode(self, codes):
+        """ decode a group key (a tuple of codes, or a single code when grouping on one column) """
+        if len(self._keys) == 1:
+            return self._frame.decode(self._keys[0], codes)
+        return tuple(self._frame.decode(name, code) for name, code in zip(self._keys, codes))
+
+    def count(self) -> Dict:
+        """ number of rows per group """
+        return {self._decode(group): count for group, count in self._counts().items()}
+
+    def sum(self, column: str) -> Dict:
+        """ sum of the column per group """
+        return {self._decode(group): total for group, total in self._sums(column).items()}
+
+    def mean(self, column: str) -> Dict:
+        """ mean of the column per group """
+        counts: dict = self._counts()
+        return {
+            self._decode(group): total / counts[group]
+            for group, total in self._sums(column).items()
+        }
+
+    def _group_keys(self):
+        """
+        The group of every row: a list of codes (or of tuples of codes) in python, a
+        _NumpyGroups when vectorized
+        """
+        if self._groups is None:
+            codes: list = [self._column(name) for name in self._keys]
+            if self._vectorized:
+                self._groups = _NumpyGroups(codes)
+            else:
+                self._groups = codes[0] if len(codes) == 1 else list(zip(*codes))
+        return self._groups
+
+    def _counts(self) -> dict:
+        """ group -> number of rows """
+        groups = self._group_keys()
+        if self._vectorized:
+            return dict(zip(groups.keys, groups.counts().tolist()))
+        return Counter(groups)
+
+    def _sums(self, column: str) -> dict:
+        """ group -> sum of the column """
+        groups = self._group_keys()
+        if self._vectorized:
+            return dict(zip(groups.keys, groups.sums(self._column(column)).tolist()))
+        totals: dict = {}
+        get: Callable = totals.get
+        for group, value in zip(groups, self._column(column)):
+            totals[group] = get(group, 0) + value
+        return totals
+
+
+class _NumpyGroups:
+    """
+    Group numbers of rows from their group columns (numpy arrays of small integer codes)
+
+    Discussion:
+        The codes of every column are packed into one integer per row, when the packed range is
+        small (the usual case: legends, days, tracker keys) it is the group number itself and
+        groups are counted / summed with ``numpy.bincount``, without sorting. Otherwise the
+        packed values are numbered with ``numpy.unique``.
+    """
+    dense_size: int = 1 << 22
+    """ largest packed range counted directly """
+
+    def __init__(self, columns: list):
+        packed = numpy.zeros(len(columns[0]), dtype=numpy.int64)
+        lows: list = []
+        sizes: list = []
+        for column in columns:
+            low: int = int(column.min()) if len(column) else 0
+            size: int = int(column.max()) - low + 1 if len(column) else 1
+            packed = packed * size + (column - low)
+            lows.append(low)
+            sizes.append(size)
+        total_size: int = 1
+        for size in sizes:
+            total_size *= size
+        if total_size <= self.dense_size:
+            self.size: int = total_size
+            self.index = packed
+            self._present = numpy.flatnonzero(numpy.bincount(packed, minlength=total_size))
+            values = self._present
+        else:
+            values, self.index = numpy.unique(packed, return_inverse=True)
+            self.size = len(values)
+            self._present = None
+        self.keys: list = self._unpack(values, lows, sizes)
+        """ the group key (code or tuple of codes) of every group, in group number order """
+
+    @staticmethod
+    def _unpack(values, lows: list, sizes: list) -> list:
+        """ packed values back to group keys """
+        codes: list = []
+        for low, size in zip(reversed(lows), reversed(sizes)):
+            values, code = numpy.divmod(values, size)
+            codes.append((code + low).tolist())
+        if len(codes) == 1:
+            return codes[0]
+        return list(zip(*reversed(codes)))
+
+    def _reduce(self, totals):
+        """ keep the groups that have rows """
+        return totals if self._present is None else totals[self._present]
+
+    def counts(self):
+        """ number of rows of every group """
+        return self._reduce(numpy.bincount(self.index, minlength=self.size))
+
+    def sums(self, values):
+        """ sum of the values of every group (integer columns stay integers) """
+        totals = numpy.bincount(self.index, weights=values, minlength=self.size)
+        if values.dtype.kind in 'iu':
+            totals = totals.astype(numpy.int64)
+        return self._reduce(totals)
@@ -0,0 +1,136 @@
+"""
+al_identity.py
+persistent identity store for name -> uid (nametouid) and origin lookups
+"""
+import abc
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Tuple
+
+
+class IdentityStore(abc.ABC):
+    """
+    Base class for a persistent identity store
+
+    Discussion:
+        ApexLegendsAPI checks the store before calling ``nametouid`` or ``get_player_origin``.
+        Subclass this to keep identities somewhere else (redis, a shared database, etc...),
+        only ``get`` and ``set`` need to be implemented.
+    """
+    @abc.abstractmethod
+    def get(self, kind: str, key: str) -> Tuple[bool, Any]:
+        """
+        Look up an identity
+
+        :param kind: kind of lookup ('nametouid' or 'origin')
+        :param key: lookup key
+        :return: (True, value) if a live entry exists, (False, None) otherwise
+        """
+
+    @abc.abstractmethod
+    def set(self, kind: str, key: str, value: Any, negative: bool = False):
+        """
+        Store an identity
+
+        :param kind: kind of lookup ('nametouid' or 'origin')
+        :param key: lookup key
+        :param value: json serializable value
+        :param negative: True if this records a failed lookup (kept for a shorter time)
+        """
+
+
+class SQLiteIdentityStore(IdentityStore):
+    """
+    SQLite backed IdentityStore
+
+    Discussion:
+        The database runs in WAL mode with a busy timeout, so many threads and processes can
+        share the same file. Entries expire after ``ttl`` seconds (``negative_ttl`` for failed
+        lookups) and expired rows are purged at most every ``purge_interval`` seconds.
+    """
+    def __init__(
+            self,
+            path: str = 'apex_legends_identity.sqlite3',
+            ttl: float = 7 * 24 * 60 * 60,
+            negative_ttl: float = 5 * 60,
+            purge_interval: float = 60 * 60
+    ):
+        """
+        :param path: location of the database file
+        :param ttl: seconds a successful lookup is kept
+        :param negative_ttl: seconds a failed lookup is kept
+        :param purge_interval: minimum seconds between purges of expired rows
+        """
+        self.path: str = os.path.abspath(path)
+        self.ttl: float = ttl
+        self.negative_ttl: float = negative_ttl
+        self.purge_interval: float = purge_interval
+        self._local: threading.local = threading.local()
+        self._next_purge: float = time.time() + purge_interval
+        with self._connection() as connection:
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS identity ('
+                ' kind TEXT NOT NULL,'
+                ' key TEXT NOT NULL,'
+                ' value TEXT,'
+                ' expires_at REAL NOT NULL,'
+                ' PRIMARY KEY (kind, key))'
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        """ one connection per thread (sqlite connections can not be shared between threads) """
+        connection: sqlite3.Connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30)
+            connection.execute('PRAGMA journal_mode=WAL')
+            self._local.connection = connection
+        return connection
+
+    def get(self, kind: str, key: str) -> Tuple[bool, Any]:
+        row = self._connection().execute(
+            'SELECT value FROM identity WHERE kind = ? AND key = ? AND expires_at > ?',
+            (kind, key, time.time())
+        ).fetchone()
+        if row is None:
+            return False, None
+        return True, json.loads(row[0])
+
+    def set(self, kind: str, key: str, value: Any, negative: bool = False):
+        now: float = time.time()
+        expires_at: float = now + (self.negative_ttl if negative else self.ttl)
+        with self._connection() as connection:
+            connection.execute(
+                'INSERT OR REPLACE INTO identity (kind, key, value, expires_at)'
+                ' VALUES (?, ?, ?, ?)',
+                (kind, key, json.dumps(value), expires_at)
+            )
+        if now >= self._next_purge:
+            self.purge_expired()
+
+    def delete(self, kind: str, key: str):
+        """ Remove a single identity """
+        with self._connection() as connection:
+            connection.execute('DELETE FROM identity WHERE kind = ? AND key = ?', (kind, key))
+
+    def purge_expired(self) -> int:
+        """
+        Remove every expired row
+
+        :return: number of rows removed
+        """
+        now: float = time.time()
+        self._next_purge = now + self.purge_interval
+        with self._connection() as connection:
+            return connection.execute(
+                'DELETE FROM identity WHERE expires_at <= ?', (now,)
+            ).rowcount
+
+    def close(self):
+        """ Close this thread's connection """
+        connection: sqlite3.Connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
@@ -0,0 +1,207 @@
+"""
+al_ingest.py
+bulk parsing of archived (JSON Lines) player payloads over a process pool
+"""
+import collections
+import gzip
+import os
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Deque, Iterable, Iterator, List, Tuple, Union
+from .al_domain import ALPlayer, event_factory  # noqa E0402
+from .al_frame import EventFrame  # noqa E0402
+from .al_json import JSONDecoder, default_decoder  # noqa E0402
+
+Chunk = Tuple[str, int, int]
+""" (path, first byte, end byte) of a part of an archive, end is -1 for the whole file """
+
+
+def split_archive(path: str, chunk_size: int) -> List[Chunk]:
+    """
+    Split an archive file into byte ranges of about chunk_size bytes
+
+    Note:
+        a line belongs to the chunk its first byte is in, so the ranges do not have to fall on
+        line boundaries. Gzip files cannot be split and are a single chunk.
+    """
+    if path.endswith('.gz'):
+        return [(path, 0, -1)]
+    size: int = os.path.getsize(path)
+    return [(path, start, min(start + chunk_size, size)) for start in range(0, size, chunk_size)]
+
+
+def _iter_lines(chunk: Chunk) -> Iterator[bytes]:
+    """ the lines starting in a chunk """
+    path, start, end = chunk
+    if end == -1:
+        with gzip.open(path, 'rb') as archive:
+            yield from archive
+        return
+    with open(path, 'rb') as archive:
+        if start:
+            # skip the end of the line started in the previous chunk
+            archive.seek(start - 1)
+            archive.readline()
+        while archive.tell() < end:
+            line: bytes = archive.readline()
+            if not line:
+                break
+            yield line
+
+
+def _records(chunk: Chunk, json_decoder: JSONDecoder) -> Iterator[Tuple[dict, list]]:
+    """ (basic_player_stats response or None, events or None) of every valid line """
+    for line in _iter_lines(chunk):
+        if not line.strip():
+            continue
+        try:
+            record = json_decoder(line)
+        except ValueError:
+            yield None, None
+            continue
+        if isinstance(record, list):
+            yield None, record
+        elif isinstance(record, dict) and 'stats' in record:
+            yield record['stats'], record.get('events')
+        elif isinstance(record, dict) and 'global' in record:
+            yield record, None
+        else:
+            yield None, None
+
+
+def _parse_snapshots(chunk: Chunk, json_decoder: JSONDecoder) -> Tuple[List[bytes], int]:
+    """ worker: the snapshots of the players in a chunk and the number of skipped lines """
+    snapshots: List[bytes] = []
+    skipped: int = 0
+    for stats, events in _records(chunk, json_decoder):
+        if stats is None and events is not None:
+            continue
+        try:
+            snapshots.append(ALPlayer(stats, events=events).to_snapshot())
+        except (KeyError, TypeError, ValueError, AttributeError):
+            skipped += 1
+    return snapshots, skipped
+
+
+def _parse_columns(chunk: Chunk, json_decoder: JSONDecoder) -> Tuple[dict, int]:
+    """ worker: the events of a chunk as EventFrame columns and the number of skipped lines """
+    frame: EventFrame = EventFrame()
+    skipped: int = 0
+    for stats, events in _records(chunk, json_decoder):
+        if events is None and stats is None:
+            skipped += 1
+            continue
+        try:
+            frame.extend([event_factory(event_dict=event) for event in events or ()])
+        except (KeyError, TypeError, ValueError, AttributeError):
+            skipped += 1
+    return frame.to_columns(), skipped
+
+
+class BulkIngest:
+    """
+    Parse archived api responses (JSON Lines files) on all the cores
+
+    Discussion:
+        Every line of an archive is one of:
+            - a basic_player_stats response
+            - an events (ALAction.GET) response (a list)
+            - ``{"stats": <basic_player_stats response>, "events": <events response>}``
+
+        Files are split in chunks of ``chunk_size`` bytes that the worker processes read
+        themselves, only the file name and byte range are sent to a worker. Workers hand back
+        compact results instead of pickled object graphs: a binary snapshot per player (see
+        al_snapshot) or the column arrays of an EventFrame. Results come back in file order;
+        at most two chunks per process are in flight, so memory does not grow with the size of
+        the archive.
+
+        Lines that are not valid json or not one of the payloads above are skipped and counted
+        in ``skipped``. Events responses without stats are only used by ``frame``.
+
+    Example::
+
+        with BulkIngest() as ingest:
+            for snapshot in ingest.snapshots(['players-2021-05.jsonl']):
+                store(snapshot)
+            frame = ingest.frame(glob.glob('archive/*.jsonl.gz'))
+    """
+    def __init__(
+            self, processes: int = None, chunk_size: int = 4 * 1024 * 1024,
+            json_decoder: JSONDecoder = None
+    ):
+        """
+        :param processes: worker processes (defaults to the number of cores), 1 parses in the
+            calling process
+        :param chunk_size: bytes of archive parsed per task
+        :param json_decoder: function decoding a line (must be picklable, ex: ``orjson.loads``),
+            defaults to the fastest installed json library
+        """
+        self.processes: int = processes or os.cpu_count() or 1
+        self.chunk_size: int = chunk_size
+        self.json_decoder: JSONDecoder = json_decoder or default_decoder
+        self.skipped: int = 0
+        """ number of archive lines that could not be parsed """
+        self._executor: Executor = None
+
+    def __enter__(self) -> 'BulkIngest':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """ stop the worker processes """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _map(self, function, paths: Union[str, Iterable[str]]) -> Iterator:
+        """ results of the function on every chunk of the archives, in order """
+        if isinstance(paths, str):
+            paths = [paths]
+        chunks: Iterator[Chunk] = (
+            chunk for path in paths for chunk in split_archive(path, self.chunk_size)
+        )
+        if self.processes == 1:
+            for chunk in chunks:
+                result, skipped = function(chunk, self.json_decoder)
+                self.skipped += skipped
+                yield result
+            return
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.processes)
+        in_flight: Deque[Future] = collections.deque()
+        for chunk in chunks:
+            in_flight.append(self._executor.submit(function, chunk, self.json_decoder))
+            if len(in_flight) >= 2 * self.processes:
+                yield self._result(in_flight.popleft())
+        while in_flight:
+            yield self._result(in_flight.popleft())
+
+    def _result(self, future: Future):
+        """ the result of a worker, counting its skipped lines """
+        result, skipped = future.result()
+        self.skipped += skipped
+        return result
+
+    def snapshots(self, paths: Union[str, Iterable[str]]) -> Iterator[bytes]:
+        """ a binary snapshot (see ALPlayer.from_snapshot) of every player in the archives """
+        for snapshots in self._map(_parse_snapshots, paths):
+            yield from snapshots
+
+    def players(self, paths: Union[str, Iterable[str]]) -> Iterator[ALPlayer]:
+        """
+        Every player in the archives
+
+        Note:
+            restoring a snapshot is about 1.5x faster than building the player from json (see
+            benchmarks/bench_snapshot.py), this is the part left to the calling process
+        """
+        for snapshot in self.snapshots(paths):
+            yield ALPlayer.from_snapshot(snapshot)
+
+    def frame(self, paths: Union[str, Iterable[str]]) -> EventFrame:
+        """ the events of every record in the archives as one EventFrame """
+        frame: EventFrame = EventFrame()
+        for columns in self._map(_parse_columns, paths):
+            frame.extend_columns(columns)
+        return frame
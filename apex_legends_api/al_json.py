@@ -0,0 +1,51 @@
+"""
+al_json.py
+json decoding straight from the response bytes, with the fastest available library
+"""
+import json
+from typing import Callable, Union
+
+JSONDecoder = Callable[[Union[bytes, str]], object]
+""" a function decoding a json document (bytes or str), raising ValueError on invalid json """
+
+
+def _default_decoder() -> JSONDecoder:
+    """ orjson if installed, then ujson, then the standard library """
+    try:
+        import orjson  # pylint: disable=import-outside-toplevel
+        return orjson.loads  # pylint: disable=no-member
+    except ImportError:
+        pass
+    try:
+        import ujson  # pylint: disable=import-outside-toplevel
+        return ujson.loads
+    except ImportError:
+        pass
+    return json.loads
+
+
+default_decoder: JSONDecoder = _default_decoder()
+""" the decoder used when none is given (install ``apex-legends-api[fast]`` for orjson) """
+
+
+def decode_response(content: bytes, text: Callable[[], str], decoder: JSONDecoder = None):
+    """
+    Decode a response body, wrapping a single object in a list
+
+    Discussion:
+        The json is decoded from the raw bytes, the (slow, charset detecting) text of the
+        response is only built when the body is not json, and returned as is.
+
+    :param content: the raw response body
+    :param text: returns the body as text, only called when the body is not json
+    :param decoder: json decoder to use, defaults to ``default_decoder``
+    """
+    try:
+        response_text = (decoder or default_decoder)(content)
+    except ValueError:
+        response_text = text()
+
+    # sometimes we get a pure dictionary back, let's wrap it in a list for consistency
+    if isinstance(response_text, dict):
+        response_text = [response_text]
+    return response_text
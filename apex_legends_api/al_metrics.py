@@ -0,0 +1,156 @@
+"""
+al_metrics.py
+request instrumentation: per request reports for hooks and aggregated per endpoint statistics
+"""
+import bisect
+import copy
+import math
+import threading
+from typing import Dict, List
+
+
+# pylint: disable=too-few-public-methods,too-many-instance-attributes
+class RequestInfo:
+    """
+    Report of a single api request, passed to every hook registered on the client
+
+    Note:
+        ``cache_hit`` is None when the endpoint is not cached. A ``coalesced`` request shared the
+        response of an identical request in flight, so it has no status / size / retries of its
+        own.
+    """
+    __slots__ = ('endpoint', 'url', 'params', 'status_code', 'elapsed', 'response_bytes',
+                 'retries', 'cache_hit', 'coalesced', 'error')
+
+    def __init__(self, endpoint: str, url: str, params: dict):
+        self.endpoint: str = endpoint
+        """ the endpoint of the request (ex: 'basic', 'events_get', 'nametouid') """
+        self.url: str = url
+        """ the url without the query string """
+        self.params: dict = params
+        """ the query parameters """
+        self.status_code: int = None
+        """ http status of the last attempt (None if nothing was sent) """
+        self.elapsed: float = 0.0
+        """ seconds spent in the request, including retries and waiting on the rate limiter """
+        self.response_bytes: int = 0
+        """ size of the response body """
+        self.retries: int = 0
+        """ number of retried attempts """
+        self.cache_hit: bool = None
+        """ True / False if the endpoint is cached, None if not """
+        self.coalesced: bool = False
+        """ True if the response of an identical request in flight was used """
+        self.error: Exception = None
+        """ the exception raised by the request, if any """
+
+
+class EndpointStats:
+    """ aggregated statistics of the requests to one endpoint """
+    # pylint: disable=too-many-instance-attributes
+    latency_buckets: tuple = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+    """ upper bounds (in seconds) of the latency histogram, the last bucket is unbounded """
+
+    def __init__(self):
+        self.requests: int = 0
+        """ number of requests """
+        self.errors: int = 0
+        """ number of requests that raised """
+        self.cache_hits: int = 0
+        """ number of requests answered by the cache """
+        self.cache_misses: int = 0
+        """ number of requests to a cached endpoint that were not in the cache """
+        self.coalesced: int = 0
+        """ number of requests that shared an identical request in flight """
+        self.retries: int = 0
+        """ number of retried attempts """
+        self.response_bytes: int = 0
+        """ total size of the response bodies """
+        self.status_codes: Dict[int, int] = {}
+        """ number of responses per http status """
+        self.latency_counts: List[int] = [0] * (len(self.latency_buckets) + 1)
+        """ number of requests per latency bucket """
+        self.latency_total: float = 0.0
+        """ sum of the latencies (seconds) """
+        self.latency_max: float = 0.0
+        """ the longest latency (seconds) """
+
+    def add(self, info: RequestInfo):
+        """ count one request """
+        self.requests += 1
+        if info.error is not None:
+            self.errors += 1
+        if info.cache_hit is not None:
+            if info.cache_hit:
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
+        if info.coalesced:
+            self.coalesced += 1
+        self.retries += info.retries
+        self.response_bytes += info.response_bytes
+        if info.status_code is not None:
+            self.status_codes[info.status_code] = self.status_codes.get(info.status_code, 0) + 1
+        self.latency_counts[bisect.bisect_left(self.latency_buckets, info.elapsed)] += 1
+        self.latency_total += info.elapsed
+        self.latency_max = max(self.latency_max, info.elapsed)
+
+    @property
+    def latency_mean(self) -> float:
+        """ average latency (seconds) """
+        return self.latency_total / self.requests if self.requests else 0.0
+
+    def latency_percentile(self, percentile: float) -> float:
+        """
+        Estimate of a latency percentile (seconds) from the histogram
+
+        :param percentile: 0 - 100
+        :return: the upper bound of the bucket holding the percentile (latency_max for the
+            unbounded bucket)
+        """
+        if not self.requests:
+            return 0.0
+        rank: int = max(1, math.ceil(self.requests * percentile / 100))
+        seen: int = 0
+        index: int = 0
+        for index, count in enumerate(self.latency_counts):
+            seen += count
+            if seen >= rank:
+                break
+        if index < len(self.latency_buckets):
+            return min(self.latency_buckets[index], self.latency_max)
+        return self.latency_max
+
+
+class ClientStats:
+    """
+    Thread safe aggregated statistics of a client, per endpoint
+
+    Example::
+
+        api = ApexLegendsAPI(api_key, stats=ClientStats())
+        ...
+        snapshot = api.stats.snapshot()
+        print(snapshot['basic'].latency_percentile(95))
+    """
+    def __init__(self):
+        self._endpoints: Dict[str, EndpointStats] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def record(self, info: RequestInfo):
+        """ count a request (the client calls this for every request) """
+        with self._lock:
+            endpoint_stats: EndpointStats = self._endpoints.get(info.endpoint)
+            if endpoint_stats is None:
+                endpoint_stats = self._endpoints[info.endpoint] = EndpointStats()
+            endpoint_stats.add(info)
+
+    def snapshot(self) -> Dict[str, EndpointStats]:
+        """ a consistent copy of the statistics, keyed on endpoint """
+        with self._lock:
+            return copy.deepcopy(self._endpoints)
+
+    def reset(self):
+        """ forget every recorded request """
+        with self._lock:
+            self._endpoints = {}
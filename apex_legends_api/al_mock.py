@@ -0,0 +1,445 @@
+"""
+al_mock.py
+local stand-in for the apex legends api (``/bridge``, ``/nametouid`` and ``/origin``) with
+synthetic players, configurable latency, rate limiting (429) and error injection
+
+Usage::
+
+    with MockAPIServer(players=10000, latency=lognormal_latency(0.05, 0.5), rate=30) as server:
+        api = ApexLegendsAPI(api_key='key', **server.client_urls())
+        player = api.get_player_by_uid(server.uid(42), ALPlatform.PC)
+
+or from the command line: ``python -m apex_legends_api.al_mock --port 8080 --players 10000``
+"""
+import argparse
+import functools
+import json
+import math
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+LatencyDistribution = Callable[[random.Random], float]
+""" returns the latency (in seconds) of one response """
+
+UID_BASE: int = 1000000000000
+""" uid of the player with index 0, the player with index ``n`` has uid ``UID_BASE + n`` """
+LEGENDS: tuple = (
+    'Bangalore', 'Bloodhound', 'Lifeline', 'Caustic', 'Gibraltar', 'Mirage', 'Pathfinder',
+    'Wraith', 'Octane', 'Wattson', 'Crypto', 'Revenant', 'Loba', 'Rampart', 'Horizon', 'Fuse'
+)
+TRACKERS: tuple = (
+    ('kills', 'Kills'), ('damage', 'Damage'), ('games_played', 'Games Played'),
+    ('top_3', 'Top 3'), ('wins_season_9', 'Season 9 Wins'), ('kills_season_9', 'Season 9 Kills'),
+    ('specialEvent_kills', 'Special event kills'), ('specialEvent_damage', 'Special event damage'),
+    ('specialEvent_wins', 'Special event wins'), ('arenas_kills', 'Arenas Kills'),
+    ('headshots', 'Headshots'), ('revives', 'Revives'),
+)
+RANKS: tuple = ('Bronze', 'Silver', 'Gold', 'Platinum', 'Diamond', 'Master', 'Apex Predator')
+
+
+def constant_latency(seconds: float) -> LatencyDistribution:
+    """ every response takes the same time """
+    return lambda rng: seconds
+
+
+def uniform_latency(low: float, high: float) -> LatencyDistribution:
+    """ latency uniformly distributed between low and high seconds """
+    return lambda rng: rng.uniform(low, high)
+
+
+def lognormal_latency(median: float, sigma: float = 0.5) -> LatencyDistribution:
+    """ long tailed latency: log-normal with the given median (seconds) and shape """
+    return lambda rng: rng.lognormvariate(math.log(median), sigma)
+
+
+def tracker(rng: random.Random, key: str, name: str, ranked: bool) -> dict:
+    """ a single synthetic tracker (as in the api responses), optionally with its rank """
+    data: dict = {'name': name, 'value': rng.randint(0, 50000), 'key': key}
+    if ranked:
+        data['rank'] = {'rankPos': rng.randint(1, 500000), 'topPercent': rng.random() * 100}
+    return data
+
+
+def _legend(rng: random.Random, name: str, trackers: int, skip_rank: bool) -> dict:
+    """ the stats of one legend """
+    return {
+        'data': [tracker(rng, key, tracker_name, ranked=not skip_rank)
+                 for key, tracker_name in rng.sample(TRACKERS, trackers)],
+        'ImgAssets': {
+            'icon': f'https://api.mozambiquehe.re/assets/icons/{name.lower()}.png',
+            'banner': f'https://api.mozambiquehe.re/assets/banners/{name.lower()}.jpg'
+        }
+    }
+
+
+def player_stats(
+        index: int, platform: str = 'PC', seed: int = 0, trackers_per_legend: int = 3,
+        skip_rank: bool = False
+) -> dict:
+    """
+    The basic_player_stats response of the synthetic player ``index`` (the same for a seed)
+
+    :param index: index of the player (see UID_BASE)
+    :param platform: platform value reported in the response
+    :param seed: seed of the random values
+    :param trackers_per_legend: trackers on every legend
+    :param skip_rank: if True the trackers have no rank (like ``skipRank``)
+    """
+    rng: random.Random = random.Random(f'{seed}:stats:{index}')
+    legends: Dict[str, dict] = {
+        name: _legend(rng, name, min(trackers_per_legend, len(TRACKERS)), skip_rank)
+        for name in LEGENDS
+    }
+    selected_name: str = rng.choice(LEGENDS)
+    selected: dict = dict(legends[selected_name], LegendName=selected_name, gameInfo={
+        'skin': 'Default', 'frame': 'Default', 'pose': 'Default', 'intro': 'None',
+        'badges': [{'name': 'Chaos Theory Master', 'value': 0, 'category': 'Account Badges'}]
+    })
+    online: bool = rng.random() < 0.3
+    rank_name: str = rng.choice(RANKS)
+    return {
+        'global': {
+            'name': f'Player{index}', 'uid': str(UID_BASE + index), 'avatar': 'avatar.JPEG',
+            'platform': platform, 'level': rng.randint(1, 500),
+            'toNextLevelPercent': rng.randint(0, 99), 'internalUpdateCount': 0,
+            'bans': {'isActive': False, 'remainingSeconds': 0, 'last_banReason': 'NONE'},
+            'rank': {
+                'rankScore': rng.randint(0, 20000), 'rankName': rank_name,
+                'rankDiv': rng.randint(1, 4), 'ladderPosPlatform': -1,
+                'rankImg': f'https://api.mozambiquehe.re/assets/ranks/{rank_name.lower()}.png',
+                'rankedSeason': 'season09_split_1'
+            },
+            'badges': [{'name': 'Chaos Theory Master', 'value': 0}]
+        },
+        'realtime': {
+            'lobbyState': rng.choice(('open', 'invite')), 'isOnline': int(online),
+            'isInGame': int(online and rng.random() < 0.5), 'canJoin': 0, 'partyFull': 0,
+            'selectedLegend': selected_name
+        },
+        'legends': {'selected': selected, 'all': legends},
+    }
+
+
+def player_events(index: int, count: int, seed: int = 0) -> List[dict]:
+    """
+    The event history (ALAction.GET response) of the synthetic player ``index``, newest first
+
+    Discussion:
+        About 70% games (1 to 3 trackers each), 20% sessions, 7% level ups and 3% rank changes
+    """
+    rng: random.Random = random.Random(f'{seed}:events:{index}')
+    uid: str = str(UID_BASE + index)
+    timestamp: int = 1616879521
+    history: List[dict] = []
+    for _event in range(count):
+        event: dict = {'uid': uid, 'player': f'Player{index}', 'timestamp': timestamp}
+        kind: float = rng.random()
+        if kind < 0.7:
+            event.update(eventType='Game', xpProgress=rng.randint(0, 20000),
+                         gameLength=rng.randint(1, 25), legendPlayed=rng.choice(LEGENDS),
+                         rankScoreChange=str(rng.randint(-48, 200)),
+                         event=[tracker(rng, key, name, ranked=False)
+                                for key, name in rng.sample(TRACKERS, rng.randint(1, 3))])
+        elif kind < 0.9:
+            action: str = rng.choice(('join', 'leave'))
+            event.update(eventType='Session', event={'action': action} if action == 'join' else {
+                'action': action, 'sessionDuration': rng.randint(60, 20000)
+            })
+        elif kind < 0.97:
+            event.update(eventType='Level', event={'newLevel': rng.randint(1, 500)})
+        else:
+            event.update(eventType='Rank', event={'newRank': 'Gold 3', 'newRankImg': ''})
+        history.append(event)
+        timestamp -= rng.randint(60, 3000)
+    return history
+
+
+class _RateLimiter:  # pylint: disable=too-few-public-methods
+    """ non blocking token bucket per api key """
+    def __init__(self, rate: float, capacity: float):
+        self.rate: float = rate
+        self.capacity: float = capacity
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def try_acquire(self, key: str) -> float:
+        """ take a token, returns 0 on success or the seconds until a token is available """
+        with self._lock:
+            now: float = time.monotonic()
+            tokens, updated = self._buckets.get(key, (self.capacity, now))
+            tokens = min(self.capacity, tokens + (now - updated) * self.rate)
+            if tokens >= 1:
+                self._buckets[key] = (tokens - 1, now)
+                return 0.0
+            self._buckets[key] = (tokens, now)
+            return (1 - tokens) / self.rate
+
+
+class MockAPIServer:
+    """
+    Local http server answering like the apex legends api (same payload shapes as the fixtures
+    in tests/responses)
+
+    Discussion:
+        Players are generated on demand from their index (uid ``UID_BASE + index`` or name
+        ``Player<index>``), so any number of players costs no memory up front. Every response
+        waits for a latency drawn from ``latency``, requests above ``rate`` per second (per api
+        key) get a 429 with a ``Retry-After`` header and ``error_rate`` of the requests fail
+        with one of ``error_statuses``.
+
+        Counters of the requests / responses are kept in ``counts``.
+    """
+    # pylint: disable=too-many-instance-attributes,too-many-arguments
+    def __init__(
+            self,
+            host: str = '127.0.0.1',
+            port: int = 0,
+            players: int = 1000,
+            events_per_player: int = 100,
+            trackers_per_legend: int = 3,
+            latency: LatencyDistribution = None,
+            rate: float = None,
+            capacity: float = None,
+            error_rate: float = 0.0,
+            error_statuses: tuple = (500, 502, 503),
+            seed: int = 0
+    ):
+        """
+        :param host: interface to listen on
+        :param port: port to listen on (0 for any free port)
+        :param players: number of synthetic players
+        :param events_per_player: length of every player's event history
+        :param trackers_per_legend: trackers on every legend of a player
+        :param latency: latency distribution of the responses (None for no added latency)
+        :param rate: requests per second allowed per api key (None for no limit)
+        :param capacity: requests allowed at once per api key (defaults to ``rate``)
+        :param error_rate: fraction of the requests answered with an error status
+        :param error_statuses: statuses the injected errors are picked from
+        :param seed: seed of the synthetic data (the same seed serves the same players)
+        """
+        self.players: int = players
+        self.events_per_player: int = events_per_player
+        self.trackers_per_legend: int = trackers_per_legend
+        self.latency: LatencyDistribution = latency
+        self.error_rate: float = error_rate
+        self.error_statuses: tuple = error_statuses
+        self.seed: int = seed
+        self.counts: Dict[str, int] = {}
+        """ number of requests per path and of responses per status ('status_429', ...) """
+        self.tracked: set = set()
+        """ (uid, platform) of the players added with ALAction.ADD (guarded by the lock) """
+        self._limiter: _RateLimiter = None if rate is None else _RateLimiter(
+            rate, capacity if capacity is not None else max(rate, 1)
+        )
+        self._rng: random.Random = random.Random(seed)
+        self._lock: threading.Lock = threading.Lock()
+        self._thread: threading.Thread = None
+        self._stats: Callable[[int, str, bool], dict] = functools.lru_cache(maxsize=4096)(
+            self._build_stats
+        )
+        """ cached _build_stats (generating the stats is not what is being measured) """
+        self._events: Callable[[int], list] = functools.lru_cache(maxsize=1024)(self._build_events)
+        """ cached _build_events """
+        self._server: ThreadingHTTPServer = ThreadingHTTPServer((host, port), _handler(self))
+        self._server.daemon_threads = True
+
+    @property
+    def url(self) -> str:
+        """ root url of the server """
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def client_urls(self) -> dict:
+        """ keyword arguments pointing an ApexLegendsAPI / AsyncApexLegendsAPI at the server """
+        return {
+            'base_url': f'{self.url}/bridge',
+            'nametouid_url': f'{self.url}/nametouid',
+            'origin_url': f'{self.url}/origin',
+        }
+
+    @staticmethod
+    def uid(index: int) -> str:
+        """ uid of the player with the given index """
+        return str(UID_BASE + index)
+
+    def start(self) -> 'MockAPIServer':
+        """ serve in a background thread """
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """ stop serving and close the socket """
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> 'MockAPIServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def count(self, name: str):
+        """ increment a counter """
+        with self._lock:
+            self.counts[name] = self.counts.get(name, 0) + 1
+
+    def _draw(self, distribution: Callable[[random.Random], float]) -> float:
+        """ draw from the shared random generator """
+        with self._lock:
+            return distribution(self._rng)
+
+    def player_index(self, query: dict) -> int:
+        """ index of the player a query is for (None if there is no such player) """
+        try:
+            if 'uid' in query:
+                index: int = int(query['uid']) - UID_BASE
+            else:
+                name: str = query.get('player', '')
+                index = int(name[len('Player'):]) if name.startswith('Player') else -1
+        except ValueError:
+            return None
+        return index if 0 <= index < self.players else None
+
+    def respond(self, path: str, query: dict, api_key: str) -> Tuple[int, dict, object]:
+        """
+        Answer a request
+
+        :return: (status, headers, json body)
+        """
+        self.count(path)
+        if self.latency is not None:
+            time.sleep(max(0.0, self._draw(self.latency)))
+        if self._limiter is not None:
+            retry_after: float = self._limiter.try_acquire(api_key or '')
+            if retry_after:
+                # fractional seconds (RetryPolicy.parse_retry_after accepts them) so clients
+                # can be tested at high rates
+                return 429, {'Retry-After': f'{retry_after:.3f}'}, {
+                    'Error': 'Rate limit exceeded'
+                }
+        if self.error_rate and self._draw(lambda rng: rng.random()) < self.error_rate:
+            return self._draw(lambda rng: rng.choice(self.error_statuses)), {}, {
+                'Error': 'Injected error'
+            }
+        handlers: dict = {'/bridge': self._bridge, '/nametouid': self._nametouid,
+                          '/origin': self._origin}
+        if path not in handlers:
+            return 404, {}, {'Error': 'Unknown endpoint'}
+        return handlers[path](query)
+
+    def _bridge(self, query: dict) -> Tuple[int, dict, object]:
+        """ basic stats and events """
+        platform: str = query.get('platform', 'PC')
+        if query.get('history') == '1' and query.get('action', '').lower() == 'info':
+            with self._lock:
+                tracked: list = sorted(self.tracked)
+            return 200, {}, {'registered': 1, 'data': [
+                {'uid': uid, 'platform': tracked_platform} for uid, tracked_platform in tracked
+            ]}
+        index: int = self.player_index(query)
+        if index is None:
+            return 200, {}, {'Error': 'Player not found. Try again?'}
+        if query.get('history') == '1':
+            action: str = query.get('action', '').lower()
+            if action == 'add':
+                with self._lock:
+                    self.tracked.add((self.uid(index), platform))
+                return 200, {}, {'result': 'Player added'}
+            if action == 'delete':
+                with self._lock:
+                    self.tracked.discard((self.uid(index), platform))
+                return 200, {}, {'result': 'Player deleted'}
+            return 200, {}, self._events(index)
+        return 200, {}, self._stats(index, platform, query.get('skipRank', '').lower() == 'true')
+
+    def _nametouid(self, query: dict) -> Tuple[int, dict, object]:
+        """ player name to uid """
+        index: int = self.player_index({'player': query.get('player', '')})
+        if index is None:
+            return 200, {}, {'Error': 'Player not found'}
+        return 200, {}, {'result': UID_BASE + index}
+
+    def _origin(self, query: dict) -> Tuple[int, dict, object]:
+        """ origin account of a player """
+        index: int = self.player_index({'player': query.get('player', '')})
+        if index is None:
+            return 200, {}, {'Error': 'Player not found'}
+        uid: str = self.uid(index)
+        return 200, {}, {'name': f'Player{index}', 'uid': uid, 'pid': uid, 'avatar': 'avatar.JPEG'}
+
+    def _build_stats(self, index: int, platform: str, skip_rank: bool) -> dict:
+        """ basic stats of a player """
+        return player_stats(index, platform, self.seed, self.trackers_per_legend, skip_rank)
+
+    def _build_events(self, index: int) -> list:
+        """ event history of a player """
+        return player_events(index, self.events_per_player, self.seed)
+
+
+def _handler(server: MockAPIServer) -> type:
+    """ the request handler class of a server """
+    class Handler(BaseHTTPRequestHandler):
+        """ answers GET requests through MockAPIServer.respond """
+        protocol_version = 'HTTP/1.1'
+
+        def do_GET(self):  # pylint: disable=invalid-name
+            """ answer a request """
+            split = urlsplit(self.path)
+            query: dict = {
+                key: values[-1]
+                for key, values in parse_qs(split.query, keep_blank_values=True).items()
+            }
+            status, headers, body = server.respond(
+                split.path.rstrip('/'), query, self.headers.get('Authorization')
+            )
+            server.count(f'status_{status}')
+            payload: bytes = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):  # pylint: disable=arguments-differ
+            """ no access log """
+    return Handler
+
+
+def main():
+    """ run the mock server from the command line """
+    parser = argparse.ArgumentParser(description='Local stand-in for the apex legends api')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--players', type=int, default=1000)
+    parser.add_argument('--events', type=int, default=100, help='events per player')
+    parser.add_argument('--latency', type=float, default=0.0, help='median latency (seconds)')
+    parser.add_argument('--latency-sigma', type=float, default=0.5,
+                        help='shape of the log-normal latency distribution')
+    parser.add_argument('--rate', type=float, default=None, help='requests per second per key')
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    server: MockAPIServer = MockAPIServer(
+        host=args.host, port=args.port, players=args.players, events_per_player=args.events,
+        latency=lognormal_latency(args.latency, args.latency_sigma) if args.latency else None,
+        rate=args.rate, error_rate=args.error_rate, seed=args.seed
+    )
+    print(f'serving on {server.url} (players {server.uid(0)} - {server.uid(args.players - 1)})')
+    try:
+        server.start()._thread.join()  # pylint: disable=protected-access
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,257 @@
+"""
+al_presence.py
+adaptive polling of the players' realtime presence (online / in game / lobby / legend)
+"""
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Dict, List, Tuple
+from .al_base import ALPlatform  # noqa E0402
+from .al_domain import RealtimeInfo  # noqa E0402
+from .al_ratelimit import TokenBucket  # noqa E0402
+
+if TYPE_CHECKING:
+    from .al_api import ApexLegendsAPI  # noqa E0402
+
+PRESENCE_FIELDS: tuple = ('is_online', 'is_in_game', 'lobby_state', 'selected_legend')
+""" the RealtimeInfo attributes a change is reported for """
+
+
+# pylint: disable=too-few-public-methods
+class PresenceChange:
+    """ a change of a player's realtime presence """
+    __slots__ = ('uid', 'platform', 'previous', 'current', 'changed', 'timestamp')
+
+    def __init__(
+            self, uid: str, platform: ALPlatform, previous: RealtimeInfo, current: RealtimeInfo,
+            timestamp: float
+    ):
+        self.uid: str = uid
+        """ UID of the player """
+        self.platform: ALPlatform = platform
+        """ platform of the player """
+        self.previous: RealtimeInfo = previous
+        """ the presence before the change (None on the first poll) """
+        self.current: RealtimeInfo = current
+        """ the presence after the change """
+        self.changed: Tuple[str] = tuple(
+            field for field in PRESENCE_FIELDS
+            if previous is None or getattr(previous, field) != getattr(current, field)
+        )
+        """ names of the RealtimeInfo attributes that changed """
+        self.timestamp: float = timestamp
+        """ time.time() when the change was seen """
+
+
+# pylint: disable=too-few-public-methods
+class _WatchedPlayer:
+    """ polling state of a single player """
+    __slots__ = ('uid', 'platform', 'realtime', 'interval', 'errors', 'token')
+
+    def __init__(self, uid: str, platform: ALPlatform):
+        self.uid: str = uid
+        self.platform: ALPlatform = platform
+        self.realtime: RealtimeInfo = None
+        self.interval: float = 0.0
+        self.errors: int = 0
+        self.token: int = None
+        """ sequence number of the player's schedule entry, other entries for it are stale """
+
+
+class PresencePoller:
+    """
+    Poll the realtime presence of many players, each at its own adaptive interval
+
+    Discussion:
+        A player in a game is polled every ``in_game_interval`` seconds and an online player
+        every ``online_interval`` seconds. While a player is offline (or the lookup fails) the
+        interval starts at ``offline_interval`` and is multiplied by ``backoff`` after every poll,
+        up to ``max_interval``; it drops back as soon as the player comes online.
+
+        Every request takes a token from ``budget``, so the poller as a whole never sends more
+        than ``budget.rate`` requests per second, however many players are watched. Requests are
+        sent with ``skip_tracker_rank`` and only the ``realtime`` part of the response is parsed.
+
+        Only changes are reported, through ``callback`` and / or ``poll`` / ``changes``.
+
+    Example::
+
+        poller = PresencePoller(api, budget=TokenBucket(rate=2), callback=print_change)
+        for uid in uids:
+            poller.add(uid, ALPlatform.PC)
+        poller.run(stop_event)
+    """
+    # pylint: disable=too-many-instance-attributes,too-many-arguments
+    def __init__(
+            self,
+            api: 'ApexLegendsAPI',
+            budget: TokenBucket = None,
+            callback: Callable[[PresenceChange], None] = None,
+            in_game_interval: float = 15,
+            online_interval: float = 30,
+            offline_interval: float = 60,
+            max_interval: float = 30 * 60,
+            backoff: float = 2.0,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        :param api: the client used for the lookups
+        :param budget: TokenBucket shared by every request of the poller (default: 1 per second)
+        :param callback: called with every PresenceChange
+        :param in_game_interval: seconds between polls while the player is in a game
+        :param online_interval: seconds between polls while the player is online
+        :param offline_interval: first interval once the player is offline
+        :param max_interval: the longest interval while offline
+        :param backoff: factor the offline interval grows by after every poll
+        :param clock: monotonic clock the schedule runs on
+        """
+        self.api: 'ApexLegendsAPI' = api
+        self.budget: TokenBucket = budget if budget is not None else TokenBucket(rate=1)
+        self.callback: Callable[[PresenceChange], None] = callback
+        self.in_game_interval: float = in_game_interval
+        self.online_interval: float = online_interval
+        self.offline_interval: float = offline_interval
+        self.max_interval: float = max_interval
+        self.backoff: float = backoff
+        self.clock: Callable[[], float] = clock
+        self._players: Dict[tuple, _WatchedPlayer] = {}
+        self._schedule: List[tuple] = []
+        self._sequence = itertools.count()
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._players)
+
+    def add(self, uid: str, platform: ALPlatform):
+        """ Start watching a player, the first poll is due immediately """
+        key: tuple = (str(uid), platform)
+        with self._lock:
+            if key not in self._players:
+                player: _WatchedPlayer = _WatchedPlayer(str(uid), platform)
+                self._players[key] = player
+                self._schedule_player(player, self.clock())
+
+    def _schedule_player(self, player: _WatchedPlayer, due: float):
+        """ push the player's schedule entry (call with the lock held) """
+        player.token = next(self._sequence)
+        heapq.heappush(self._schedule, (due, player.token, (player.uid, player.platform)))
+
+    def _scheduled_player(self, entry: tuple) -> _WatchedPlayer:
+        """ the player of a schedule entry, None if the entry is stale (removed / re-added) """
+        _due, token, key = entry
+        player: _WatchedPlayer = self._players.get(key)
+        return player if player is not None and player.token == token else None
+
+    def remove(self, uid: str, platform: ALPlatform):
+        """ Stop watching a player """
+        with self._lock:
+            self._players.pop((str(uid), platform), None)
+
+    def presence(self, uid: str, platform: ALPlatform) -> RealtimeInfo:
+        """ the last known presence of the player (None if not polled yet) """
+        player: _WatchedPlayer = self._players.get((str(uid), platform))
+        return None if player is None else player.realtime
+
+    def next_due(self) -> float:
+        """ clock time the next poll is due (None if no player is watched) """
+        with self._lock:
+            while self._schedule and self._scheduled_player(self._schedule[0]) is None:
+                heapq.heappop(self._schedule)
+            return self._schedule[0][0] if self._schedule else None
+
+    def _next_interval(self, player: _WatchedPlayer) -> float:
+        """ the interval until the player's next poll """
+        realtime: RealtimeInfo = player.realtime
+        if player.errors == 0 and realtime is not None and realtime.is_in_game:
+            return self.in_game_interval
+        if player.errors == 0 and realtime is not None and realtime.is_online:
+            return self.online_interval
+        if player.interval < self.offline_interval:
+            return self.offline_interval
+        return min(self.max_interval, player.interval * self.backoff)
+
+    def _fetch(self, player: _WatchedPlayer) -> RealtimeInfo:
+        """ look up the player's presence """
+        self.budget.acquire()
+        response: list = self.api.basic_player_stats_by_uid(
+            player.uid, player.platform, skip_tracker_rank=True
+        )
+        data: dict = response[0] if response and isinstance(response[0], dict) else {}
+        if 'Error' in data or 'realtime' not in data:
+            raise ValueError(data.get('Error', 'response has no realtime information'))
+        return RealtimeInfo(data['realtime'])
+
+    def _poll_player(self, player: _WatchedPlayer) -> PresenceChange:
+        """ poll one player, returns the change (if any) """
+        try:
+            realtime: RealtimeInfo = self._fetch(player)
+        except Exception:  # pylint: disable=broad-except
+            # keep the last known presence, back off like an offline player
+            player.errors += 1
+            return None
+        player.errors = 0
+        previous: RealtimeInfo = player.realtime
+        player.realtime = realtime
+        change: PresenceChange = PresenceChange(
+            player.uid, player.platform, previous, realtime, time.time()
+        )
+        return change if change.changed else None
+
+    def poll(self) -> List[PresenceChange]:
+        """
+        Poll every player that is due and reschedule them
+
+        :return: the changes seen (also passed to the callback)
+        """
+        now: float = self.clock()
+        due: List[_WatchedPlayer] = []
+        with self._lock:
+            while self._schedule and self._schedule[0][0] <= now:
+                player: _WatchedPlayer = self._scheduled_player(heapq.heappop(self._schedule))
+                if player is not None:
+                    player.token = None
+                    due.append(player)
+        changes: List[PresenceChange] = []
+        for player in due:
+            change: PresenceChange = self._poll_player(player)
+            player.interval = self._next_interval(player)
+            with self._lock:
+                # not if the player was removed (or removed and added again) during the poll
+                if self._players.get((player.uid, player.platform)) is player:
+                    self._schedule_player(player, self.clock() + player.interval)
+            if change is not None:
+                changes.append(change)
+                if self.callback is not None:
+                    self.callback(change)
+        return changes
+
+    def _wait_time(self) -> float:
+        """ seconds until the next poll is due """
+        next_due: float = self.next_due()
+        return 1.0 if next_due is None else max(0.0, next_due - self.clock())
+
+    def run(self, stop_event: threading.Event = None):
+        """
+        Poll until ``stop_event`` is set (forever if None), changes go to the callback
+        """
+        stop_event = stop_event if stop_event is not None else threading.Event()
+        while not stop_event.is_set():
+            self.poll()
+            stop_event.wait(self._wait_time())
+
+    async def changes(self) -> AsyncIterator[PresenceChange]:
+        """
+        Async iterator of the changes, the blocking lookups run in the default executor
+
+        Example::
+
+            async for change in poller.changes():
+                print(change.uid, change.changed)
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            for change in await loop.run_in_executor(None, self.poll):
+                yield change
+            await asyncio.sleep(self._wait_time())
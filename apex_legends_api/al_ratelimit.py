@@ -0,0 +1,134 @@
+"""
+al_ratelimit.py
+client side rate limiting (token bucket) and retry policy for transient http failures
+"""
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict
+
+
+class TokenBucket:
+    """
+    Thread safe token bucket
+
+    Discussion:
+        Tokens refill at ``rate`` per second up to ``capacity``. ``acquire`` reserves a token and
+        sleeps until it is available, so waiting callers are served in the order they arrived.
+        Use ``TokenBucket.for_key`` to share one bucket between every client using the same
+        API key.
+    """
+    _shared_buckets: Dict[str, 'TokenBucket'] = {}
+    _shared_lock: threading.Lock = threading.Lock()
+
+    def __init__(self, rate: float, capacity: float = None):
+        """
+        :param rate: tokens (requests) per second
+        :param capacity: maximum burst size, defaults to ``rate`` (one second worth of requests)
+        """
+        self.rate: float = float(rate)
+        self.capacity: float = float(capacity if capacity is not None else max(rate, 1))
+        self._tokens: float = self.capacity
+        self._updated: float = time.monotonic()
+        self._paused_until: float = 0.0
+        self._lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def for_key(cls, api_key: str, rate: float, capacity: float = None) -> 'TokenBucket':
+        """
+        Return the process wide bucket for the given API key (created on first use)
+
+        :param api_key: the API Key the limit applies to
+        :param rate: tokens (requests) per second, only used when the bucket is created
+        :param capacity: maximum burst size, only used when the bucket is created
+        """
+        with cls._shared_lock:
+            bucket: TokenBucket = cls._shared_buckets.get(api_key)
+            if bucket is None:
+                bucket = cls(rate=rate, capacity=capacity)
+                cls._shared_buckets[api_key] = bucket
+            return bucket
+
+    def _refill(self, now: float):
+        """ add the tokens earned since the last update """
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: float = 1) -> float:
+        """
+        Take tokens from the bucket, blocking until they are available
+
+        :return: seconds spent waiting
+        """
+        with self._lock:
+            now: float = time.monotonic()
+            self._refill(now)
+            self._tokens -= tokens
+            wait: float = max(0.0, -self._tokens / self.rate, self._paused_until - now)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def pause(self, seconds: float):
+        """ Hold every caller of ``acquire`` for the given seconds (ex: after a 429) """
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class RetryPolicy:
+    """
+    Retry policy for transient failures (429 and 5xx by default)
+
+    Discussion:
+        The delay before retry ``n`` (starting at 0) is drawn uniformly between 0 and
+        ``min(max_backoff, backoff_factor * 2 ** n)`` ("full jitter"), so many workers hitting the
+        limit at the same moment do not retry in lock step. A ``Retry-After`` header is honored
+        as the minimum delay.
+    """
+    def __init__(
+            self,
+            max_retries: int = 3,
+            backoff_factor: float = 0.5,
+            max_backoff: float = 30.0,
+            retry_statuses: tuple = (429, 500, 502, 503, 504)
+    ):
+        """
+        :param max_retries: number of retries after the first attempt
+        :param backoff_factor: base delay in seconds
+        :param max_backoff: upper bound of the jittered delay in seconds
+        :param retry_statuses: http status codes that are retried
+        """
+        self.max_retries: int = max_retries
+        self.backoff_factor: float = backoff_factor
+        self.max_backoff: float = max_backoff
+        self.retry_statuses: tuple = retry_statuses
+
+    def should_retry(self, status_code: int, attempt: int) -> bool:
+        """ True if a response with this status code should be retried """
+        return attempt < self.max_retries and status_code in self.retry_statuses
+
+    def backoff(self, attempt: int, retry_after: float = None) -> float:
+        """ seconds to wait before the given retry attempt """
+        delay: float = random.uniform(0, min(self.max_backoff, self.backoff_factor * 2 ** attempt))
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    @staticmethod
+    def parse_retry_after(value: str) -> float:
+        """
+        Parse a Retry-After header (either delay-seconds or an http date)
+
+        :return: seconds to wait, or None if the header is missing or invalid
+        """
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
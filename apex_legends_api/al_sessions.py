@@ -0,0 +1,222 @@
+"""
+al_sessions.py
+single pass sessionization of time ordered event streams (one or many players)
+"""
+import heapq
+import itertools
+from typing import Dict, Iterable, Iterator, List, Tuple
+from .al_base import ALEventType  # noqa E0402
+from .al_domain import Event, GameEvent, SessionEvent, event_timestamp  # noqa E0402
+
+
+class Session:
+    """
+    A play session of one player, from its join (or first game) to its leave (or last game)
+
+    Note:
+        ``joined`` / ``left`` are False when the join / leave event is missing, the start / end
+        are then estimated from the games (a game's timestamp is its end) or from the leave
+        event's ``session_duration``.
+    """
+    # pylint: disable=too-many-instance-attributes
+    __slots__ = ('uid', 'player', 'start', 'end', 'games', 'game_minutes', 'legends', 'trackers',
+                 'joined', 'left')
+
+    def __init__(self, uid, player: str, start: int, joined: bool):
+        self.uid = uid
+        """ UID of the player """
+        self.player: str = player
+        """ Player nick name """
+        self.start: int = start
+        """ UTC timestamp of the start of the session """
+        self.end: int = start
+        """ UTC timestamp of the end of the session (of the last activity while it is open) """
+        self.games: int = 0
+        """ number of games played """
+        self.game_minutes: int = 0
+        """ sum of the game lengths (minutes) """
+        self.legends: List[str] = []
+        """ legends played, in the order they were first played """
+        self.trackers: Dict[str, int] = {}
+        """ sum of the game trackers per DataTracker.category (ex: {'kills': 7, 'damage': 2100}) """
+        self.joined: bool = joined
+        """ True if the session started with a join event """
+        self.left: bool = False
+        """ True if the session ended with a leave event """
+
+    @property
+    def duration(self) -> int:
+        """ length of the session (seconds) """
+        return self.end - self.start
+
+    def add_game(self, game: GameEvent):
+        """ count a game played in the session """
+        self.games += 1
+        self.game_minutes += game.game_length or 0
+        if game.legend_played not in self.legends:
+            self.legends.append(game.legend_played)
+        for tracker in game.game_data_trackers:
+            if isinstance(tracker.value, int):
+                self.trackers[tracker.category] = self.trackers.get(tracker.category, 0) + \
+                    tracker.value
+        self.end = max(self.end, game.timestamp)
+
+
+class Sessionizer:
+    """
+    Streaming stage turning time ordered events into Session records
+
+    Discussion:
+        Events are consumed one at a time (``feed``) and a Session is emitted as soon as it
+        ends, only the open session of every player is kept, so memory depends on the number of
+        players active at the same time, not on the length of the histories.
+
+        A join starts a session and a leave ends it. Missing events are tolerated: a game
+        outside a session (or more than ``max_gap`` seconds after the previous activity) starts
+        one, a join while a session is open and an idle gap longer than ``max_gap`` end it at its
+        last activity.
+
+        The events of a player have to be oldest first (``reversed(player.events)``). When the
+        events of every player are in one time order (see merge_events) sessions are also closed
+        as soon as the stream is ``max_gap`` past their last activity; with
+        ``global_order=False`` (players fed one after the other) they are closed by the
+        player's next event or by ``flush``.
+
+    Example::
+
+        sessionizer = Sessionizer()
+        for event in merge_events(reversed(player.events) for player in players):
+            for session in sessionizer.feed(event):
+                store(session)
+        for session in sessionizer.flush():
+            store(session)
+    """
+    def __init__(self, max_gap: int = 2 * 60 * 60, global_order: bool = True):
+        """
+        :param max_gap: seconds of inactivity after which a session without a leave event ends
+        :param global_order: True if the events of all players are in one time order
+        """
+        self.max_gap: int = max_gap
+        self.global_order: bool = global_order
+        self._open: Dict[object, Session] = {}
+        self._deadlines: List[Tuple[int, int, Session]] = []
+        self._sequence: Iterator[int] = itertools.count()
+
+    @property
+    def open_sessions(self) -> int:
+        """ number of sessions in progress """
+        return len(self._open)
+
+    def feed(self, event: Event) -> List[Session]:
+        """
+        Consume one event
+
+        :return: the sessions that ended (usually none or one)
+        :raises ValueError: if the event is older than the player's previous event
+        """
+        closed: List[Session] = []
+        timestamp: int = event_timestamp(event)
+        if self.global_order:
+            self._expire(timestamp, closed)
+        session: Session = self._open.get(event.uid)
+        if session is not None and timestamp < session.end:
+            raise ValueError(
+                f'events of player {event.uid} are not in time order '
+                f'({timestamp} after {session.end})'
+            )
+        if session is not None and timestamp - session.end > self.max_gap and \
+                event.event_type is not ALEventType.SESSION:
+            closed.append(self._close(session))
+            session = None
+
+        if event.event_type is ALEventType.SESSION:
+            session = self._session_event(event, session, timestamp, closed)
+        elif event.event_type is ALEventType.GAME:
+            if session is None:
+                session = self._start(event, timestamp - (event.game_length or 0) * 60, False)
+            session.add_game(event)
+        elif session is not None:
+            session.end = timestamp
+        return closed
+
+    def flush(self) -> List[Session]:
+        """ end every open session (at its last activity), ex: at the end of the stream """
+        closed: List[Session] = [self._close(session) for session in list(self._open.values())]
+        self._deadlines = []
+        return closed
+
+    def _session_event(
+            self, event: SessionEvent, session: Session, timestamp: int, closed: List[Session]
+    ) -> Session:
+        """ handle a join / leave """
+        if event.action == 'join':
+            if session is not None:
+                closed.append(self._close(session))
+            return self._start(event, timestamp, True)
+        if session is None:
+            session = Session(event.uid, event.player, timestamp - (event.session_duration or 0),
+                              joined=False)
+        elif not session.joined and event.session_duration:
+            session.start = min(session.start, timestamp - event.session_duration)
+        session.end = timestamp
+        session.left = True
+        closed.append(self._close(session))
+        return None
+
+    def _start(self, event: Event, start: int, joined: bool) -> Session:
+        """ open a session """
+        session: Session = Session(event.uid, event.player, start, joined)
+        session.end = max(start, event_timestamp(event))
+        self._open[event.uid] = session
+        if self.global_order:
+            heapq.heappush(
+                self._deadlines, (session.end + self.max_gap, next(self._sequence), session)
+            )
+        return session
+
+    def _close(self, session: Session) -> Session:
+        """ end a session """
+        if self._open.get(session.uid) is session:
+            del self._open[session.uid]
+        return session
+
+    def _expire(self, now: int, closed: List[Session]):
+        """ end the sessions idle for more than max_gap at ``now`` """
+        deadlines: List[Tuple[int, int, Session]] = self._deadlines
+        while deadlines and deadlines[0][0] < now:
+            _deadline, _sequence, session = heapq.heappop(deadlines)
+            if self._open.get(session.uid) is not session:
+                continue
+            if session.end + self.max_gap < now:
+                closed.append(self._close(session))
+            else:
+                # active since the entry was pushed, one entry per open session is kept
+                heapq.heappush(
+                    deadlines, (session.end + self.max_gap, next(self._sequence), session)
+                )
+
+
+def merge_events(streams: Iterable[Iterable[Event]]) -> Iterator[Event]:
+    """
+    Merge the time ordered (oldest first) event streams of many players into one time order
+
+    Note:
+        lazy, only the next event of every stream is held in memory
+    """
+    return heapq.merge(*streams, key=event_timestamp)
+
+
+def sessionize(
+        events: Iterable[Event], max_gap: int = 2 * 60 * 60, global_order: bool = True
+) -> Iterator[Session]:
+    """
+    Sessions of a time ordered event stream (see Sessionizer), in the order they end
+
+    :param events: events, oldest first for every player
+    :param max_gap: seconds of inactivity after which a session without a leave event ends
+    :param global_order: True if the events of all players are in one time order
+    """
+    sessionizer: Sessionizer = Sessionizer(max_gap=max_gap, global_order=global_order)
+    for event in events:
+        yield from sessionizer.feed(event)
+    yield from sessionizer.flush()
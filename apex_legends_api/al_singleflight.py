@@ -0,0 +1,117 @@
+"""
+al_singleflight.py
+coalescing of identical requests that are in flight at the same time
+"""
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+# pylint: disable=too-few-public-methods
+class _Call:
+    """ a request in flight and the callers waiting on it """
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done: threading.Event = threading.Event()
+        self.result: Any = None
+        self.error: BaseException = None
+
+
+class SingleFlight:
+    """
+    Thread safe request coalescing
+
+    Discussion:
+        While a call for a key is running, other threads calling ``do`` with the same key wait
+        for it and get its result (or its exception) instead of running their own. Once the call
+        returns the key is released, the next ``do`` runs the function again (this is not a
+        cache, see ResponseCache for that).
+    """
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock: threading.Lock = threading.Lock()
+        self.coalesced: int = 0
+        """ number of callers that shared the result of another caller's request """
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def do(self, key: Hashable, function: Callable[[], Any]) -> Any:
+        """
+        Run ``function``, unless a call with the same key is already running, then wait for it
+
+        :param key: identifies identical requests (ex: ResponseCache.make_key(url, params))
+        :param function: the request to run
+        :return: the result of the function (shared by every coalesced caller)
+        """
+        with self._lock:
+            call: _Call = self._calls.get(key)
+            leader: bool = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+            else:
+                self.coalesced += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = function()
+        except BaseException as error:  # pylint: disable=broad-except
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class AsyncSingleFlight:
+    """
+    Request coalescing for coroutines running in one event loop
+
+    Discussion:
+        Same as SingleFlight: while a coroutine for a key is running, other callers awaiting
+        ``do`` with the same key share its result (or its exception).
+
+        The request runs in its own task that every caller (the first one included) awaits
+        through ``asyncio.shield``, so a cancelled caller (ex: ``asyncio.wait_for`` timing out)
+        only cancels its own wait, never the request the other callers are waiting on.
+    """
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self.coalesced: int = 0
+        """ number of callers that shared the result of another caller's request """
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, function: Callable[[], Awaitable]) -> Any:
+        """
+        Await ``function()``, unless a call with the same key is already running, then wait
+        for it
+
+        :param key: identifies identical requests
+        :param function: returns the coroutine of the request
+        :return: the result of the coroutine (shared by every coalesced caller)
+        """
+        task: asyncio.Task = self._calls.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            task = asyncio.ensure_future(function())
+            self._calls[key] = task
+            task.add_done_callback(lambda done: self._release(key, done))
+        return await asyncio.shield(task)
+
+    def _release(self, key: Hashable, task: asyncio.Task):
+        """ forget a finished request """
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # the callers get the exception through shield, do not warn when they all left
+            task.exception()
@@ -0,0 +1,344 @@
+"""
+al_snapshot.py
+serialization of ALPlayer objects (plain dictionaries and a compact binary snapshot)
+"""
+import abc
+import marshal
+import struct
+import sys
+from typing import Callable, List, Tuple
+from .al_base import ALEventType, ALPlatform  # noqa E0402
+from .al_domain import (  # noqa E0402
+    ALPlayer, DataTracker, Event, GameEvent, GameInfo, GlobalInfo, ImgAsset, Legend, LevelEvent,
+    RankEvent, RealtimeInfo, SessionEvent, event_timestamp
+)
+from .al_tracker_keys import TrackerKey, tracker_keys  # noqa E0402
+
+SNAPSHOT_MAGIC: bytes = b'ALPS'
+""" first bytes of every binary snapshot """
+SNAPSHOT_VERSION: int = 2
+""" version of the snapshot layout, bumped whenever a field is added / removed / reordered """
+_HEADER: struct.Struct = struct.Struct('<4sHBBB')
+""" magic, SNAPSHOT_VERSION, marshal.version and the python major / minor version """
+_RUNTIME: tuple = (marshal.version, sys.version_info[0], sys.version_info[1])
+""" the marshal format is only guaranteed to be readable by the python version that wrote it """
+_UNSET = ...
+""" marks an optional attribute that is not set on the object (ex: GameInfo.skin) """
+
+
+class _Codec(abc.ABC):
+    """ converts an attribute value to its serialized form and back """
+    @abc.abstractmethod
+    def encode(self, value, positional: bool):
+        """ object -> serialized value """
+
+    @abc.abstractmethod
+    def decode(self, value, positional: bool):
+        """ serialized value -> object """
+
+    def positional_decoder(self) -> Callable:
+        """ a single argument function decoding a positional value (the snapshot hot path) """
+        return lambda value: self.decode(value, True)
+
+
+class _EnumCodec(_Codec):
+    """ enums are stored as their value """
+    def __init__(self, enum_class):
+        self.enum_class = enum_class
+
+    def encode(self, value, positional: bool):
+        return value.value
+
+    def decode(self, value, positional: bool):
+        return self.enum_class(value)
+
+    def positional_decoder(self) -> Callable:
+        return {member.value: member for member in self.enum_class}.__getitem__
+
+
+class _ListCodec(_Codec):
+    """ list of values of the same kind """
+    def __init__(self, item_codec: _Codec):
+        self.item_codec: _Codec = item_codec
+
+    def encode(self, value, positional: bool):
+        encode: Callable = self.item_codec.encode
+        return [encode(item, positional) for item in value]
+
+    def decode(self, value, positional: bool):
+        decode: Callable = self.item_codec.decode
+        return [decode(item, positional) for item in value]
+
+    def positional_decoder(self) -> Callable:
+        decode: Callable = self.item_codec.positional_decoder()
+        return lambda value: [decode(item) for item in value]
+
+
+class _Schema(_Codec):
+    """
+    The serialized fields of a class
+
+    Discussion:
+        Objects are restored with ``cls.__new__`` and their attributes are set directly, none of
+        the parsing done by the constructors runs again. Positionally the object is a tuple of
+        the field values in ``fields`` order, as a dictionary it is keyed on the field names.
+    """
+    def __init__(
+            self, cls: type, fields: List[Tuple[str, str, _Codec]], restore: Callable = None
+    ):
+        """
+        :param cls: the class
+        :param fields: (name, attribute, codec or None for plain values) of every field
+        :param restore: called with the restored object, sets what is not serialized
+        """
+        self.cls: type = cls
+        self.fields: List[Tuple[str, str, _Codec]] = fields
+        self.restore: Callable = restore
+        self._decode_positional: Callable = None
+
+    def positional_decoder(self) -> Callable:
+        if self._decode_positional is None:
+            self._decode_positional = self._positional_decoder()
+        return self._decode_positional
+
+    def _positional_decoder(self) -> Callable:
+        """
+        The function restoring an object from its tuple
+
+        Discussion:
+            Restoring snapshots is the hot path: the decoders of the nested fields are looked up
+            once per class, not once per object.
+        """
+        cls: type = self.cls
+        restore: Callable = self.restore
+        fields: List[Tuple[str, Callable]] = [
+            (attribute, None if codec is None else codec.positional_decoder())
+            for _name, attribute, codec in self.fields
+        ]
+
+        def decode(value):
+            obj = cls.__new__(cls)
+            for (attribute, field_decoder), field_value in zip(fields, value):
+                if field_value is _UNSET:
+                    continue
+                if field_decoder is not None and field_value is not None:
+                    field_value = field_decoder(field_value)
+                setattr(obj, attribute, field_value)
+            if restore is not None:
+                restore(obj)
+            return obj
+        return decode
+
+    def encode(self, value, positional: bool):
+        values: list = []
+        for _name, attribute, codec in self.fields:
+            field_value = getattr(value, attribute, _UNSET)
+            if field_value is not _UNSET and field_value is not None and codec is not None:
+                field_value = codec.encode(field_value, positional)
+            values.append(field_value)
+        if positional:
+            return tuple(values)
+        return {
+            name: field_value
+            for (name, _attribute, _codec), field_value in zip(self.fields, values)
+            if field_value is not _UNSET
+        }
+
+    def decode(self, value, positional: bool):
+        if positional:
+            return self.positional_decoder()(value)
+        obj = self.cls.__new__(self.cls)
+        value = [value.get(name, _UNSET) for name, _attribute, _codec in self.fields]
+        for (_name, attribute, codec), field_value in zip(self.fields, value):
+            if field_value is _UNSET:
+                continue
+            if codec is not None and field_value is not None:
+                field_value = codec.decode(field_value, positional)
+            setattr(obj, attribute, field_value)
+        if self.restore is not None:
+            self.restore(obj)
+        return obj
+
+
+def _plain(*names: str) -> List[Tuple[str, str, _Codec]]:
+    """ fields stored as is """
+    return [(name, name, None) for name in names]
+
+
+def _restore_data_tracker(tracker: DataTracker):
+    """ key id / category come from the registry (ids are only valid in this process) """
+    tracker_key: TrackerKey = tracker_keys.lookup(tracker.key)
+    tracker.key = tracker_key.key
+    tracker.key_id = tracker_key.key_id
+    tracker.category = tracker_key.category
+
+
+def _restore_legend(legend: Legend):
+    """ the tracker index is rebuilt on demand """
+    legend._trackers_by_key = None  # pylint: disable=protected-access
+
+
+def _restore_player(player: ALPlayer):
+    """ the raw data is gone and the indexes are rebuilt on demand """
+    # pylint: disable=protected-access
+    player._legends_data = None
+    player._events_data = None
+    player._legends_by_name = None
+    player._trackers_by_category = None
+    player._totals = {}
+    player._timelines = None
+    player._games_by_legend = None
+    if player._events:
+        player._events.sort(key=event_timestamp, reverse=True)
+
+
+_BADGE: _Schema = _Schema(GameInfo.Badge, _plain('name', 'value', 'category'))
+_GAME_INFO: _Schema = _Schema(
+    GameInfo, _plain('skin', 'frame', 'pose', 'intro') + [('badges', 'badges', _ListCodec(_BADGE))]
+)
+_DATA_TRACKER: _Schema = _Schema(
+    DataTracker,
+    _plain('name', 'value', 'key') + [
+        ('tracker_rank', 'tracker_rank',
+         _Schema(DataTracker.TrackerRank, _plain('position', 'percent')))
+    ],
+    restore=_restore_data_tracker
+)
+_DATA_TRACKERS: _ListCodec = _ListCodec(_DATA_TRACKER)
+_LEGEND: _Schema = _Schema(
+    Legend,
+    _plain('name') + [
+        ('data_trackers', 'data_trackers', _DATA_TRACKERS),
+        ('img_assets', 'img_assets', _Schema(ImgAsset, _plain('icon', 'banner'))),
+        ('game_info', 'game_info', _GAME_INFO),
+    ],
+    restore=_restore_legend
+)
+_GLOBAL_INFO: _Schema = _Schema(
+    GlobalInfo,
+    _plain('name', 'uid', 'avatar') + [('platform', 'platform', _EnumCodec(ALPlatform))] +
+    _plain('level', 'to_next_level_percent') + [
+        ('bans', 'bans', _Schema(
+            GlobalInfo.Bans, _plain('reason', 'is_active', 'seconds_remaining')
+        )),
+        ('rank', 'rank', _Schema(GlobalInfo.Rank, _plain(
+            'score', 'tier', 'division', 'ladder_pos_platform', 'image_url', 'season'
+        ))),
+        ('badges', 'badges', _ListCodec(_BADGE)),
+    ]
+)
+_REALTIME_INFO: _Schema = _Schema(RealtimeInfo, _plain(*RealtimeInfo.__slots__))
+_EVENT_FIELDS: list = _plain('uid', 'player', 'timestamp') + [
+    ('event_type', 'event_type', _EnumCodec(ALEventType))
+]
+_EVENT_TYPE_INDEX: int = 3
+""" position of event_type in a positional event """
+_EVENTS: dict = {
+    ALEventType.GAME.value: _Schema(GameEvent, _EVENT_FIELDS + _plain(
+        'xp_progress', 'game_length', 'legend_played', 'rank_score_change'
+    ) + [('game_data_trackers', 'game_data_trackers', _DATA_TRACKERS)]),
+    ALEventType.SESSION.value: _Schema(SessionEvent, _EVENT_FIELDS + _plain(
+        'action', 'session_duration'
+    )),
+    ALEventType.LEVEL.value: _Schema(LevelEvent, _EVENT_FIELDS + _plain('new_level')),
+    ALEventType.RANK.value: _Schema(RankEvent, _EVENT_FIELDS + _plain('new_rank')),
+}
+
+
+class _EventCodec(_Codec):
+    """ events of any type, the schema is picked on the event type """
+    def encode(self, value: Event, positional: bool):
+        return _EVENTS[value.event_type.value].encode(value, positional)
+
+    def decode(self, value, positional: bool):
+        event_type: str = value[_EVENT_TYPE_INDEX] if positional else value['event_type']
+        return _EVENTS[event_type].decode(value, positional)
+
+    def positional_decoder(self) -> Callable:
+        decoders: dict = {
+            event_type: schema.positional_decoder() for event_type, schema in _EVENTS.items()
+        }
+        return lambda value: decoders[value[_EVENT_TYPE_INDEX]](value)
+
+
+_PLAYER: _Schema = _Schema(
+    ALPlayer,
+    [
+        ('global_info', 'global_info', _GLOBAL_INFO),
+        ('realtime_info', 'realtime_info', _REALTIME_INFO),
+        ('timestamp_last_checked', 'timestamp_last_checked', None),
+        ('selected_legend', '_selected_legend', _LEGEND),
+        ('all_legends', '_all_legends', _ListCodec(_LEGEND)),
+        ('events', '_events', _ListCodec(_EventCodec())),
+    ],
+    restore=_restore_player
+)
+
+
+def _encode_player(player: ALPlayer, positional: bool):
+    """ build the lazy parts of the player, then encode it """
+    # reading the properties builds the legends / events of a lazy player
+    player.selected_legend  # pylint: disable=pointless-statement
+    player.events  # pylint: disable=pointless-statement
+    return _PLAYER.encode(player, positional)
+
+
+def to_dict(player: ALPlayer) -> dict:
+    """
+    Convert a player to a dictionary of plain values (json serializable)
+
+    Note:
+        Attributes are keyed on their python names (not the api names), ``version`` is the
+        SNAPSHOT_VERSION it was written with
+    """
+    player_dict: dict = _encode_player(player, positional=False)
+    player_dict['version'] = SNAPSHOT_VERSION
+    return player_dict
+
+
+def from_dict(player_dict: dict) -> ALPlayer:
+    """
+    Restore a player converted with to_dict
+
+    :raises ValueError: if the dictionary was written with another SNAPSHOT_VERSION
+    """
+    if player_dict.get('version') != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported snapshot version: {player_dict.get('version')}")
+    return _PLAYER.decode(player_dict, positional=False)
+
+
+def dumps(player: ALPlayer) -> bytes:
+    """
+    Binary snapshot of a player
+
+    Discussion:
+        The snapshot is a header (SNAPSHOT_MAGIC, SNAPSHOT_VERSION, the marshal and python
+        versions) followed by the player as nested positional tuples serialized with
+        ``marshal``. It is meant for caching players between requests, not as a long term
+        storage format: snapshots are rejected once the layout (SNAPSHOT_VERSION) changes or
+        when they were written by another python / marshal version.
+    """
+    return _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, *_RUNTIME) + marshal.dumps(
+        _encode_player(player, positional=True), 4
+    )
+
+
+def loads(snapshot: bytes) -> ALPlayer:
+    """
+    Restore a player from a binary snapshot
+
+    :raises ValueError: if the data is not a snapshot, was written with another version or by
+        another python / marshal version
+    """
+    if len(snapshot) < _HEADER.size:
+        raise ValueError('Not an ALPlayer snapshot')
+    magic, version, marshal_version, major, minor = _HEADER.unpack_from(snapshot)
+    if magic != SNAPSHOT_MAGIC:
+        raise ValueError('Not an ALPlayer snapshot')
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f'Unsupported snapshot version: {version}')
+    if (marshal_version, major, minor) != _RUNTIME:
+        raise ValueError(
+            f'Snapshot written by python {major}.{minor} (marshal version {marshal_version})'
+        )
+    return _PLAYER.positional_decoder()(marshal.loads(snapshot[_HEADER.size:]))
@@ -0,0 +1,149 @@
+"""
+al_stream.py
+incremental parsing of large json responses (event histories)
+"""
+import codecs
+import json
+from typing import Iterable, Iterator, Union
+from .al_base import ALEventType  # noqa E0402
+from .al_domain import Event, event_factory  # noqa E0402
+
+_WHITESPACE: str = ' \t\n\r'
+_SEPARATORS: str = _WHITESPACE + ',]'
+
+
+_END: object = object()
+""" returned by _next_element at the end of the array """
+
+
+class _ChunkReader:
+    """ text buffer filled on demand from an iterable of bytes / str chunks """
+    def __init__(self, chunks: Iterable[Union[bytes, str]]):
+        self.chunks: Iterator = iter(chunks)
+        self.text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self.buffer: str = ''
+        """ the decoded text not dropped yet """
+        self.position: int = 0
+        """ index of the first unread character of the buffer """
+        self.exhausted: bool = False
+
+    def _decode(self, chunk: Union[bytes, str]) -> str:
+        """ a chunk as text (bytes are decoded as utf-8, even when split mid character) """
+        return chunk if isinstance(chunk, str) else self.text_decoder.decode(chunk)
+
+    def skip(self, characters: str) -> bool:
+        """ skip the given characters, returns True if unread data is left in the buffer """
+        buffer: str = self.buffer
+        position: int = self.position
+        while position < len(buffer) and buffer[position] in characters:
+            position += 1
+        self.position = position
+        return position < len(buffer)
+
+    def read_more(self):
+        """
+        Drop what was read and append the next chunk
+
+        :raises ValueError: if the chunks were already exhausted (the json is incomplete)
+        """
+        if self.exhausted:
+            raise ValueError('truncated or invalid json array')
+        self.buffer = self.buffer[self.position:]
+        self.position = 0
+        try:
+            self.buffer += self._decode(next(self.chunks))
+        except StopIteration:
+            self.exhausted = True
+            self.buffer += self.text_decoder.decode(b'', final=True)
+
+    def rest(self) -> str:
+        """ everything not read yet, reading all the remaining chunks """
+        return self.buffer[self.position:] + ''.join(
+            self._decode(chunk) for chunk in self.chunks
+        ) + self.text_decoder.decode(b'', final=True)
+
+
+def _read_array_start(reader: _ChunkReader) -> bool:
+    """ read up to the opening bracket, returns False if the body is an object instead """
+    while not reader.skip(_WHITESPACE):
+        reader.read_more()
+    first: str = reader.buffer[reader.position]
+    if first == '{':
+        return False
+    if first != '[':
+        raise ValueError('response body is not a json array')
+    reader.position += 1
+    return True
+
+
+def _next_element(reader: _ChunkReader, decoder: json.JSONDecoder):
+    """ decode the next element of the array (_END after the closing bracket) """
+    while True:
+        if reader.skip(_WHITESPACE + ','):
+            if reader.buffer[reader.position] == ']':
+                return _END
+            try:
+                element, end = decoder.raw_decode(reader.buffer, reader.position)
+            except ValueError:
+                end = len(reader.buffer)
+            # an element is complete once it is followed by a separator, until then it may be
+            # the prefix of a longer value (ex: '-0' of '-0.5')
+            if end < len(reader.buffer) and reader.buffer[end] in _SEPARATORS:
+                reader.position = end
+                return element
+        reader.read_more()
+
+
+def iter_json_array(chunks: Iterable[Union[bytes, str]]) -> Iterator:
+    """
+    Incrementally yield the elements of a top level json array
+
+    Discussion:
+        Only the element being decoded (and the unread part of the current chunk) is kept in
+        memory, so the peak memory does not depend on the length of the array. A top level
+        object (ex: an error response) is yielded as a single element.
+
+    :param chunks: the response body in pieces (bytes are decoded as utf-8)
+    :raises ValueError: if the body is not a json array or object
+    """
+    reader: _ChunkReader = _ChunkReader(chunks)
+    if not _read_array_start(reader):
+        # not an array, the whole body is a single object
+        yield json.loads(reader.rest())
+        return
+    decoder: json.JSONDecoder = json.JSONDecoder()
+    while True:
+        element = _next_element(reader, decoder)
+        if element is _END:
+            return
+        yield element
+
+
+def iter_events(
+        event_dicts: Iterable[dict],
+        event_types: Iterable[ALEventType] = None,
+        start: int = None,
+        end: int = None
+) -> Iterator[Event]:
+    """
+    Turn raw event dictionaries into Event objects one at a time, skipping filtered out events
+    before they are parsed
+
+    :param event_dicts: raw events (ex: from iter_json_array)
+    :param event_types: only yield events of these types
+    :param start: only yield events with a timestamp >= start
+    :param end: only yield events with a timestamp < end
+    """
+    type_values: set = None if event_types is None else {
+        event_type.value for event_type in event_types
+    }
+    event_dict: dict
+    for event_dict in event_dicts:
+        if not isinstance(event_dict, dict) or 'eventType' not in event_dict:
+            continue
+        if type_values is not None and event_dict['eventType'] not in type_values:
+            continue
+        timestamp: int = event_dict.get('timestamp') or 0
+        if (start is not None and timestamp < start) or (end is not None and timestamp >= end):
+            continue
+        yield event_factory(event_dict=event_dict)
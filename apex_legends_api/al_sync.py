@@ -0,0 +1,177 @@
+"""
+al_sync.py
+incremental event sync backed by a local, deduplicated, append-only event log
+"""
+import json
+import os
+import threading
+from typing import TYPE_CHECKING, Iterator, List, Tuple
+from .al_base import ALPlatform  # noqa E0402
+from .al_domain import Event, event_factory  # noqa E0402
+
+if TYPE_CHECKING:
+    from .al_api import ApexLegendsAPI  # noqa E0402
+
+
+def event_key(event_dict: dict) -> Tuple[str, int, str]:
+    """ the (uid, timestamp, eventType) key events are deduplicated on """
+    return str(event_dict.get('uid')), event_dict.get('timestamp') or 0, event_dict.get('eventType')
+
+
+class EventLog:
+    """
+    Append-only log of raw events, deduplicated on (uid, timestamp, eventType)
+
+    Discussion:
+        For every (uid, platform) the log remembers the newest timestamp seen (the high water
+        mark) and the keys of the events at that timestamp. Anything older than the mark has
+        already been logged, so the memory used per player stays constant no matter how long
+        the history is.
+
+        With a ``path`` the log is a JSON Lines file (one ``{"platform": ..., "event": ...}``
+        record per line) that is replayed when opened, without a path it is kept in memory.
+    """
+    def __init__(self, path: str = None):
+        """
+        :param path: JSON Lines file for the log, None to keep the log in memory
+        """
+        self.path: str = path
+        self._marks: dict = {}
+        self._records: list = []
+        self._lock: threading.Lock = threading.Lock()
+        if path is not None and os.path.exists(path):
+            with open(path, encoding='utf-8') as log_file:
+                for line in log_file:
+                    if line.strip():
+                        record: dict = json.loads(line)
+                        self._advance(record['platform'], record['event'])
+
+    def high_water_mark(self, uid: str, platform: ALPlatform) -> int:
+        """ newest event timestamp logged for the player (None if nothing is logged) """
+        mark: tuple = self._marks.get((str(uid), platform.value))
+        return None if mark is None else mark[0]
+
+    def is_new(self, platform: ALPlatform, event_dict: dict) -> bool:
+        """ True if the event has not been logged yet """
+        uid, timestamp, _event_type = key = event_key(event_dict)
+        mark: tuple = self._marks.get((uid, platform.value))
+        if mark is None or timestamp > mark[0]:
+            return True
+        return timestamp == mark[0] and key not in mark[1]
+
+    def _advance(self, platform_value: str, event_dict: dict):
+        """ move the high water mark of the player past the event """
+        uid, timestamp, _event_type = key = event_key(event_dict)
+        mark: tuple = self._marks.get((uid, platform_value))
+        if mark is None or timestamp > mark[0]:
+            self._marks[(uid, platform_value)] = (timestamp, {key})
+        elif timestamp == mark[0]:
+            mark[1].add(key)
+
+    def append(self, platform: ALPlatform, event_dicts: List[dict]) -> List[dict]:
+        """
+        Log the events that have not been seen yet
+
+        :return: the newly logged events, oldest first
+        """
+        new_events: List[dict] = []
+        with self._lock:
+            for event_dict in sorted(event_dicts, key=lambda event: event.get('timestamp') or 0):
+                if self.is_new(platform, event_dict):
+                    self._advance(platform.value, event_dict)
+                    new_events.append(event_dict)
+            if not new_events:
+                return new_events
+            if self.path is None:
+                self._records.extend((platform.value, event_dict) for event_dict in new_events)
+            else:
+                with open(self.path, 'a', encoding='utf-8') as log_file:
+                    for event_dict in new_events:
+                        log_file.write(
+                            json.dumps({'platform': platform.value, 'event': event_dict}) + '\n'
+                        )
+            return new_events
+
+    def iter_event_dicts(self, uid: str = None, platform: ALPlatform = None) -> Iterator[dict]:
+        """ Replay the logged raw events, optionally only those of one player / platform """
+        if self.path is None:
+            records: Iterator = iter(list(self._records))
+        elif os.path.exists(self.path):
+            records: Iterator = self._read_records()
+        else:
+            records: Iterator = iter(())
+        for platform_value, event_dict in records:
+            if platform is not None and platform_value != platform.value:
+                continue
+            if uid is not None and str(event_dict.get('uid')) != str(uid):
+                continue
+            yield event_dict
+
+    def iter_events(self, uid: str = None, platform: ALPlatform = None) -> Iterator[Event]:
+        """ Replay the logged events as Event objects """
+        for event_dict in self.iter_event_dicts(uid=uid, platform=platform):
+            yield event_factory(event_dict=event_dict)
+
+    def _read_records(self) -> Iterator[tuple]:
+        """ read the (platform, event) records back from the log file """
+        with open(self.path, encoding='utf-8') as log_file:
+            for line in log_file:
+                if line.strip():
+                    record: dict = json.loads(line)
+                    yield record['platform'], record['event']
+
+
+class EventSync:
+    """
+    Incrementally sync the event histories of tracked players into an EventLog
+
+    Discussion:
+        The api always returns the complete history, the sync streams it and skips every entry
+        at or below the player's high water mark before any Event object is built, so only the
+        unseen entries are parsed.
+
+    Note:
+        Events are expected to arrive in time order, an event the api adds later with a
+        timestamp older than the high water mark is not picked up
+
+    Example::
+
+        sync = EventSync(api, EventLog('events.jsonl'))
+        new_events = sync.sync_by_uid(uid, ALPlatform.PC)
+    """
+    def __init__(self, api: 'ApexLegendsAPI', log: EventLog = None):
+        """
+        :param api: the client used to fetch the event histories
+        :param log: the EventLog to sync into (defaults to an in-memory log)
+        """
+        self.api: 'ApexLegendsAPI' = api
+        self.log: EventLog = log if log is not None else EventLog()
+
+    def sync_by_uid(self, uid: str, platform: ALPlatform) -> List[Event]:
+        """
+        Fetch the player's history and log the events that were not seen before
+
+        :param uid: Player UID
+        :param platform: see Platform enum for values
+        :return: the new events (as Event objects), oldest first
+        """
+        mark: int = self.log.high_water_mark(uid, platform)
+        candidates: List[dict] = [
+            event_dict for event_dict in self.api.iter_event_dicts(platform, uid=uid)
+            if isinstance(event_dict, dict) and 'eventType' in event_dict
+            and (mark is None or (event_dict.get('timestamp') or 0) >= mark)
+        ]
+        return [
+            event_factory(event_dict=event_dict)
+            for event_dict in self.log.append(platform, candidates)
+        ]
+
+    def sync(self, player_name: str, platform: ALPlatform) -> List[Event]:
+        """
+        Same as sync_by_uid, resolving the player's uid with ``nametouid`` first
+
+        :param player_name: Player Name
+        :param platform: see Platform enum for values
+        :return: the new events (as Event objects), oldest first
+        """
+        return self.sync_by_uid(str(self.api.nametouid(player_name, platform)), platform)
@@ -0,0 +1,106 @@
+"""
+al_tracker_keys.py
+process wide registry of tracker keys with their ids and precomputed categories
+"""
+import sys
+import threading
+from array import array
+from typing import Dict, List
+
+
+def tracker_category(key: str) -> str:
+    """
+    Aggregate key for combining 'specialEvent' and 'season' data with regular data
+
+    Note:
+        Special Event data is the same as regular but has a different key for
+        statistical purposes it makes sense to just drop the 'specialEvent' prefix
+        or any 'season' suffix
+    """
+    category: str = key.removeprefix('specialEvent_')
+    category = category.removeprefix('arenas_')
+    category = category.removeprefix('grandsoiree_')
+    if category.startswith('wins_') or category.endswith('_wins'):
+        category = 'wins'
+    if category.startswith('kills_') or category.endswith('_kills'):
+        category = 'kills'
+    return category
+
+
+# pylint: disable=too-few-public-methods
+class TrackerKey:
+    """ a registered tracker key """
+    __slots__ = ('key', 'key_id', 'category', 'category_id')
+
+    def __init__(self, key: str, key_id: int, category: str, category_id: int):
+        self.key: str = key
+        """ the (interned) tracker key """
+        self.key_id: int = key_id
+        """ small integer id of the key, stable for the life of the process """
+        self.category: str = category
+        """ the (interned) category of the key, see tracker_category """
+        self.category_id: int = category_id
+        """ small integer id of the category """
+
+
+class TrackerKeyRegistry:
+    """
+    Thread safe registry mapping tracker keys to a TrackerKey
+
+    Discussion:
+        A key is classified (see tracker_category) the first time it is seen, later lookups
+        are a single dictionary access. Keys and categories are interned, so every DataTracker
+        with the same key shares one string, and get small integer ids usable for compact
+        storage and grouping (ex: EventFrame).
+    """
+    def __init__(self):
+        self._by_key: Dict[str, TrackerKey] = {}
+        self._keys: List[TrackerKey] = []
+        self._category_ids: Dict[str, int] = {}
+        self.categories: List[str] = []
+        """ category names, indexed by category id """
+        self.key_categories: array = array('l')
+        """ category id of every key, indexed by key id """
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._by_key
+
+    def lookup(self, key: str) -> TrackerKey:
+        """ the TrackerKey for the key, registering it if needed """
+        tracker_key: TrackerKey = self._by_key.get(key)
+        if tracker_key is None:
+            tracker_key = self._register(key)
+        return tracker_key
+
+    def _register(self, key: str) -> TrackerKey:
+        """ classify and register a new key """
+        category: str = sys.intern(tracker_category(key))
+        with self._lock:
+            tracker_key: TrackerKey = self._by_key.get(key)
+            if tracker_key is None:
+                category_id: int = self._category_ids.get(category)
+                if category_id is None:
+                    category_id = len(self.categories)
+                    self._category_ids[category] = category_id
+                    self.categories.append(category)
+                tracker_key = TrackerKey(sys.intern(key), len(self._keys), category, category_id)
+                self._keys.append(tracker_key)
+                self.key_categories.append(category_id)
+                self._by_key[tracker_key.key] = tracker_key
+            return tracker_key
+
+    def by_id(self, key_id: int) -> TrackerKey:
+        """ the TrackerKey with the given id """
+        return self._keys[key_id]
+
+    def category_id(self, category: str) -> int:
+        """ id of a category (None if no key of that category was registered) """
+        return self._category_ids.get(category)
+
+
+tracker_keys: TrackerKeyRegistry = TrackerKeyRegistry()
+""" the process wide registry used by DataTracker and EventFrame """
@@ -0,0 +1,83 @@
+"""
+al_tracking.py
+client side index of the players tracked for event (match history) collection
+"""
+import threading
+import time
+from .al_base import ALPlatform  # noqa E0402
+
+
+class TrackedPlayerIndex:
+    """
+    Thread safe index of tracked players keyed by (uid, platform) and (name, platform)
+
+    Discussion:
+        ApexLegendsAPI refreshes the index from an ``ALAction.INFO`` response at most every
+        ``refresh_interval`` seconds and keeps it up to date when players are added or deleted,
+        so ``get_player`` / ``get_player_by_uid`` do not need an INFO request on every lookup.
+    """
+    def __init__(self, refresh_interval: float = 300):
+        """
+        :param refresh_interval: seconds after which the index is refreshed from the api
+        """
+        self.refresh_interval: float = refresh_interval
+        self._uids: set = set()
+        self._names: set = set()
+        self._refreshed_at: float = None
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._uids) + len(self._names)
+
+    @property
+    def is_stale(self) -> bool:
+        """ True if the index has never been loaded or is older than the refresh interval """
+        refreshed_at: float = self._refreshed_at
+        return refreshed_at is None or time.monotonic() - refreshed_at >= self.refresh_interval
+
+    def update(self, tracked_players: list):
+        """
+        Replace the index with the 'data' list of an ALAction.INFO response
+
+        :param tracked_players: list of {'uid' or 'name', 'platform'} dictionaries
+        """
+        uids: set = set()
+        names: set = set()
+        tracked_player: dict
+        for tracked_player in tracked_players or []:
+            platform: str = tracked_player.get('platform')
+            if tracked_player.get('uid') is not None:
+                uids.add((str(tracked_player.get('uid')), platform))
+            if tracked_player.get('name') is not None:
+                names.add((tracked_player.get('name'), platform))
+        with self._lock:
+            self._uids = uids
+            self._names = names
+            self._refreshed_at = time.monotonic()
+
+    def add(self, platform: ALPlatform, uid: str = None, name: str = None):
+        """ Mark a player as tracked """
+        with self._lock:
+            if uid is not None:
+                self._uids.add((str(uid), platform.value))
+            if name is not None:
+                self._names.add((name, platform.value))
+
+    def remove(self, platform: ALPlatform, uid: str = None, name: str = None):
+        """ Mark a player as no longer tracked """
+        with self._lock:
+            if uid is not None:
+                self._uids.discard((str(uid), platform.value))
+            if name is not None:
+                self._names.discard((name, platform.value))
+
+    def is_tracked(self, platform: ALPlatform, uid: str = None, name: str = None) -> bool:
+        """ True if the player (by uid or by name) is tracked on the given platform """
+        if uid is not None and (str(uid), platform.value) in self._uids:
+            return True
+        return name is not None and (name, platform.value) in self._names
+
+    def invalidate(self):
+        """ Force a refresh on the next lookup """
+        with self._lock:
+            self._refreshed_at = None
@@ -0,0 +1,91 @@
+"""
+Concurrency benchmark for the connection pool
+
+Starts a local keep-alive stub server answering every request with the basic player stats
+fixture, then shares one ApexLegendsAPI between worker threads and reports the requests per
+second and the number of tcp connections the server accepted, for several pool sizes.
+
+Usage:
+    python benchmarks/bench_concurrency.py [--threads 16] [--requests 2000]
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# pylint: disable=wrong-import-position
+from apex_legends_api import ApexLegendsAPI, ALPlatform  # noqa E402
+
+RESPONSES_DIR = os.path.join(os.path.dirname(__file__), '..', 'tests', 'responses')
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """ answers every GET with the fixture, keeping the connection open """
+    protocol_version = 'HTTP/1.1'
+    body: bytes = b''
+    connections: int = 0
+    lock: threading.Lock = threading.Lock()
+
+    def setup(self):
+        super().setup()
+        with StubHandler.lock:
+            StubHandler.connections += 1
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """ send the fixture """
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        """ keep the benchmark output clean """
+
+
+def run(base_url: str, threads: int, requests: int, pool_maxsize: int) -> tuple:
+    """ send the requests from the threads, return (requests per second, connections) """
+    api: ApexLegendsAPI = ApexLegendsAPI(api_key='benchmark', pool_maxsize=pool_maxsize)
+    api.base_url = base_url
+    StubHandler.connections = 0
+    start: float = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(
+            lambda index: api.basic_player_stats_by_uid(str(index), ALPlatform.PC),
+            range(requests)
+        ))
+    elapsed: float = time.perf_counter() - start
+    api.session.close()
+    return requests / elapsed, StubHandler.connections
+
+
+def main():
+    """ run the benchmark """
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n', maxsplit=1)[0])
+    parser.add_argument('--threads', type=int, default=16)
+    parser.add_argument('--requests', type=int, default=2000)
+    args = parser.parse_args()
+
+    with open(os.path.join(RESPONSES_DIR, 'basic_player_stats_response.json'), 'rb') as body:
+        StubHandler.body = body.read()
+    server: ThreadingHTTPServer = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url: str = f'http://127.0.0.1:{server.server_address[1]}/bridge'
+
+    print(f'{args.threads} threads, {args.requests} requests')
+    for pool_maxsize in sorted({1, 4, 10, args.threads}):
+        requests_per_second, connections = run(
+            base_url, args.threads, args.requests, pool_maxsize
+        )
+        print(f'pool_maxsize={pool_maxsize:<4} {requests_per_second:8.0f} requests/s '
+              f'{connections:6d} connections opened')
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
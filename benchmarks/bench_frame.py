@@ -0,0 +1,88 @@
+"""
+EventFrame aggregation benchmark
+
+Compares group-by aggregations on an EventFrame with the same aggregation written as a loop over
+the Event objects, on the synthetic event histories of the mock server (see al_mock), with the
+numpy kernels (when numpy is installed) and with the pure python ones.
+
+Usage:
+    python benchmarks/bench_frame.py [--players 200] [--events 1000] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# pylint: disable=wrong-import-position
+from apex_legends_api.al_base import ALEventType  # noqa E402
+from apex_legends_api.al_domain import GameEvent, event_factory  # noqa E402
+from apex_legends_api.al_frame import EventFrame, numpy  # noqa E402
+from apex_legends_api.al_mock import player_events  # noqa E402
+
+SECONDS_PER_DAY: int = 24 * 60 * 60
+
+
+def walk_kills(events: list) -> dict:
+    """ kills per (legend, day), walking the Event objects """
+    totals: dict = {}
+    for event in events:
+        if isinstance(event, GameEvent):
+            for tracker in event.game_data_trackers:
+                if tracker.category == 'kills':
+                    group: tuple = (event.legend_played, event.timestamp // SECONDS_PER_DAY)
+                    totals[group] = totals.get(group, 0) + tracker.value
+    return totals
+
+
+def walk_game_length(events: list) -> dict:
+    """ mean game length per legend, walking the Event objects """
+    totals: dict = {}
+    for event in events:
+        if isinstance(event, GameEvent):
+            total, count = totals.get(event.legend_played, (0, 0))
+            totals[event.legend_played] = (total + event.game_length, count + 1)
+    return {legend: total / count for legend, (total, count) in totals.items()}
+
+
+def main():
+    """ run the benchmark and print the results """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--players', type=int, default=200)
+    parser.add_argument('--events', type=int, default=1000, help='events per player')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    events: list = [
+        event_factory(event)
+        for index in range(args.players) for event in player_events(index, args.events)
+    ]
+    frame: EventFrame = EventFrame.from_events(events)
+    walks: dict = {
+        'kills by legend/day': lambda: walk_kills(events),
+        'game length by legend': lambda: walk_game_length(events),
+    }
+    aggregations: dict = {
+        'kills by legend/day': lambda: frame.tracker_group_by(
+            'legend_played', 'day', category='kills'
+        ).sum('value'),
+        'game length by legend': lambda: frame.group_by(
+            'legend_played', event_type=ALEventType.GAME
+        ).mean('game_length'),
+    }
+    print(f'{len(events):,} events, {len(frame.tracker_value):,} trackers')
+    backends: list = [False, True] if numpy is not None else [False]
+    for name, walk in walks.items():
+        walk_seconds: float = min(timeit.repeat(walk, number=1, repeat=args.repeat))
+        print(f'{name:<22} Event loop   {walk_seconds * 1000:8.1f} ms')
+        for vectorized in backends:
+            EventFrame.vectorized = vectorized
+            seconds: float = min(
+                timeit.repeat(aggregations[name], number=1, repeat=args.repeat)
+            )
+            print(f'{"":<22} {"numpy" if vectorized else "python":<12} {seconds * 1000:8.1f} ms '
+                  f'{walk_seconds / seconds:6.1f}x')
+
+
+if __name__ == '__main__':
+    main()
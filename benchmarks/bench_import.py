@@ -0,0 +1,77 @@
+"""
+Import time benchmark
+
+Times the imports a short lived process pays for (each in a fresh interpreter, minus the time
+of an empty interpreter) and checks them against a budget:
+
+- package: ``import apex_legends_api``
+- domain: the domain model and enums only (``ALPlayer``, ``ALPlatform``), without the http stack
+- client: ``ApexLegendsAPI`` (loads requests)
+
+Exits with status 1 when the median of an import is over its budget.
+
+Usage:
+    python benchmarks/bench_import.py [--repeat 15] [--budget-domain-ms 60]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+IMPORTS: dict = {
+    'package': 'import apex_legends_api',
+    'domain': 'from apex_legends_api import ALPlayer, ALPlatform',
+    'client': 'from apex_legends_api import ApexLegendsAPI',
+}
+""" name -> statement timed """
+
+
+def run(statement: str) -> float:
+    """ seconds for a fresh interpreter to run the statement """
+    start: float = time.perf_counter()
+    subprocess.run([sys.executable, '-c', statement], cwd=ROOT, check=True)
+    return time.perf_counter() - start
+
+
+def median_import(statement: str, repeat: int) -> float:
+    """ median seconds of the statement on top of an empty interpreter """
+    baseline: float = statistics.median(run('pass') for _ in range(repeat))
+    return max(0.0, statistics.median(run(statement) for _ in range(repeat)) - baseline)
+
+
+def loaded_modules(statement: str) -> set:
+    """ third party http / date modules loaded by the statement """
+    output: str = subprocess.run(
+        [sys.executable, '-c', f'{statement}\nimport sys\nprint(" ".join(sys.modules))'],
+        cwd=ROOT, check=True, capture_output=True, text=True
+    ).stdout
+    return set(output.split()) & {'requests', 'urllib3', 'deprecated', 'arrow', 'aiohttp'}
+
+
+def main():
+    """ run the benchmark """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=15)
+    parser.add_argument('--budget-package-ms', type=float, default=60)
+    parser.add_argument('--budget-domain-ms', type=float, default=60)
+    parser.add_argument('--budget-client-ms', type=float, default=400)
+    args = parser.parse_args()
+
+    over_budget: bool = False
+    for name, statement in IMPORTS.items():
+        budget: float = getattr(args, f'budget_{name}_ms')
+        elapsed: float = median_import(statement, args.repeat) * 1000
+        status: str = 'ok' if elapsed <= budget else 'OVER BUDGET'
+        over_budget = over_budget or elapsed > budget
+        modules: str = ', '.join(sorted(loaded_modules(statement))) or '-'
+        print(f'{name:<8} {elapsed:7.1f} ms (budget {budget:5.0f} ms) {status:<11} '
+              f'loads: {modules}')
+    sys.exit(1 if over_budget else 0)
+
+
+if __name__ == '__main__':
+    main()
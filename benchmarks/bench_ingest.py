@@ -0,0 +1,74 @@
+"""
+Bulk ingest benchmark
+
+Writes a JSON Lines archive of synthetic players (see synthetic.py) and times
+``BulkIngest.snapshots`` and ``BulkIngest.frame`` with an increasing number of worker processes,
+reporting the players parsed per second and the speedup over a single process.
+
+Usage:
+    python benchmarks/bench_ingest.py [--players 2000] [--events 200] [--processes 1 2 4 8]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# pylint: disable=wrong-import-position,wrong-import-order
+from apex_legends_api.al_ingest import BulkIngest  # noqa E402
+import synthetic  # noqa E402
+
+
+def write_archive(path: str, players: int, events: int, trackers_per_legend: int):
+    """ an archive with one stats + events record per player """
+    with open(path, 'w', encoding='utf-8') as archive:
+        for index in range(players):
+            record: dict = {
+                'stats': synthetic.player_stats(trackers_per_legend, seed=index),
+                'events': synthetic.events(events, seed=index),
+            }
+            archive.write(json.dumps(record) + '\n')
+
+
+def timed_ingest(path: str, processes: int, chunk_size: int, output: str) -> float:
+    """ seconds to ingest the archive, including starting the worker processes """
+    start: float = time.perf_counter()
+    with BulkIngest(processes=processes, chunk_size=chunk_size) as ingest:
+        if output == 'snapshots':
+            for _snapshot in ingest.snapshots(path):
+                pass
+        else:
+            ingest.frame(path)
+        return time.perf_counter() - start
+
+
+def main():
+    """ run the benchmark """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--players', type=int, default=2000)
+    parser.add_argument('--events', type=int, default=200)
+    parser.add_argument('--trackers-per-legend', type=int, default=3)
+    parser.add_argument('--chunk-size', type=int, default=1024 * 1024)
+    parser.add_argument('--processes', type=int, nargs='+',
+                        default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path: str = os.path.join(directory, 'archive.jsonl')
+        write_archive(path, args.players, args.events, args.trackers_per_legend)
+        print(f'{args.players} players, {os.path.getsize(path) / 1e6:.1f} MB, '
+              f'{os.cpu_count()} cores')
+        for output in ('snapshots', 'frame'):
+            baseline: float = None
+            for processes in args.processes:
+                elapsed: float = timed_ingest(path, processes, args.chunk_size, output)
+                baseline = baseline or elapsed
+                print(f'{output:<10} processes={processes:<3} {elapsed:7.2f} s '
+                      f'{args.players / elapsed:9.0f} players/s '
+                      f'speedup {baseline / elapsed:5.2f}x')
+
+
+if __name__ == '__main__':
+    main()
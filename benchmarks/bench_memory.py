@@ -0,0 +1,56 @@
+"""
+Memory benchmark for the domain model
+
+Builds ALPlayer objects from the fixtures in tests/responses (with the event history repeated
+to a realistic length) and reports the bytes retained per player.
+
+Usage:
+    python benchmarks/bench_memory.py [--players 200] [--events 500]
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from apex_legends_api import ALPlayer  # noqa E402 pylint: disable=wrong-import-position
+
+RESPONSES_DIR = os.path.join(os.path.dirname(__file__), '..', 'tests', 'responses')
+
+
+def load_fixture(filename: str):
+    """ load one of the json fixtures used by the unit tests """
+    with open(os.path.join(RESPONSES_DIR, filename), encoding='utf-8') as json_file:
+        return json.load(json_file)
+
+
+def bytes_per_player(players: int, events: int) -> float:
+    """ build the players and return the bytes retained per player """
+    basic_player_stats: dict = load_fixture('basic_player_stats_response.json')
+    history: list = load_fixture('match_history_get_response.json')
+    history = (history * (events // len(history) + 1))[:events]
+
+    gc.collect()
+    tracemalloc.start()
+    before, _peak = tracemalloc.get_traced_memory()
+    fleet: list = [ALPlayer(basic_player_stats, events=history) for _ in range(players)]
+    after, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(fleet) == players
+    return (after - before) / players
+
+
+def main():
+    """ run the benchmark and print the result """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--players', type=int, default=200)
+    parser.add_argument('--events', type=int, default=500)
+    args = parser.parse_args()
+    result: float = bytes_per_player(args.players, args.events)
+    print(f'players={args.players} events/player={args.events} bytes/player={result:,.0f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""
+Snapshot benchmark for ALPlayer
+
+Compares restoring a player from a binary snapshot (and from to_dict) with building it from
+the json fixtures in tests/responses (with the event history repeated to a realistic length).
+
+Usage:
+    python benchmarks/bench_snapshot.py [--events 500] [--repeat 200]
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from apex_legends_api import ALPlayer  # noqa E402 pylint: disable=wrong-import-position
+
+RESPONSES_DIR = os.path.join(os.path.dirname(__file__), '..', 'tests', 'responses')
+
+
+def load_fixture(filename: str) -> bytes:
+    """ raw bytes of one of the json fixtures used by the unit tests """
+    with open(os.path.join(RESPONSES_DIR, filename), 'rb') as json_file:
+        return json_file.read()
+
+
+def main():
+    """ run the benchmark and print the results """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--events', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+
+    history: list = json.loads(load_fixture('match_history_get_response.json'))
+    history = (history * (args.events // len(history) + 1))[:args.events]
+    stats_json: bytes = load_fixture('basic_player_stats_response.json')
+    history_json: bytes = json.dumps(history).encode()
+    player: ALPlayer = ALPlayer(json.loads(stats_json), events=history)
+    snapshot: bytes = player.to_snapshot()
+    player_dict: dict = player.to_dict()
+
+    cases: dict = {
+        'json -> ALPlayer': lambda: ALPlayer(
+            json.loads(stats_json), events=json.loads(history_json)
+        ),
+        'from_dict': lambda: ALPlayer.from_dict(player_dict),
+        'from_snapshot': lambda: ALPlayer.from_snapshot(snapshot),
+    }
+    print(f'events/player={args.events} json={len(stats_json) + len(history_json):,} bytes '
+          f'snapshot={len(snapshot):,} bytes')
+    for name, case in cases.items():
+        seconds: float = min(timeit.repeat(case, number=args.repeat, repeat=3)) / args.repeat
+        print(f'{name:<18} {seconds * 1000:8.3f} ms/player')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,184 @@
+"""
+Benchmark suite for parsing and request overhead
+
+Builds scaled synthetic payloads from the fixtures in tests/responses (see synthetic.py) and
+measures:
+
+- player_parse: time to build an ALPlayer
+- player_memory: bytes retained, peak bytes and allocations while building one ALPlayer
+- event_factory: events parsed per second
+- event_range_query: ``ALPlayer.events_between`` (one day window) against a linear filter
+- request_overhead: client time per request against a local in-process transport (no network),
+  for an empty json body and for the synthetic basic_player_stats body
+
+Results are printed and can be written as json (``--json``) and compared with an earlier run
+(``--compare``), ex: to compare releases.
+
+Usage:
+    python benchmarks/bench_suite.py [--events 10000] [--json results.json] [--compare old.json]
+"""
+import argparse
+import gc
+import json
+import platform
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable
+
+import requests
+from requests.adapters import BaseAdapter
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# pylint: disable=wrong-import-position,wrong-import-order
+from apex_legends_api import ALPlatform, ALPlayer, ApexLegendsAPI  # noqa E402
+from apex_legends_api.al_domain import event_factory  # noqa E402
+import synthetic  # noqa E402
+
+
+class StubAdapter(BaseAdapter):
+    """ transport answering every request with the same body, without any network """
+    def __init__(self, body: bytes):
+        super().__init__()
+        self.body: bytes = body
+
+    def send(self, request, **_kwargs):  # pylint: disable=arguments-differ
+        response: requests.Response = requests.Response()
+        response.status_code = 200
+        response.headers['Content-Type'] = 'application/json'
+        response._content = self.body  # pylint: disable=protected-access
+        response.url = request.url
+        response.request = request
+        response.encoding = 'utf-8'
+        return response
+
+    def close(self):
+        """ nothing to close """
+
+
+def timed(function: Callable, repeat: int) -> dict:
+    """ median / min seconds of the function over ``repeat`` runs """
+    timings: list = []
+    for _ in range(repeat):
+        start: float = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return {'median_s': statistics.median(timings), 'min_s': min(timings), 'runs': repeat}
+
+
+def bench_player_parse(stats: dict, history: list, repeat: int) -> dict:
+    """ time to build an ALPlayer """
+    return timed(lambda: ALPlayer(stats, events=history), repeat)
+
+
+def bench_player_memory(stats: dict, history: list) -> dict:
+    """ memory retained / peak and allocations while building one ALPlayer """
+    gc.collect()
+    tracemalloc.start()
+    before: tracemalloc.Snapshot = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    start, _peak = tracemalloc.get_traced_memory()
+    player: ALPlayer = ALPlayer(stats, events=history)
+    current, peak = tracemalloc.get_traced_memory()
+    after: tracemalloc.Snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    blocks: int = sum(stat.count_diff for stat in after.compare_to(before, 'filename'))
+    assert player.events is not None
+    return {'retained_bytes': current - start, 'peak_bytes': peak - start,
+            'allocated_blocks': blocks}
+
+
+def bench_event_factory(history: list, repeat: int) -> dict:
+    """ events parsed per second """
+    result: dict = timed(lambda: [event_factory(event_dict=event) for event in history], repeat)
+    result['events_per_s'] = len(history) / result['median_s']
+    return result
+
+
+def bench_event_range_query(stats: dict, history: list, repeat: int) -> dict:
+    """ time of a one day window query, binary search against a linear filter """
+    player: ALPlayer = ALPlayer(stats, events=history)
+    start: int = history[len(history) // 2]['timestamp']
+    end: int = start + 86400
+    queries: int = 1000
+    player.events_between(start, end)
+
+    def linear():
+        return [[event for event in player.events if start <= event.timestamp < end]
+                for _ in range(queries)]
+
+    def indexed():
+        return [player.events_between(start, end) for _ in range(queries)]
+    return {
+        'linear_per_query_s': timed(linear, repeat)['median_s'] / queries,
+        'indexed_per_query_s': timed(indexed, repeat)['median_s'] / queries,
+    }
+
+
+def bench_request_overhead(body: bytes, repeat: int) -> dict:
+    """ client time per request against the in-process transport """
+    api: ApexLegendsAPI = ApexLegendsAPI(api_key='benchmark')
+    api.session.mount('https://', StubAdapter(body))
+    requests_per_run: int = 100
+
+    def run():
+        for index in range(requests_per_run):
+            api.basic_player_stats_by_uid(str(index), ALPlatform.PC)
+    result: dict = timed(run, repeat)
+    result['per_request_s'] = result['median_s'] / requests_per_run
+    return result
+
+
+def compare(results: dict, previous: dict):
+    """ print the ratio of every timing / size with an earlier run """
+    print(f"\ncompared with {previous['meta'].get('label') or 'previous run'} (new / old):")
+    for name, metrics in results['results'].items():
+        for metric, value in metrics.items():
+            old = previous['results'].get(name, {}).get(metric)
+            if metric != 'runs' and isinstance(old, (int, float)) and old:
+                print(f"  {name + '.' + metric:<36} {value / old:6.2f}x")
+
+
+def main():
+    """ run the suite """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--events', type=int, default=10000)
+    parser.add_argument('--trackers-per-legend', type=int, default=3)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--label', default='', help='name of the run (ex: a release)')
+    parser.add_argument('--json', help='write the results to this file')
+    parser.add_argument('--compare', help='results file of an earlier run to compare with')
+    args = parser.parse_args()
+
+    stats: dict = synthetic.player_stats(args.trackers_per_legend)
+    history: list = synthetic.events(args.events)
+    results: dict = {
+        'meta': {
+            'label': args.label, 'time': time.time(), 'python': platform.python_version(),
+            'implementation': platform.python_implementation(), 'machine': platform.machine(),
+            'events': args.events, 'trackers_per_legend': args.trackers_per_legend,
+        },
+        'results': {
+            'player_parse': bench_player_parse(stats, history, args.repeat),
+            'player_memory': bench_player_memory(stats, history),
+            'event_factory': bench_event_factory(history, args.repeat),
+            'event_range_query': bench_event_range_query(stats, history, args.repeat),
+            'request_overhead': bench_request_overhead(b'{}', args.repeat),
+            'request_basic_stats': bench_request_overhead(
+                json.dumps(stats).encode(), args.repeat
+            ),
+        }
+    }
+    print(json.dumps(results, indent=2))
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as json_file:
+            json.dump(results, json_file, indent=2)
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as json_file:
+            compare(results, json.load(json_file))
+
+
+if __name__ == '__main__':
+    main()
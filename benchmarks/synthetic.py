@@ -0,0 +1,49 @@
+"""
+Synthetic payloads for the benchmarks
+
+Scales the fixtures in tests/responses up to realistic sizes: every legend populated with
+trackers and event histories of any length (newest first, like the api).
+"""
+import copy
+import json
+import os
+import random
+from typing import List
+
+from apex_legends_api.al_mock import TRACKERS, player_events, tracker
+
+RESPONSES_DIR = os.path.join(os.path.dirname(__file__), '..', 'tests', 'responses')
+
+
+def load_fixture(filename: str):
+    """ load one of the json fixtures used by the unit tests """
+    with open(os.path.join(RESPONSES_DIR, filename), encoding='utf-8') as json_file:
+        return json.load(json_file)
+
+
+def player_stats(trackers_per_legend: int = 3, seed: int = 0) -> dict:
+    """
+    A basic_player_stats response with every legend populated with trackers
+
+    :param trackers_per_legend: number of trackers on every legend (at most len(TRACKERS))
+    :param seed: seed of the random values
+    """
+    rng: random.Random = random.Random(seed)
+    stats: dict = copy.deepcopy(load_fixture('basic_player_stats_response.json'))
+    legends: dict = stats['legends']['all']
+    for legend_dict in legends.values():
+        keys: list = rng.sample(TRACKERS, min(trackers_per_legend, len(TRACKERS)))
+        legend_dict['data'] = [tracker(rng, key, name, ranked=True) for key, name in keys]
+    selected: dict = stats['legends']['selected']
+    selected['data'] = copy.deepcopy(legends[selected['LegendName']]['data'])
+    return stats
+
+
+def events(count: int, seed: int = 0) -> List[dict]:
+    """
+    An ALAction.GET response with ``count`` events, newest first
+
+    Discussion:
+        The history of the mock server's synthetic player 0 (see al_mock.player_events)
+    """
+    return player_events(0, count, seed)
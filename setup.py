@@ -17,6 +17,11 @@ setup(
     author='John Sturgeon',
     author_email='john.sturgeon@me.com',
     install_requires=requirements,
+    extras_require={
+        'async': ['aiohttp>=3.7'],
+        'fast': ['orjson>=3'],
+        'frame': ['numpy>=1.20'],
+    },
     description='Python wrapper for https://apexlegendsapi.com',
     long_description=long_description,
     long_description_content_type='text/markdown'
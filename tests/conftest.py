@@ -3,6 +3,7 @@ import os
 import json
 import pytest
 import requests_mock
+from aioresponses import aioresponses
 
 
 def get_full_filepath(test_filename):
@@ -19,6 +20,12 @@ def mock():
         yield ___mock
 
 
+@pytest.fixture()
+def async_mock():
+    with aioresponses() as ___mock:
+        yield ___mock
+
+
 @pytest.fixture()
 def basic_player_stats_response():
     with open(get_full_filepath('basic_player_stats_response.json')) as json_file:
@@ -0,0 +1,136 @@
+""" unit tests for the asyncio client """
+import asyncio
+import pytest
+from apex_legends_api import ALAction, ALPlatform, ALPlayer, ALHTTPExceptionFromResponse  # noqa F0401
+from apex_legends_api import ALPlayerNotFoundError  # noqa F0401
+from apex_legends_api.al_async import AsyncApexLegendsAPI  # noqa F0401
+
+BASE_URL = AsyncApexLegendsAPI.base_url
+VERSION = AsyncApexLegendsAPI.api_version
+
+
+def run(coroutine_function):
+    """ run the coroutine function with a fresh client and close it afterwards """
+    async def runner():
+        async with AsyncApexLegendsAPI(api_key='api_key', max_concurrency=4) as api:
+            return await coroutine_function(api)
+    return asyncio.run(runner())
+
+
+# pylint: disable=missing-function-docstring
+def test_async_basic_player_stats(async_mock, basic_player_stats_response):
+    player_name = "Player"
+    platform = ALPlatform.PC
+    player_url = f"{BASE_URL}?version={VERSION}&platform={platform.value}&player={player_name}"
+    async_mock.get(player_url, payload=basic_player_stats_response)
+    response = run(lambda api: api.basic_player_stats(player_name=player_name, platform=platform))
+    assert response[0]['global']['name'] == player_name
+
+
+def test_async_basic_player_stats_skip_rank(async_mock, basic_player_stats_skip_rank_response):
+    player_name = "Player"
+    platform = ALPlatform.PC
+    player_url = f"{BASE_URL}?version={VERSION}&platform={platform.value}&player={player_name}"
+    player_url += "&skipRank=True"
+    async_mock.get(player_url, payload=basic_player_stats_skip_rank_response)
+    response = run(lambda api: api.basic_player_stats(
+        player_name=player_name, platform=platform, skip_tracker_rank=True
+    ))
+    assert response[0]['global']['name'] == player_name
+
+
+def test_async_nametouid(async_mock, nametouid_response):
+    player_name = "Player"
+    platform = ALPlatform.PC
+    url = f"https://api.mozambiquehe.re/nametouid?player={player_name}&platform={platform.value}"
+    async_mock.get(url, payload=nametouid_response)
+    assert run(lambda api: api.nametouid(player=player_name, platform=platform)) == 2535473406730526
+
+
+def test_async_get_player_origin(async_mock, player_origin_response):
+    player_name = "Player"
+    async_mock.get(
+        f'https://api.mozambiquehe.re/origin?player={player_name}', payload=player_origin_response
+    )
+    response = run(lambda api: api.get_player_origin(player_name=player_name))
+    assert response[0]['name'] == player_name
+
+
+def test_async_get_al_player(
+        async_mock,
+        basic_player_stats_response,
+        match_history_get_response,
+        match_history_info_response
+):
+    player_name = "Player"
+    platform = ALPlatform.PC
+    base_url_version = f"{BASE_URL}?version={VERSION}&platform={platform.value}"
+    async_mock.get(base_url_version + f"&player={player_name}", payload=basic_player_stats_response)
+    async_mock.get(
+        base_url_version + f"&player={player_name}&history=1&action={ALAction.INFO.value}",
+        payload=match_history_info_response
+    )
+    async_mock.get(
+        base_url_version + f"&player={player_name}&history=1&action={ALAction.GET.value}",
+        payload=match_history_get_response
+    )
+    player: ALPlayer = run(lambda api: api.get_player(name=player_name, platform=platform))
+    assert isinstance(player, ALPlayer)
+    assert player.global_info.name == player_name
+    assert player.events[0].action == 'leave'
+
+
+def test_async_get_al_player_by_uid(
+        async_mock,
+        basic_player_stats_response,
+        match_history_get_response,
+        match_history_info_response
+):
+    uid = "0000000000000"
+    platform = ALPlatform.PC
+    base_url_version = f"{BASE_URL}?version={VERSION}&platform={platform.value}"
+    async_mock.get(base_url_version + f"&uid={uid}", payload=basic_player_stats_response)
+    async_mock.get(
+        base_url_version + f"&uid={uid}&history=1&action={ALAction.INFO.value}",
+        payload=match_history_info_response
+    )
+    async_mock.get(
+        base_url_version + f"&uid={uid}&history=1&action={ALAction.GET.value}",
+        payload=match_history_get_response
+    )
+    player: ALPlayer = run(lambda api: api.get_player_by_uid(uid=uid, platform=platform))
+    assert player.global_info.uid == uid
+    assert player.events[0].action == 'leave'
+
+
+def test_async_http_error(async_mock):
+    player_name = "Player"
+    platform = ALPlatform.PC
+    player_url = f"{BASE_URL}?version={VERSION}&platform={platform.value}&player={player_name}"
+    async_mock.get(player_url, status=500, body="Internal Server Error")
+    with pytest.raises(ALHTTPExceptionFromResponse) as exception_info:
+        run(lambda api: api.basic_player_stats(player_name=player_name, platform=platform))
+    assert exception_info.value.status_code == 500
+
+
+def test_async_player_not_found(async_mock, match_history_info_response):
+    platform = ALPlatform.PC
+    base_url_version = f"{BASE_URL}?version={VERSION}&platform={platform.value}"
+    async_mock.get(base_url_version + "&player=Missing", payload={"Error": "Player not found"})
+    async_mock.get(
+        base_url_version + f"&player=Missing&history=1&action={ALAction.INFO.value}",
+        payload=match_history_info_response
+    )
+    async_mock.get(base_url_version + "&uid=1", payload={"Error": "Player not found"})
+    async_mock.get(
+        base_url_version + f"&uid=1&history=1&action={ALAction.INFO.value}",
+        payload=match_history_info_response
+    )
+    async_mock.get(
+        f"https://api.mozambiquehe.re/nametouid?player=Missing&platform={platform.value}",
+        payload={"Error": "Player not found"}
+    )
+    assert run(lambda api: api.get_player(name="Missing", platform=platform)) is None
+    assert run(lambda api: api.get_player_by_uid(uid="1", platform=platform)) is None
+    with pytest.raises(ALPlayerNotFoundError):
+        run(lambda api: api.nametouid(player="Missing", platform=platform))
@@ -0,0 +1,99 @@
+""" unit tests for the bulk player fetch """
+import requests
+from apex_legends_api import ApexLegendsAPI, ALPlatform, ALPlayer  # noqa F0401
+from apex_legends_api import ALHTTPExceptionFromResponse, ALPlayerNotFoundError  # noqa F0401
+from apex_legends_api import ALUnexpectedResponseError  # noqa F0401
+
+api = ApexLegendsAPI(api_key='api_key')
+BASE_URL = ApexLegendsAPI.base_url
+VERSION = ApexLegendsAPI.api_version
+
+
+def register_player(mock, name, responses, key='player'):
+    """
+    register all the urls that get_player / get_player_by_uid will call, responses is the
+    (basic player stats, match history GET, match history INFO) tuple
+    """
+    basic_player_stats_response, match_history_get_response, match_history_info_response = responses
+    base_url = f"{BASE_URL}?version={VERSION}&platform=PC&{key}={name}"
+    mock.register_uri('GET', base_url, json=basic_player_stats_response)
+    mock.register_uri('GET', base_url + "&history=1&action=GET", json=match_history_get_response)
+    mock.register_uri('GET', base_url + "&history=1&action=INFO", json=match_history_info_response)
+
+
+# pylint: disable=missing-function-docstring
+def test_get_players_keeps_order_and_reports_failures(
+        mock,
+        basic_player_stats_response,
+        match_history_get_response,
+        match_history_info_response
+):
+    register_player(
+        mock, "Player",
+        (basic_player_stats_response, match_history_get_response, match_history_info_response)
+    )
+    mock.register_uri(
+        'GET', f"{BASE_URL}?version={VERSION}&platform=PC&player=Broken",
+        status_code=500, text="Internal Server Error"
+    )
+    mock.register_uri(
+        'GET', f"{BASE_URL}?version={VERSION}&platform=PC&player=Missing",
+        json={"Error": "Player Missing not found"}
+    )
+    queries = [
+        ("Player", ALPlatform.PC),
+        ("Broken", ALPlatform.PC),
+        ("Missing", ALPlatform.PC),
+        ("Player", ALPlatform.PC),
+    ]
+    results = api.get_players(queries, max_workers=4)
+    assert [result.query for result in results] == queries
+    assert results[0].ok and isinstance(results[0].player, ALPlayer)
+    assert results[3].player.global_info.name == "Player"
+    assert isinstance(results[1].error, ALHTTPExceptionFromResponse)
+    assert results[1].error.status_code == 500
+    assert isinstance(results[2].error, ALPlayerNotFoundError)
+    assert results[2].player is None
+
+
+def test_get_players_by_uid_as_completed(
+        mock,
+        basic_player_stats_response,
+        match_history_get_response,
+        match_history_info_response
+):
+    uid = "0000000000000"
+    register_player(
+        mock, uid,
+        (basic_player_stats_response, match_history_get_response, match_history_info_response),
+        key='uid'
+    )
+    queries = [(uid, ALPlatform.PC)] * 5
+    results = list(api.get_players_by_uid(queries, max_workers=2, as_completed=True))
+    assert sorted(result.index for result in results) == list(range(5))
+    assert all(result.player.events[0].action == 'leave' for result in results)
+
+
+def test_get_players_reports_request_exceptions(
+        mock,
+        basic_player_stats_response,
+        match_history_get_response,
+        match_history_info_response
+):
+    register_player(
+        mock, "Player",
+        (basic_player_stats_response, match_history_get_response, match_history_info_response)
+    )
+    mock.register_uri(
+        'GET', f"{BASE_URL}?version={VERSION}&platform=PC&player=Timeout",
+        exc=requests.exceptions.ConnectTimeout
+    )
+    mock.register_uri(
+        'GET', f"{BASE_URL}?version={VERSION}&platform=PC&player=Empty", json=[]
+    )
+    queries = [("Timeout", ALPlatform.PC), ("Empty", ALPlatform.PC), ("Player", ALPlatform.PC)]
+    results = api.get_players(queries, max_workers=2)
+    assert isinstance(results[0].error, requests.exceptions.ConnectTimeout)
+    assert results[0].player is None
+    assert isinstance(results[1].error, ALUnexpectedResponseError) and not results[1].ok
+    assert results[2].ok and results[2].player.global_info.name == "Player"
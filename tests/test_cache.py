@@ -0,0 +1,92 @@
+""" unit tests for the response cache """
+import time
+from apex_legends_api import ApexLegendsAPI, ALAction, ALPlatform, ResponseCache  # noqa F0401
+
+BASE_URL = ApexLegendsAPI.base_url
+VERSION = ApexLegendsAPI.api_version
+
+
+# pylint: disable=missing-function-docstring
+def test_cache_hit_and_invalidate_player(mock, basic_player_stats_response):
+    api = ApexLegendsAPI(api_key='api_key', cache=ResponseCache())
+    player_url = f"{BASE_URL}?version={VERSION}&platform=PC&player=Player"
+    mock.register_uri('GET', player_url, json=basic_player_stats_response)
+    first = api.basic_player_stats(player_name="Player", platform=ALPlatform.PC)
+    second = api.basic_player_stats(player_name="Player", platform=ALPlatform.PC)
+    assert first is second
+    assert mock.call_count == 1
+    assert api.cache.stats.hits == 1 and api.cache.stats.misses == 1
+
+    assert api.cache.invalidate_player(player="Player") == 1
+    api.basic_player_stats(player_name="Player", platform=ALPlatform.PC)
+    assert mock.call_count == 2
+
+
+def test_cache_invalidate_player_drops_origin(mock, player_origin_response):
+    api = ApexLegendsAPI(api_key='api_key', cache=ResponseCache())
+    mock.register_uri(
+        'GET', "https://api.mozambiquehe.re/origin?player=Player", json=player_origin_response
+    )
+    mock.register_uri(
+        'GET', "https://api.mozambiquehe.re/origin?player=Other", json=player_origin_response
+    )
+    api.get_player_origin(player_name="Player")
+    api.get_player_origin(player_name="Player", show_all_hits=True)
+    api.get_player_origin(player_name="Other")
+    assert mock.call_count == 3
+
+    assert api.cache.invalidate_player(player="Player") == 2
+    api.get_player_origin(player_name="Player")
+    api.get_player_origin(player_name="Other")
+    assert mock.call_count == 4
+
+
+def test_cache_ttl_per_endpoint(mock, basic_player_stats_response, nametouid_response):
+    api = ApexLegendsAPI(api_key='api_key', cache=ResponseCache(ttls={'basic': 0.01}))
+    mock.register_uri(
+        'GET', f"{BASE_URL}?version={VERSION}&platform=PC&player=Player",
+        json=basic_player_stats_response
+    )
+    mock.register_uri(
+        'GET', "https://api.mozambiquehe.re/nametouid?player=Player&platform=PC",
+        json=nametouid_response
+    )
+    api.basic_player_stats(player_name="Player", platform=ALPlatform.PC)
+    api.nametouid(player="Player", platform=ALPlatform.PC)
+    time.sleep(0.02)
+    api.basic_player_stats(player_name="Player", platform=ALPlatform.PC)
+    api.nametouid(player="Player", platform=ALPlatform.PC)
+    assert mock.call_count == 3
+    assert api.cache.stats.expirations == 1
+
+
+def test_cache_lru_eviction(mock, basic_player_stats_response):
+    api = ApexLegendsAPI(api_key='api_key', cache=ResponseCache(max_size=2))
+    for name in ("One", "Two", "Three"):
+        mock.register_uri(
+            'GET', f"{BASE_URL}?version={VERSION}&platform=PC&player={name}",
+            json=basic_player_stats_response
+        )
+    api.basic_player_stats(player_name="One", platform=ALPlatform.PC)
+    api.basic_player_stats(player_name="Two", platform=ALPlatform.PC)
+    api.basic_player_stats(player_name="One", platform=ALPlatform.PC)
+    api.basic_player_stats(player_name="Three", platform=ALPlatform.PC)
+    assert api.cache.stats.evictions == 1
+    assert len(api.cache) == 2
+    # 'Two' was the least recently used
+    api.basic_player_stats(player_name="One", platform=ALPlatform.PC)
+    assert mock.call_count == 3
+    api.basic_player_stats(player_name="Two", platform=ALPlatform.PC)
+    assert mock.call_count == 4
+
+
+def test_cache_skips_mutating_actions(mock, match_history_info_response):
+    api = ApexLegendsAPI(api_key='api_key', cache=ResponseCache())
+    base_url = f"{BASE_URL}?version={VERSION}&platform=PC&uid=1234&history=1"
+    mock.register_uri('GET', base_url + "&action=info", json=match_history_info_response)
+    mock.register_uri('GET', base_url + "&action=add", json={"result": "added"})
+    api.events_by_uid(uid="1234", platform=ALPlatform.PC, action=ALAction.INFO)
+    api.add_player_by_uid(player_uid=1234, platform=ALPlatform.PC)
+    api.add_player_by_uid(player_uid=1234, platform=ALPlatform.PC)
+    api.events_by_uid(uid="1234", platform=ALPlatform.PC, action=ALAction.INFO)
+    assert mock.call_count == 4
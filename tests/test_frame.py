@@ -0,0 +1,94 @@
+""" unit tests for the columnar event frame """
+import datetime
+import pytest
+from apex_legends_api import ALPlayer  # noqa F0401
+from apex_legends_api.al_base import ALEventType  # noqa F0401
+from apex_legends_api.al_domain import event_factory  # noqa F0401
+from apex_legends_api.al_frame import EventFrame, numpy, parse_rank_score_change  # noqa F0401
+from apex_legends_api.al_mock import player_events  # noqa F0401
+
+
+@pytest.fixture(params=[False, True], ids=['python', 'numpy'])
+def vectorized(request, monkeypatch):
+    """ run the test with the pure python and the numpy aggregations """
+    if request.param and numpy is None:
+        pytest.skip('numpy is not installed')
+    monkeypatch.setattr(EventFrame, 'vectorized', request.param)
+    return request.param
+
+
+def build_players(basic_player_stats_response, match_history_get_response) -> list:
+    """ two players, the second one played a second game of Wraith """
+    wraith_game = dict(
+        match_history_get_response[3], uid="1111111111111", legendPlayed="Wraith",
+        gameLength=10, rankScoreChange="-12", timestamp=1616878856 + 24 * 60 * 60
+    )
+    return [
+        ALPlayer(basic_player_stats_response, events=match_history_get_response),
+        ALPlayer(basic_player_stats_response, events=match_history_get_response + [wraith_game]),
+    ]
+
+
+# pylint: disable=missing-function-docstring
+def test_event_frame_columns(vectorized, basic_player_stats_response, match_history_get_response):
+    frame = EventFrame.from_players(
+        build_players(basic_player_stats_response, match_history_get_response)
+    )
+    assert len(frame) == 9
+    assert frame.rank_score_change.tolist().count(116) == 2
+    assert frame.group_by('event_type').count() == {
+        ALEventType.SESSION: 2, ALEventType.LEVEL: 2, ALEventType.RANK: 2, ALEventType.GAME: 3
+    }
+    assert frame.group_by('uid').count() == {"0000000000000": 8, "1111111111111": 1}
+
+
+def test_event_frame_aggregations(
+        vectorized, basic_player_stats_response, match_history_get_response
+):
+    frame = EventFrame.from_players(
+        build_players(basic_player_stats_response, match_history_get_response)
+    )
+    games = frame.group_by('legend_played', event_type=ALEventType.GAME)
+    assert games.sum('game_length') == {'Gibraltar': 48, 'Wraith': 10}
+    assert games.mean('rank_score_change') == {'Gibraltar': 116.0, 'Wraith': -12.0}
+
+    kills = frame.tracker_group_by('legend_played', 'day', category='kills').sum('value')
+    assert kills == {
+        ('Gibraltar', datetime.date(2021, 3, 27)): 2,
+        ('Wraith', datetime.date(2021, 3, 28)): 1,
+    }
+    assert frame.tracker_group_by('key', start=1616878857).count() == {'kills_season_8': 1}
+
+    assert frame.tracker_group_by('key', key='not_a_key').count() == {}
+    assert frame.group_by('uid', start=0, end=1).count() == {}
+
+
+@pytest.mark.skipif(numpy is None, reason='numpy is not installed')
+def test_numpy_and_python_aggregations_agree(monkeypatch):
+    frame = EventFrame.from_events(
+        event_factory(event) for index in range(20) for event in player_events(index, 200)
+    )
+    start, end = frame.timestamp[-1] + 86400, frame.timestamp[0] - 86400
+
+    def aggregate():
+        return [
+            frame.group_by('event_type').count(),
+            frame.group_by('uid', 'day', start=start, end=end).count(),
+            frame.group_by('legend_played', event_type=ALEventType.GAME).mean('game_length'),
+            frame.group_by('uid', end=end).sum('rank_score_change'),
+            frame.tracker_group_by('legend_played', 'day', category='kills').sum('value'),
+            frame.tracker_group_by('category', start=start).mean('value'),
+            frame.tracker_group_by('uid', key='damage', end=end).count(),
+        ]
+    monkeypatch.setattr(EventFrame, 'vectorized', False)
+    expected = aggregate()
+    monkeypatch.setattr(EventFrame, 'vectorized', True)
+    for result, expected_result in zip(aggregate(), expected):
+        assert expected_result and result == pytest.approx(expected_result)
+
+
+def test_parse_rank_score_change():
+    assert parse_rank_score_change("116") == 116
+    assert parse_rank_score_change("-12") == -12
+    assert parse_rank_score_change(None) == 0
+    assert parse_rank_score_change("") == 0
@@ -0,0 +1,60 @@
+""" unit tests for the persistent identity store """
+import pytest
+from apex_legends_api import ApexLegendsAPI, ALPlatform, ALPlayerNotFoundError  # noqa F0401
+from apex_legends_api import IdentityStore, SQLiteIdentityStore  # noqa F0401
+
+NAMETOUID_URL = "https://api.mozambiquehe.re/nametouid?player={}&platform=PC"
+
+
+# pylint: disable=missing-function-docstring
+def test_nametouid_is_persisted(mock, tmp_path, nametouid_response):
+    path = str(tmp_path / 'identity.sqlite3')
+    mock.register_uri('GET', NAMETOUID_URL.format("Player"), json=nametouid_response)
+    api = ApexLegendsAPI(api_key='api_key', identity_store=SQLiteIdentityStore(path))
+    assert api.nametouid(player="Player", platform=ALPlatform.PC) == 2535473406730526
+
+    # a fresh client (think: another process) resolves the name without calling the api
+    other_api = ApexLegendsAPI(api_key='api_key', identity_store=SQLiteIdentityStore(path))
+    assert other_api.nametouid(player="Player", platform=ALPlatform.PC) == 2535473406730526
+    assert mock.call_count == 1
+
+
+def test_nametouid_failures_are_cached_briefly(mock, tmp_path):
+    store = SQLiteIdentityStore(str(tmp_path / 'identity.sqlite3'), negative_ttl=60)
+    mock.register_uri('GET', NAMETOUID_URL.format("Missing"), json={"Error": "not found"})
+    api = ApexLegendsAPI(api_key='api_key', identity_store=store)
+    for _ in range(2):
+        with pytest.raises(ALPlayerNotFoundError):
+            api.nametouid(player="Missing", platform=ALPlatform.PC)
+    assert mock.call_count == 1
+
+
+def test_identity_store_expires_entries(tmp_path):
+    store = SQLiteIdentityStore(str(tmp_path / 'identity.sqlite3'), ttl=-1)
+    store.set('nametouid', 'PC:Player', 1234)
+    assert store.get('nametouid', 'PC:Player') == (False, None)
+    assert store.purge_expired() == 1
+
+
+def test_get_player_origin_is_persisted(mock, tmp_path, player_origin_response):
+    store = SQLiteIdentityStore(str(tmp_path / 'identity.sqlite3'))
+    mock.register_uri(
+        'GET', 'https://api.mozambiquehe.re/origin?player=Player', json=player_origin_response
+    )
+    api = ApexLegendsAPI(api_key='api_key', identity_store=store)
+    assert api.get_player_origin(player_name="Player")[0]['name'] == "Player"
+    assert api.get_player_origin(player_name="Player")[0]['name'] == "Player"
+    assert mock.call_count == 1
+
+
+def test_identity_store_subclasses_implement_get_and_set():
+    # pylint: disable=too-few-public-methods,abstract-method
+    class GetOnlyStore(IdentityStore):
+        """ forgets to implement set """
+        def get(self, kind, key):
+            return False, None
+
+    with pytest.raises(TypeError):
+        GetOnlyStore()  # pylint: disable=abstract-class-instantiated
+    with pytest.raises(TypeError):
+        IdentityStore()  # pylint: disable=abstract-class-instantiated
@@ -0,0 +1,35 @@
+""" unit tests for the lazily loaded package attributes """
+import subprocess
+import sys
+import apex_legends_api  # noqa F0401
+
+
+def loaded_modules(statement: str) -> set:
+    """ modules loaded by a fresh interpreter running the statement """
+    output: str = subprocess.run(
+        [sys.executable, '-c', f'{statement}\nimport sys\nprint(" ".join(sys.modules))'],
+        check=True, capture_output=True, text=True
+    ).stdout
+    return set(output.split())
+
+
+# pylint: disable=missing-function-docstring
+def test_domain_import_does_not_load_the_http_stack():
+    modules = loaded_modules(
+        'from apex_legends_api import ALPlayer, ALPlatform, ALHTTPExceptionFromResponse\n'
+        'ALPlayer.from_snapshot'
+    )
+    assert not modules & {'requests', 'urllib3', 'deprecated', 'apex_legends_api.al_api'}
+    assert 'requests' in loaded_modules('from apex_legends_api import ApexLegendsAPI')
+
+
+def test_lazy_attributes():
+    for name in apex_legends_api.__all__:
+        assert getattr(apex_legends_api, name).__name__ == name
+        assert name in dir(apex_legends_api)
+    try:
+        apex_legends_api.NotAnAttribute  # pylint: disable=pointless-statement
+    except AttributeError as error:
+        assert 'NotAnAttribute' in str(error)
+    else:
+        assert False
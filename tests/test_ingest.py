@@ -0,0 +1,71 @@
+""" unit tests for the multi-process bulk ingest """
+import gzip
+import json
+from apex_legends_api import ALPlayer  # noqa F0401
+from apex_legends_api.al_frame import EventFrame  # noqa F0401
+from apex_legends_api.al_ingest import BulkIngest, split_archive  # noqa F0401
+
+
+def write_archive(path, basic_player_stats_response, match_history_get_response, players):
+    """ an archive with a stats + events record per player, a stats only record and bad lines """
+    lines = []
+    for index in range(players):
+        stats = json.loads(json.dumps(basic_player_stats_response))
+        stats['global']['name'] = f'Player{index}'
+        lines.append(json.dumps({'stats': stats, 'events': match_history_get_response}))
+    lines += [json.dumps(basic_player_stats_response), json.dumps(match_history_get_response),
+              '{"Error": "Player not found"}', 'not json', '']
+    content = '\n'.join(lines) + '\n'
+    if str(path).endswith('.gz'):
+        with gzip.open(path, 'wt', encoding='utf-8') as archive:
+            archive.write(content)
+    else:
+        path.write_text(content, encoding='utf-8')
+    return str(path)
+
+
+def parsed(snapshot):
+    """ the parsed content of a snapshot, without the time the player was built at """
+    player_dict = ALPlayer.from_snapshot(snapshot).to_dict()
+    player_dict.pop('timestamp_last_checked')
+    return player_dict
+
+
+# pylint: disable=missing-function-docstring
+def test_split_archive(tmp_path, basic_player_stats_response, match_history_get_response):
+    path = write_archive(tmp_path / 'players.jsonl', basic_player_stats_response,
+                         match_history_get_response, 20)
+    chunks = split_archive(path, 1000)
+    assert len(chunks) > 20
+    assert chunks[0][1] == 0 and chunks[-1][2] == (tmp_path / 'players.jsonl').stat().st_size
+    assert split_archive(path + '.gz', 1000) == [(path + '.gz', 0, -1)]
+
+
+def test_bulk_ingest(tmp_path, basic_player_stats_response, match_history_get_response):
+    path = write_archive(tmp_path / 'players.jsonl', basic_player_stats_response,
+                         match_history_get_response, 20)
+    gz_path = write_archive(tmp_path / 'players.jsonl.gz', basic_player_stats_response,
+                            match_history_get_response, 5)
+    with BulkIngest(processes=2, chunk_size=1000) as ingest:
+        players = list(ingest.players([path, gz_path]))
+        assert ingest.skipped == 4
+        frame = ingest.frame(path)
+    assert [player.global_info.name for player in players[:20]] == \
+        [f'Player{index}' for index in range(20)]
+    assert len(players) == 27
+    assert len(players[0].events) == len(match_history_get_response)
+    assert len(players[20].events) == 0
+
+    expected = EventFrame.from_players(
+        [ALPlayer(basic_player_stats_response, events=match_history_get_response)] * 21
+    )
+    assert len(frame) == len(expected)
+    assert frame.group_by('legend_played').count() == expected.group_by('legend_played').count()
+    assert frame.tracker_group_by('key').sum('value') == \
+        expected.tracker_group_by('key').sum('value')
+
+    serial = BulkIngest(processes=1, chunk_size=1000)
+    with BulkIngest(processes=2) as ingest:
+        # marshal output depends on reference counts, compare the players, not the bytes
+        assert [parsed(snapshot) for snapshot in serial.snapshots(path)] == \
+            [parsed(snapshot) for snapshot in ingest.snapshots(path)]
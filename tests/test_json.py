@@ -0,0 +1,35 @@
+""" unit tests for the pluggable json decoding """
+import json
+from apex_legends_api import ApexLegendsAPI, ALPlatform  # noqa F0401
+from apex_legends_api.al_json import decode_response, default_decoder  # noqa F0401
+
+BASE_URL = f"{ApexLegendsAPI.base_url}?version={ApexLegendsAPI.api_version}"
+
+
+# pylint: disable=missing-function-docstring
+def test_decode_response():
+    assert decode_response(b'{"a": 1}', lambda: 'unused') == [{'a': 1}]
+    assert decode_response(b'[1, 2]', lambda: 'unused', json.loads) == [1, 2]
+    assert decode_response(b'Not json', lambda: 'Not json') == 'Not json'
+    assert default_decoder(b'{"name": "\\u00e9"}') == {'name': 'é'}
+
+
+def test_custom_decoder(mock, basic_player_stats_response):
+    calls = []
+
+    def decoder(content: bytes):
+        calls.append(type(content))
+        return json.loads(content)
+    api = ApexLegendsAPI(api_key='api_key', json_decoder=decoder)
+    mock.register_uri(
+        'GET', f"{BASE_URL}&platform=PC&player=GoshDarnedHero", json=basic_player_stats_response
+    )
+    result = api.basic_player_stats('GoshDarnedHero', ALPlatform.PC)
+    assert result == [basic_player_stats_response]
+    assert calls == [bytes]
+
+
+def test_non_json_response(mock):
+    api = ApexLegendsAPI(api_key='api_key')
+    mock.register_uri('GET', f"{BASE_URL}&platform=PC&player=Text", text='Café closed')
+    assert api.basic_player_stats('Text', ALPlatform.PC) == 'Café closed'
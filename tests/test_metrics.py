@@ -0,0 +1,75 @@
+""" unit tests for the request hooks and client statistics """
+import pytest
+from apex_legends_api import (  # noqa F0401
+    ApexLegendsAPI, ALPlatform, ALHTTPExceptionFromResponse, ClientStats, RequestInfo,
+    ResponseCache, RetryPolicy
+)
+from apex_legends_api.al_metrics import EndpointStats  # noqa F0401
+
+BASE_URL = f"{ApexLegendsAPI.base_url}?version={ApexLegendsAPI.api_version}"
+PLAYER_URL = f"{BASE_URL}&platform=PC&uid=1234"
+
+
+# pylint: disable=missing-function-docstring
+def test_hooks_report_requests(mock, basic_player_stats_response):
+    reports = []
+    api = ApexLegendsAPI(api_key='api_key', cache=ResponseCache(), hooks=[reports.append])
+    mock.register_uri('GET', PLAYER_URL, json=basic_player_stats_response)
+    api.basic_player_stats_by_uid('1234', ALPlatform.PC)
+    api.basic_player_stats_by_uid('1234', ALPlatform.PC)
+    first, second = reports[0], reports[1]
+    assert (first.endpoint, first.status_code, first.retries) == ('basic', 200, 0)
+    assert first.params == {'version': '5', 'platform': 'PC', 'uid': '1234'}
+    assert first.cache_hit is False and first.coalesced is False and first.error is None
+    assert first.response_bytes > 1000 and first.elapsed > 0
+    assert second.cache_hit is True and second.status_code is None
+    assert mock.call_count == 1
+
+    api.remove_hook(reports.append)
+    api.basic_player_stats_by_uid('1234', ALPlatform.PC)
+    assert len(reports) == 2
+
+
+def test_stats_retries_and_errors(mock, basic_player_stats_response):
+    api = ApexLegendsAPI(
+        api_key='api_key', retry=RetryPolicy(backoff_factor=0), stats=ClientStats()
+    )
+    reports = []
+    api.add_hook(reports.append)
+    mock.register_uri('GET', PLAYER_URL, [
+        {'status_code': 503}, {'json': basic_player_stats_response}
+    ])
+    api.basic_player_stats_by_uid('1234', ALPlatform.PC)
+    assert (reports[0].retries, reports[0].status_code) == (1, 200)
+
+    mock.register_uri('GET', f"{BASE_URL}&platform=PC&uid=404", status_code=404)
+    with pytest.raises(ALHTTPExceptionFromResponse):
+        api.basic_player_stats_by_uid('404', ALPlatform.PC)
+    assert isinstance(reports[1].error, ALHTTPExceptionFromResponse)
+
+    snapshot = api.stats.snapshot()
+    basic = snapshot['basic']
+    assert (basic.requests, basic.errors, basic.retries) == (2, 1, 1)
+    assert basic.status_codes == {200: 1, 404: 1}
+    assert basic.response_bytes == reports[0].response_bytes > 0
+    assert sum(basic.latency_counts) == 2
+    # the snapshot is a copy
+    api.basic_player_stats_by_uid('1234', ALPlatform.PC)
+    assert basic.requests == 2 and api.stats.snapshot()['basic'].requests == 3
+    api.stats.reset()
+    assert not api.stats.snapshot()
+
+
+def test_latency_histogram():
+    stats = EndpointStats()
+    assert stats.latency_percentile(50) == 0.0
+    for elapsed in (0.001, 0.002, 0.02, 0.3, 12.0):
+        info = RequestInfo('basic', 'url', {})
+        info.elapsed = elapsed
+        stats.add(info)
+    assert stats.latency_counts[0] == 2 and stats.latency_counts[-1] == 1
+    assert stats.latency_percentile(40) == 0.005
+    assert stats.latency_percentile(60) == 0.025
+    assert stats.latency_percentile(100) == 12.0
+    assert stats.latency_max == 12.0
+    assert stats.latency_mean == pytest.approx(12.323 / 5)
@@ -0,0 +1,69 @@
+""" unit tests for the local mock api server """
+import asyncio
+import pytest
+from apex_legends_api import ApexLegendsAPI, ALPlatform, ALAction, ClientStats, RetryPolicy  # noqa F0401
+from apex_legends_api.al_async import AsyncApexLegendsAPI  # noqa F0401
+from apex_legends_api.al_base import ALHTTPExceptionFromResponse  # noqa F0401
+from apex_legends_api.al_mock import (  # noqa F0401
+    MockAPIServer, constant_latency, player_events, player_stats
+)
+
+
+# pylint: disable=missing-function-docstring
+def test_synthetic_players_are_deterministic():
+    assert player_stats(7, seed=1) == player_stats(7, seed=1)
+    assert player_stats(7, seed=1) != player_stats(8, seed=1)
+    history = player_events(3, 50)
+    assert len(history) == 50
+    assert [event['timestamp'] for event in history] == \
+        sorted((event['timestamp'] for event in history), reverse=True)
+
+
+def test_client_against_mock_server():
+    with MockAPIServer(players=100, events_per_player=20) as server:
+        api = ApexLegendsAPI(api_key='api_key', **server.client_urls())
+        assert api.nametouid('Player42', ALPlatform.PC) == int(server.uid(42))
+        origin = api.get_player_origin('Player42')
+        assert origin[0]['uid'] == server.uid(42)
+
+        api.events_by_uid(server.uid(42), ALPlatform.PC, ALAction.ADD)
+        assert (server.uid(42), 'PC') in server.tracked
+        player = api.get_player_by_uid(server.uid(42), ALPlatform.PC)
+        assert player.global_info.name == 'Player42'
+        assert len(player.events) == 20
+        assert api.get_player_by_uid(server.uid(1000), ALPlatform.PC) is None
+        assert server.counts['/bridge'] >= 3
+        assert server.counts['status_200'] == sum(
+            server.counts[path] for path in ('/bridge', '/nametouid', '/origin')
+        )
+
+
+def test_mock_server_rate_limit_and_errors():
+    with MockAPIServer(players=10, rate=50, capacity=1) as server:
+        api = ApexLegendsAPI(api_key='api_key', retry=RetryPolicy(max_retries=10, backoff_factor=0),
+                             stats=ClientStats(), **server.client_urls())
+        for _ in range(4):
+            api.basic_player_stats_by_uid(server.uid(1), ALPlatform.PC)
+        assert server.counts['status_429'] > 0
+        assert api.stats.snapshot()['basic'].retries == server.counts['status_429']
+
+    with MockAPIServer(players=10, error_rate=1.0, error_statuses=(503,)) as server:
+        api = ApexLegendsAPI(api_key='api_key', **server.client_urls())
+        with pytest.raises(ALHTTPExceptionFromResponse):
+            api.basic_player_stats_by_uid(server.uid(1), ALPlatform.PC)
+        assert server.counts['status_503'] == 1
+
+
+def test_async_client_against_mock_server():
+    async def run(server):
+        async with AsyncApexLegendsAPI(api_key='api_key', **server.client_urls()) as api:
+            players = await asyncio.gather(*[
+                api.get_player_by_uid(server.uid(index), ALPlatform.PC) for index in range(10)
+            ])
+            uid = await api.nametouid('Player3', ALPlatform.PC)
+            return players, uid
+
+    with MockAPIServer(players=10, latency=constant_latency(0.01)) as server:
+        players, uid = asyncio.run(run(server))
+    assert [player.global_info.name for player in players] == [f'Player{i}' for i in range(10)]
+    assert uid == int(server.uid(3))
@@ -1,5 +1,8 @@
 """ unit tests for the player class """
+import copy
+import random
 from apex_legends_api import ApexLegendsAPI, ALAction, ALPlatform, ALPlayer  # noqa F0401
+from apex_legends_api.al_base import ALEventType  # noqa F0401
 from apex_legends_api.al_domain import DataTracker, Legend, GameInfo  # noqa F0401
 
 api = ApexLegendsAPI(api_key='api_key')
@@ -221,6 +224,92 @@ def test_al_player_selected_legend_badge_category(
             assert not hasattr(legend.game_info.badges[0], 'category')
 
 
+def test_lazy_al_player(basic_player_stats_response, match_history_get_response):
+    # pylint: disable=protected-access
+    player = ALPlayer(basic_player_stats_response, events=match_history_get_response, lazy=True)
+    assert player.global_info.name == "Player"
+    assert player._all_legends is None
+    assert player._events is None
+
+    eager_player = ALPlayer(basic_player_stats_response, events=match_history_get_response)
+    all_legends = player.all_legends
+    assert [legend.name for legend in all_legends] == \
+        [legend.name for legend in eager_player.all_legends]
+    assert player.all_legends is all_legends
+    assert player.selected_legend.name == eager_player.selected_legend.name
+    assert player.events[0].action == 'leave'
+    assert len(player.events) == len(eager_player.events)
+
+
+def test_compact_domain_objects(basic_player_stats_response, match_history_get_response):
+    player = ALPlayer(basic_player_stats_response, events=match_history_get_response)
+    compact_objects = [
+        player.realtime_info, player.global_info.rank, player.global_info.bans,
+        player.global_info.badges[0], player.selected_legend.data_trackers[0],
+        player.selected_legend.data_trackers[0].tracker_rank, *player.events
+    ]
+    for compact_object in compact_objects:
+        assert not hasattr(compact_object, '__dict__')
+    assert player.events[3].game_data_trackers[0].category == 'kills'
+
+
+def test_al_player_indexed_lookups(basic_player_stats_response):
+    player = ALPlayer(basic_player_stats_response, lazy=True)
+    lifeline = player.legend('Lifeline')
+    assert lifeline is player.legend('Lifeline')
+    assert lifeline.tracker('kills').value == 1334
+    assert lifeline.tracker('not_a_key') is None
+    assert player.legend('Not a legend') is None
+    kills = player.trackers('kills')
+    assert {tracker.key for tracker in kills} >= {'kills', 'specialEvent_kills', 'kills_season_8'}
+    assert player.total('kills') == sum(tracker.value for tracker in kills)
+    assert player.total('wins') == sum(
+        tracker.value for legend in player.all_legends for tracker in legend.data_trackers
+        if tracker.category == 'wins'
+    )
+    assert player.trackers('not_a_category') == [] and player.total('not_a_category') == 0
+
+
+def test_al_player_time_range_queries(basic_player_stats_response, match_history_get_response):
+    rng = random.Random(0)
+    history = []
+    for timestamp in rng.sample(range(1000, 3000), 400):
+        event = copy.deepcopy(rng.choice(match_history_get_response))
+        event['timestamp'] = timestamp
+        if event['eventType'] == 'Game':
+            event['legendPlayed'] = rng.choice(('Gibraltar', 'Wraith'))
+        history.append(event)
+    player = ALPlayer(basic_player_stats_response, events=history)
+    timestamps = [event.timestamp for event in player.events]
+    assert timestamps == sorted(timestamps, reverse=True)
+
+    def linear(start, end, event_type):
+        return [event for event in player.events
+                if start <= event.timestamp < end and event_type in (None, event.event_type)]
+    for start, end in ((0, 5000), (1500, 1501), (1234, 2345), (2999, 3000), (3000, 4000)):
+        for event_type in (None, ALEventType.GAME, ALEventType.SESSION):
+            assert player.events_between(start, end, event_type) == linear(start, end, event_type)
+    assert player.events_between(start=2500) == linear(2500, 5000, None)
+    assert player.events_between(end=1500) == linear(0, 1500, None)
+
+    session = player.first_event_after(2000, ALEventType.SESSION)
+    assert session == min((event for event in linear(2001, 5000, ALEventType.SESSION)),
+                          key=lambda event: event.timestamp)
+    assert player.first_event_after(5000) is None
+    rank_event = player.last_event(ALEventType.RANK)
+    assert rank_event == linear(0, 5000, ALEventType.RANK)[0]
+    assert player.last_event(before=1000) is None
+    assert player.last_event(before=2000) == linear(0, 2000, None)[0]
+
+    wraith_games = list(player.iter_games('Wraith', limit=5))
+    assert wraith_games == [event for event in linear(0, 5000, ALEventType.GAME)
+                            if event.legend_played == 'Wraith'][:5]
+    assert len(list(player.iter_games())) == len(linear(0, 5000, ALEventType.GAME))
+    assert not list(player.iter_games('Not a legend'))
+    assert ALPlayer.from_snapshot(player.to_snapshot()).events_between(1234, 2345)[0].timestamp \
+        == player.events_between(1234, 2345)[0].timestamp
+
+
 def helper_get_al_player(
         mock,
         basic_player_stats_response,
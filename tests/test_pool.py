@@ -0,0 +1,55 @@
+""" unit tests for the connection pool options and sharing a client between threads """
+from concurrent.futures import ThreadPoolExecutor
+from apex_legends_api import ApexLegendsAPI, ALPlatform  # noqa F0401
+
+BASE_URL = f"{ApexLegendsAPI.base_url}?version={ApexLegendsAPI.api_version}"
+
+
+# pylint: disable=missing-function-docstring,protected-access
+def test_pool_options():
+    api = ApexLegendsAPI(api_key='api_key', pool_connections=2, pool_maxsize=32, pool_block=True)
+    for prefix in ('https://', 'http://'):
+        adapter = api.session.get_adapter(prefix)
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 32
+        assert adapter._pool_block is True
+
+
+def test_timeout_and_keep_alive(mock, basic_player_stats_response):
+    mock.register_uri(
+        'GET', f"{BASE_URL}&platform=PC&player=GoshDarnedHero", json=basic_player_stats_response
+    )
+    api = ApexLegendsAPI(api_key='api_key', timeout=(3.05, 10))
+    api.basic_player_stats('GoshDarnedHero', ALPlatform.PC)
+    assert mock.last_request.timeout == (3.05, 10)
+    assert 'Connection' not in mock.last_request.headers or \
+        mock.last_request.headers['Connection'] != 'close'
+
+    ApexLegendsAPI(api_key='api_key', keep_alive=False).basic_player_stats(
+        'GoshDarnedHero', ALPlatform.PC
+    )
+    assert mock.last_request.headers['Connection'] == 'close'
+
+
+def test_shared_client_from_threads(mock, basic_player_stats_response):
+    mock.register_uri('GET', BASE_URL, json=basic_player_stats_response)
+    api = ApexLegendsAPI(api_key='api_key', pool_maxsize=8)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(
+            lambda index: api.basic_player_stats_by_uid(str(index), ALPlatform.PC), range(200)
+        ))
+    assert len(results) == 200
+    assert all(result == [basic_player_stats_response] for result in results)
+    assert sorted(int(request.qs['uid'][0]) for request in mock.request_history) == \
+        list(range(200))
+
+
+def test_get_players_keeps_the_adapters(mock):
+    mock.register_uri('GET', BASE_URL, status_code=404)
+    api = ApexLegendsAPI(api_key='api_key', pool_maxsize=4)
+    adapters = dict(api.session.adapters)
+    results = api.get_players([(f'Player{index}', ALPlatform.PC) for index in range(8)],
+                              max_workers=32)
+    assert not any(result.ok for result in results)
+    assert api.session.adapters == adapters
+    assert api.session.get_adapter('https://')._pool_maxsize == 4
@@ -0,0 +1,105 @@
+""" unit tests for the adaptive presence poller """
+import asyncio
+import copy
+from apex_legends_api import ApexLegendsAPI, ALPlatform, TokenBucket  # noqa F0401
+from apex_legends_api.al_presence import PresencePoller  # noqa F0401
+
+BASE_URL = f"{ApexLegendsAPI.base_url}?version={ApexLegendsAPI.api_version}"
+PLAYER_URL = f"{BASE_URL}&platform=PC&uid=1234&skipRank=True"
+
+
+# pylint: disable=missing-function-docstring,missing-class-docstring,too-few-public-methods
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def with_realtime(response: dict, online: int, in_game: int, legend: str = 'Gibraltar') -> list:
+    response = copy.deepcopy(response)
+    response['realtime'].update(isOnline=online, isInGame=in_game, selectedLegend=legend)
+    return [{'json': response}]
+
+
+def make_poller(**kwargs) -> PresencePoller:
+    poller = PresencePoller(
+        ApexLegendsAPI(api_key='api_key'), budget=TokenBucket(rate=1000), clock=FakeClock(),
+        **kwargs
+    )
+    poller.add(1234, ALPlatform.PC)
+    return poller
+
+
+def test_poller_reports_changes_only(mock, basic_player_stats_skip_rank_response):
+    seen = []
+    poller = make_poller(callback=seen.append)
+    mock.register_uri('GET', PLAYER_URL, with_realtime(basic_player_stats_skip_rank_response, 0, 0))
+    assert len(poller.poll()) == 1
+    assert not poller.poll()  # not due yet
+    poller.clock.now += 60
+    assert not poller.poll()  # due, but nothing changed
+    assert mock.call_count == 2
+    assert all('skipRank=True' in request.url for request in mock.request_history)
+
+    mock.register_uri('GET', PLAYER_URL, with_realtime(basic_player_stats_skip_rank_response, 1, 1))
+    poller.clock.now += 120
+    changes = poller.poll()
+    assert len(changes) == 1
+    assert changes[0].changed == ('is_online', 'is_in_game')
+    assert changes[0].previous.is_online is False and changes[0].current.is_in_game is True
+    assert poller.presence(1234, ALPlatform.PC).is_in_game
+    assert len(seen) == 2 and seen[1] is changes[0]
+
+
+def test_poller_adaptive_interval(mock, basic_player_stats_skip_rank_response):
+    poller = make_poller(offline_interval=60, max_interval=200, backoff=2)
+    mock.register_uri('GET', PLAYER_URL, with_realtime(basic_player_stats_skip_rank_response, 0, 0))
+    intervals = []
+    for _ in range(4):
+        poller.clock.now = poller.next_due()
+        poller.poll()
+        intervals.append(poller.next_due() - poller.clock.now)
+    assert intervals == [60, 120, 200, 200]
+
+    mock.register_uri('GET', PLAYER_URL, with_realtime(basic_player_stats_skip_rank_response, 1, 1))
+    poller.clock.now = poller.next_due()
+    poller.poll()
+    assert poller.next_due() - poller.clock.now == poller.in_game_interval
+
+
+def test_poller_error_backs_off(mock):
+    poller = make_poller(offline_interval=60)
+    mock.register_uri('GET', PLAYER_URL, json={'Error': 'Player not found'})
+    assert not poller.poll()
+    assert poller.next_due() - poller.clock.now == 60
+    poller.remove(1234, ALPlatform.PC)
+    assert poller.next_due() is None and len(poller) == 0
+
+
+def test_poller_async_changes(mock, basic_player_stats_skip_rank_response):
+    poller = make_poller()
+    mock.register_uri('GET', PLAYER_URL, with_realtime(basic_player_stats_skip_rank_response, 1, 0))
+
+    async def first_change():
+        async for change in poller.changes():
+            return change
+    change = asyncio.run(first_change())
+    assert change.uid == '1234' and change.current.is_online
+
+
+def test_poller_remove_and_add_again(mock, basic_player_stats_skip_rank_response):
+    poller = make_poller(in_game_interval=15)
+    mock.register_uri('GET', PLAYER_URL, with_realtime(basic_player_stats_skip_rank_response, 1, 1))
+    poller.remove(1234, ALPlatform.PC)
+    poller.add(1234, ALPlatform.PC)
+    for _ in range(5):
+        poller.poll()
+        poller.clock.now += 15
+    assert mock.call_count == 5
+    assert len(poller._schedule) == 1  # pylint: disable=protected-access
+    assert poller.next_due() == poller.clock.now
+
+    poller.remove(1234, ALPlatform.PC)
+    assert poller.next_due() is None and not poller.poll()
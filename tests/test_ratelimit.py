@@ -0,0 +1,55 @@
+""" unit tests for the rate limiter and retry policy """
+import time
+import pytest
+from apex_legends_api import ApexLegendsAPI, ALPlatform, ALHTTPExceptionFromResponse  # noqa F0401
+from apex_legends_api import RetryPolicy, TokenBucket  # noqa F0401
+
+PLAYER_URL = f"{ApexLegendsAPI.base_url}?version={ApexLegendsAPI.api_version}" \
+             f"&platform=PC&player=Player"
+
+
+# pylint: disable=missing-function-docstring
+def test_token_bucket_limits_rate():
+    bucket = TokenBucket(rate=100, capacity=1)
+    start = time.monotonic()
+    for _ in range(6):
+        bucket.acquire()
+    assert time.monotonic() - start >= 0.04
+
+
+def test_token_bucket_shared_per_key():
+    assert TokenBucket.for_key('key_one', rate=5) is TokenBucket.for_key('key_one', rate=10)
+    assert TokenBucket.for_key('key_one', rate=5) is not TokenBucket.for_key('key_two', rate=5)
+
+
+def test_retry_after_parsing():
+    assert RetryPolicy.parse_retry_after('3') == 3.0
+    assert RetryPolicy.parse_retry_after(None) is None
+    assert RetryPolicy.parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0.0
+    assert RetryPolicy(backoff_factor=0).backoff(attempt=2, retry_after=1.5) == 1.5
+
+
+def test_retry_on_429_honors_retry_after(mock, monkeypatch, basic_player_stats_response):
+    sleeps = []
+    monkeypatch.setattr(time, 'sleep', sleeps.append)
+    mock.register_uri('GET', PLAYER_URL, [
+        {'status_code': 429, 'headers': {'Retry-After': '2'}, 'text': 'slow down'},
+        {'status_code': 503, 'text': 'unavailable'},
+        {'status_code': 200, 'json': basic_player_stats_response},
+    ])
+    api = ApexLegendsAPI(
+        api_key='api_key', rate_limiter=TokenBucket(rate=1000), retry=RetryPolicy(max_retries=2)
+    )
+    response = api.basic_player_stats(player_name="Player", platform=ALPlatform.PC)
+    assert response[0]['global']['name'] == "Player"
+    assert mock.call_count == 3
+    assert sleeps[0] >= 2
+
+
+def test_retry_gives_up(mock, monkeypatch):
+    monkeypatch.setattr(time, 'sleep', lambda seconds: None)
+    mock.register_uri('GET', PLAYER_URL, status_code=500, text='boom')
+    api = ApexLegendsAPI(api_key='api_key', retry=RetryPolicy(max_retries=2))
+    with pytest.raises(ALHTTPExceptionFromResponse):
+        api.basic_player_stats(player_name="Player", platform=ALPlatform.PC)
+    assert mock.call_count == 3
@@ -0,0 +1,92 @@
+""" unit tests for the streaming sessionization """
+import pytest
+from apex_legends_api import ALPlayer  # noqa F0401
+from apex_legends_api.al_domain import event_factory  # noqa F0401
+from apex_legends_api.al_sessions import Sessionizer, merge_events, sessionize  # noqa F0401
+
+
+# pylint: disable=missing-function-docstring
+def join(uid, timestamp):
+    return event_factory({'uid': uid, 'player': f'Player{uid}', 'timestamp': timestamp,
+                          'eventType': 'Session', 'event': {'action': 'join'}})
+
+
+def leave(uid, timestamp, duration=0):
+    return event_factory({'uid': uid, 'player': f'Player{uid}', 'timestamp': timestamp,
+                          'eventType': 'Session',
+                          'event': {'action': 'leave', 'sessionDuration': duration}})
+
+
+def game(uid, timestamp, legend='Wraith', kills=1, length=10):
+    return event_factory({
+        'uid': uid, 'player': f'Player{uid}', 'timestamp': timestamp, 'eventType': 'Game',
+        'gameLength': length, 'legendPlayed': legend,
+        'event': [{'name': 'Kills', 'value': kills, 'key': 'kills'},
+                  {'name': 'Season 9 Kills', 'value': kills, 'key': 'kills_season_9'},
+                  {'name': 'Damage', 'value': 100 * kills, 'key': 'damage'}]
+    })
+
+
+def test_complete_session():
+    sessions = list(sessionize([
+        join(1, 1000), game(1, 2000, 'Wraith', 2), game(1, 3000, 'Lifeline', 3),
+        game(1, 4000, 'Wraith', 1), leave(1, 4500, 3500)
+    ]))
+    assert len(sessions) == 1
+    session = sessions[0]
+    assert (session.start, session.end, session.duration) == (1000, 4500, 3500)
+    assert session.joined and session.left
+    assert session.games == 3 and session.game_minutes == 30
+    assert session.legends == ['Wraith', 'Lifeline']
+    assert session.trackers == {'kills': 12, 'damage': 600}
+
+
+def test_missing_join_and_leave():
+    sessions = list(sessionize([
+        game(1, 2000), leave(1, 2500, 1500),  # no join, the start comes from the duration
+        join(1, 3000), game(1, 3600), join(1, 5000),  # no leave, ends at the last game
+        game(1, 6000, length=5), game(1, 6000 + 3 * 60 * 60),  # idle gap, no join or leave
+    ], max_gap=2 * 60 * 60))
+    assert [(s.start, s.end, s.joined, s.left, s.games) for s in sessions] == [
+        (1000, 2500, False, True, 1),
+        (3000, 3600, True, False, 1),
+        (5000, 6000, True, False, 1),
+        (6000 + 3 * 60 * 60 - 600, 6000 + 3 * 60 * 60, False, False, 1),
+    ]
+    assert list(sessionize([leave(1, 2000, 600)]))[0].start == 1400
+
+
+def test_many_players_in_constant_memory():
+    # every player plays one game a day, a few players are online at the same time
+    histories = [
+        [join(uid, start), game(uid, start + 600)]
+        for uid in range(50) for start in range(uid * 1000, uid * 1000 + 10 * 86400, 86400)
+    ]
+    sessionizer = Sessionizer(max_gap=3600)
+    sessions = []
+    most_open = 0
+    for event in merge_events(histories):
+        sessions.extend(sessionizer.feed(event))
+        most_open = max(most_open, sessionizer.open_sessions)
+    sessions.extend(sessionizer.flush())
+    assert len(sessions) == 500 and sessionizer.open_sessions == 0
+    assert most_open < 10
+    assert all(session.games == 1 and not session.left for session in sessions)
+
+    unordered = list(sessionize(
+        (event for history in histories for event in history), max_gap=3600, global_order=False
+    ))
+    assert len(unordered) == 500
+
+
+def test_out_of_order_events():
+    with pytest.raises(ValueError):
+        list(sessionize([game(1, 2000), game(1, 1000)]))
+
+
+def test_player_history(basic_player_stats_response, match_history_get_response):
+    player = ALPlayer(basic_player_stats_response, events=match_history_get_response)
+    sessions = list(sessionize(reversed(player.events)))
+    assert len(sessions) == 1
+    assert sessions[0].games == 1 and sessions[0].left
+    assert sessions[0].legends == ['Gibraltar']
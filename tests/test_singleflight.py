@@ -0,0 +1,126 @@
+""" unit tests for the coalescing of identical in-flight requests """
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from apex_legends_api import ApexLegendsAPI, ALPlatform, ALHTTPExceptionFromResponse  # noqa F0401
+from apex_legends_api.al_async import AsyncApexLegendsAPI  # noqa F0401
+from apex_legends_api.al_singleflight import AsyncSingleFlight, SingleFlight  # noqa F0401
+
+PLAYER_URL = f"{ApexLegendsAPI.base_url}?version={ApexLegendsAPI.api_version}&platform=PC&uid=1234"
+
+
+def wait_for(condition, timeout: float = 5.0):
+    """ wait until the condition is True (or the timeout expires) """
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+# pylint: disable=missing-function-docstring
+def test_single_flight_shares_result_and_error():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def slow(value):
+        calls.append(value)
+        release.wait(5)
+        if value == 'error':
+            raise ValueError(value)
+        return [value]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(flight.do, 'key', lambda: slow('result')) for _ in range(4)]
+        wait_for(lambda: flight.coalesced == 3)
+        release.set()
+        results = [future.result() for future in futures]
+    assert calls == ['result'] and len(flight) == 0
+    assert all(result is results[0] for result in results)
+
+    release.clear()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(flight.do, 'key', lambda: slow('error')) for _ in range(2)]
+        wait_for(lambda: flight.coalesced == 4)
+        release.set()
+        for future in futures:
+            with pytest.raises(ValueError):
+                future.result()
+    # once released, the next call runs again
+    assert flight.do('key', lambda: 'again') == 'again'
+
+
+def test_client_coalesces_threads(mock, basic_player_stats_response):
+    api = ApexLegendsAPI(api_key='api_key')
+
+    def respond(_request, _context):
+        wait_for(lambda: api.single_flight.coalesced == 7)
+        return basic_player_stats_response
+    mock.register_uri('GET', PLAYER_URL, json=respond)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(
+            lambda _: api.basic_player_stats_by_uid('1234', ALPlatform.PC), range(8)
+        ))
+    assert mock.call_count == 1
+    assert all(result == [basic_player_stats_response] for result in results)
+
+    no_coalescing = ApexLegendsAPI(api_key='api_key', coalesce=False)
+    mock.register_uri('GET', PLAYER_URL, status_code=503)
+    with pytest.raises(ALHTTPExceptionFromResponse):
+        no_coalescing.basic_player_stats_by_uid('1234', ALPlatform.PC)
+    assert no_coalescing.single_flight is None
+
+
+def test_async_single_flight():
+    async def run():
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def slow():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return ['result']
+        results = await asyncio.gather(*[flight.do('key', slow) for _ in range(5)])
+        return flight, calls, results
+    flight, calls, results = asyncio.run(run())
+    assert calls == [1] and flight.coalesced == 4 and len(flight) == 0
+    assert results == [['result']] * 5
+
+
+def test_async_client_coalesces(async_mock, basic_player_stats_response):
+    async def slow_response(_url, **_kwargs):
+        await asyncio.sleep(0.01)
+
+    # registered once: a second upstream request would fail
+    async_mock.get(PLAYER_URL, payload=basic_player_stats_response, callback=slow_response)
+
+    async def run():
+        async with AsyncApexLegendsAPI(api_key='api_key') as api:
+            results = await asyncio.gather(*[
+                api.basic_player_stats_by_uid('1234', ALPlatform.PC) for _ in range(5)
+            ])
+            return api.single_flight.coalesced, results
+    coalesced, results = asyncio.run(run())
+    assert coalesced == 4
+    assert results == [[basic_player_stats_response]] * 5
+
+
+def test_async_single_flight_first_caller_cancelled():
+    async def run():
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def slow():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return ['result']
+        first = asyncio.ensure_future(asyncio.wait_for(flight.do('key', slow), timeout=0.01))
+        await asyncio.sleep(0)
+        others = asyncio.gather(*[flight.do('key', slow) for _ in range(3)])
+        with pytest.raises(asyncio.TimeoutError):
+            await first
+        return flight, calls, await others
+    flight, calls, results = asyncio.run(run())
+    assert calls == [1] and flight.coalesced == 3 and len(flight) == 0
+    assert results == [['result']] * 3
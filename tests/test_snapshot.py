@@ -0,0 +1,72 @@
+""" unit tests for the ALPlayer dictionary / binary snapshot serialization """
+import json
+import marshal
+import struct
+import sys
+import pytest
+from apex_legends_api import ALPlayer  # noqa F0401
+from apex_legends_api.al_base import ALPlatform, ALEventType, print_description  # noqa F0401
+from apex_legends_api.al_domain import GameEvent, SessionEvent  # noqa F0401
+from apex_legends_api.al_snapshot import SNAPSHOT_MAGIC, SNAPSHOT_VERSION  # noqa F0401
+
+
+# pylint: disable=missing-function-docstring
+def assert_same_player(restored: ALPlayer, player: ALPlayer):
+    assert restored.to_dict() == player.to_dict()
+    assert restored.global_info.platform is ALPlatform.PC
+    assert restored.global_info.rank.rank_division_roman == \
+        player.global_info.rank.rank_division_roman
+    assert not hasattr(restored.global_info.badges[0], 'category')
+    assert restored.selected_legend.game_info.badges[0].category == 'Account Badges'
+    assert [type(event) for event in restored.events] == [type(event) for event in player.events]
+    assert restored.events[0].event_type is ALEventType.SESSION
+    tracker = restored.events[3].game_data_trackers[0]
+    assert isinstance(restored.events[3], GameEvent)
+    assert (tracker.key_id, tracker.category) == (
+        player.events[3].game_data_trackers[0].key_id, 'kills'
+    )
+    assert restored.legend('Lifeline').tracker('kills').value == 1334
+    assert restored.total('kills') == player.total('kills')
+
+
+def test_dict_round_trip(basic_player_stats_response, match_history_get_response):
+    player = ALPlayer(basic_player_stats_response, events=match_history_get_response)
+    player_dict = player.to_dict()
+    assert player_dict['version'] == SNAPSHOT_VERSION
+    assert player_dict['global_info']['platform'] == 'PC'
+    restored = ALPlayer.from_dict(json.loads(json.dumps(player_dict)))
+    assert_same_player(restored, player)
+    assert isinstance(restored.events[0], SessionEvent) and restored.events[0].action == 'leave'
+
+
+def test_snapshot_round_trip(basic_player_stats_response, match_history_get_response):
+    player = ALPlayer(basic_player_stats_response, events=match_history_get_response, lazy=True)
+    snapshot = player.to_snapshot()
+    assert snapshot.startswith(SNAPSHOT_MAGIC)
+    restored = ALPlayer.from_snapshot(snapshot)
+    assert_same_player(restored, player)
+    assert ALPlayer.from_snapshot(restored.to_snapshot()).to_dict() == player.to_dict()
+    print_description(restored)
+
+
+def test_snapshot_version_checks(basic_player_stats_response):
+    snapshot = ALPlayer(basic_player_stats_response).to_snapshot()
+    with pytest.raises(ValueError):
+        ALPlayer.from_snapshot(b'not a snapshot')
+    with pytest.raises(ValueError):
+        ALPlayer.from_snapshot(SNAPSHOT_MAGIC + b'\xff\xff' + snapshot[6:])
+    header = struct.pack('<4sHBBB', SNAPSHOT_MAGIC, SNAPSHOT_VERSION, marshal.version,
+                         sys.version_info[0], sys.version_info[1])
+    assert snapshot.startswith(header)
+    other_python = struct.pack('<4sHBBB', SNAPSHOT_MAGIC, SNAPSHOT_VERSION, marshal.version,
+                               sys.version_info[0], sys.version_info[1] + 1)
+    with pytest.raises(ValueError, match='python'):
+        ALPlayer.from_snapshot(other_python + snapshot[len(header):])
+    other_marshal = struct.pack('<4sHBBB', SNAPSHOT_MAGIC, SNAPSHOT_VERSION, marshal.version - 1,
+                                sys.version_info[0], sys.version_info[1])
+    with pytest.raises(ValueError, match='marshal'):
+        ALPlayer.from_snapshot(other_marshal + snapshot[len(header):])
+    player_dict = ALPlayer(basic_player_stats_response).to_dict()
+    player_dict['version'] = SNAPSHOT_VERSION + 1
+    with pytest.raises(ValueError):
+        ALPlayer.from_dict(player_dict)
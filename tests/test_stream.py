@@ -0,0 +1,54 @@
+""" unit tests for the streaming event parser """
+import json
+import pytest
+from apex_legends_api import ApexLegendsAPI, ALPlatform  # noqa F0401
+from apex_legends_api.al_base import ALEventType  # noqa F0401
+from apex_legends_api.al_domain import GameEvent, SessionEvent  # noqa F0401
+from apex_legends_api.al_stream import iter_json_array  # noqa F0401
+
+api = ApexLegendsAPI(api_key='api_key')
+HISTORY_URL = f"{ApexLegendsAPI.base_url}?version={ApexLegendsAPI.api_version}" \
+              f"&platform=PC&uid=0000000000000&history=1&action=get"
+
+
+def chunked(data: bytes, size: int) -> list:
+    """ split the data in chunks of the given size """
+    return [data[index:index + size] for index in range(0, len(data), size)]
+
+
+# pylint: disable=missing-function-docstring
+def test_iter_json_array_tiny_chunks(match_history_get_response):
+    body = json.dumps(match_history_get_response, indent=4).encode('utf-8')
+    for size in (1, 7, len(body)):
+        assert list(iter_json_array(chunked(body, size))) == match_history_get_response
+
+
+def test_iter_json_array_scalars_and_unicode():
+    body = json.dumps([12345, "soirée", {"a": [1, 2]}, -0.5], ensure_ascii=False).encode('utf-8')
+    assert list(iter_json_array(chunked(body, 1))) == [12345, "soirée", {"a": [1, 2]}, -0.5]
+    assert not list(iter_json_array([b' [ ] ']))
+
+
+def test_iter_json_array_object_and_errors():
+    assert list(iter_json_array([b'{"Error": ', b'"nope"}'])) == [{"Error": "nope"}]
+    with pytest.raises(ValueError):
+        list(iter_json_array([b'[{"a": 1}, {"b"']))
+    with pytest.raises(ValueError):
+        list(iter_json_array([b'not json']))
+
+
+def test_iter_events_by_uid(mock, match_history_get_response):
+    mock.register_uri('GET', HISTORY_URL, json=match_history_get_response)
+    events = list(api.iter_events_by_uid(uid="0000000000000", platform=ALPlatform.PC))
+    assert len(events) == 4
+    assert isinstance(events[0], SessionEvent)
+
+    games = list(api.iter_events_by_uid(
+        uid="0000000000000", platform=ALPlatform.PC, event_types=[ALEventType.GAME]
+    ))
+    assert len(games) == 1 and isinstance(games[0], GameEvent)
+
+    recent = list(api.iter_events_by_uid(
+        uid="0000000000000", platform=ALPlatform.PC, start=1616878857
+    ))
+    assert [event.timestamp for event in recent] == [1616879521]
@@ -0,0 +1,46 @@
+""" unit tests for the incremental event sync """
+from apex_legends_api import ApexLegendsAPI, ALPlatform  # noqa F0401
+from apex_legends_api.al_domain import GameEvent, SessionEvent  # noqa F0401
+from apex_legends_api.al_sync import EventLog, EventSync  # noqa F0401
+
+api = ApexLegendsAPI(api_key='api_key')
+HISTORY_URL = f"{ApexLegendsAPI.base_url}?version={ApexLegendsAPI.api_version}" \
+              f"&platform=PC&uid=0000000000000&history=1&action=get"
+
+
+# pylint: disable=missing-function-docstring
+def test_sync_only_returns_new_events(mock, match_history_get_response):
+    sync = EventSync(api)
+    mock.register_uri('GET', HISTORY_URL, json=match_history_get_response)
+    first = sync.sync_by_uid("0000000000000", ALPlatform.PC)
+    assert len(first) == 4
+    assert first[-1].timestamp == 1616879521
+    assert not sync.sync_by_uid("0000000000000", ALPlatform.PC)
+
+    newer_game = dict(match_history_get_response[3], timestamp=1616880000)
+    mock.register_uri('GET', HISTORY_URL, json=[newer_game] + match_history_get_response)
+    second = sync.sync_by_uid("0000000000000", ALPlatform.PC)
+    assert len(second) == 1 and isinstance(second[0], GameEvent)
+    assert sync.log.high_water_mark("0000000000000", ALPlatform.PC) == 1616880000
+
+
+def test_event_log_is_persisted(mock, tmp_path, match_history_get_response):
+    path = str(tmp_path / 'events.jsonl')
+    mock.register_uri('GET', HISTORY_URL, json=match_history_get_response)
+    assert len(EventSync(api, EventLog(path)).sync_by_uid("0000000000000", ALPlatform.PC)) == 4
+
+    # a new process replays the log and only logs what it has not seen
+    log = EventLog(path)
+    assert log.high_water_mark("0000000000000", ALPlatform.PC) == 1616879521
+    assert not EventSync(api, log).sync_by_uid("0000000000000", ALPlatform.PC)
+    events = list(log.iter_events(uid="0000000000000", platform=ALPlatform.PC))
+    assert len(events) == 4
+    assert isinstance(events[-1], SessionEvent)
+
+
+def test_event_log_dedupes_same_timestamp(match_history_get_response):
+    log = EventLog()
+    assert len(log.append(ALPlatform.PC, match_history_get_response[1:3])) == 2
+    # same timestamp, one already logged and one new event type
+    assert len(log.append(ALPlatform.PC, match_history_get_response[1:4])) == 1
+    assert len(log.append(ALPlatform.PC, match_history_get_response[3:4] * 2)) == 0
@@ -0,0 +1,39 @@
+""" unit tests for the tracker key registry """
+from apex_legends_api.al_domain import DataTracker  # noqa F0401
+from apex_legends_api.al_tracker_keys import (  # noqa F0401
+    TrackerKeyRegistry, tracker_category, tracker_keys
+)
+
+
+# pylint: disable=missing-function-docstring
+def test_tracker_category():
+    assert tracker_category('specialEvent_kills') == 'kills'
+    assert tracker_category('arenas_wins') == 'wins'
+    assert tracker_category('kills_season_9') == 'kills'
+    assert tracker_category('grandsoiree_damage') == 'damage'
+    assert tracker_category('damage') == 'damage'
+
+
+def test_registry_memoizes_and_interns():
+    registry = TrackerKeyRegistry()
+    first = registry.lookup(''.join(['specialEvent_', 'kills']))
+    second = registry.lookup('specialEvent_kills')
+    assert first is second and len(registry) == 1
+    assert (first.key_id, first.category, first.category_id) == (0, 'kills', 0)
+    other = registry.lookup('kills_season_9')
+    assert (other.key_id, other.category_id) == (1, 0)
+    assert registry.by_id(1) is other
+    assert registry.lookup('damage').category_id == 1
+    assert registry.categories == ['kills', 'damage']
+    assert list(registry.key_categories) == [0, 0, 1]
+    assert registry.category_id('wins') is None and 'wins' not in registry
+
+
+def test_data_tracker_uses_registry():
+    trackers = [
+        DataTracker({'name': 'Kills', 'value': 3, 'key': ''.join(['special', 'Event_kills'])})
+        for _ in range(2)
+    ]
+    assert trackers[0].key is trackers[1].key
+    assert trackers[0].category == 'kills'
+    assert tracker_keys.by_id(trackers[0].key_id).key == 'specialEvent_kills'
@@ -0,0 +1,49 @@
+""" unit tests for the tracked player index """
+from apex_legends_api import ApexLegendsAPI, ALAction, ALPlatform, TrackedPlayerIndex  # noqa F0401
+
+BASE_URL = f"{ApexLegendsAPI.base_url}?version={ApexLegendsAPI.api_version}&platform=PC"
+
+
+def info_calls(mock) -> int:
+    """ number of ALAction.INFO requests sent """
+    return sum(1 for request in mock.request_history if request.qs.get('action') == ['info'])
+
+
+# pylint: disable=missing-function-docstring
+def test_get_player_reuses_tracked_index(
+        mock,
+        basic_player_stats_response,
+        match_history_get_response,
+        match_history_info_response
+):
+    api = ApexLegendsAPI(api_key='api_key')
+    mock.register_uri('GET', BASE_URL + "&player=Player", json=basic_player_stats_response)
+    mock.register_uri(
+        'GET', BASE_URL + "&player=Player&history=1&action=info", json=match_history_info_response
+    )
+    mock.register_uri(
+        'GET', BASE_URL + "&player=Player&history=1&action=get", json=match_history_get_response
+    )
+    for _ in range(3):
+        player = api.get_player(name="Player", platform=ALPlatform.PC)
+        assert player.events[0].action == 'leave'
+    assert info_calls(mock) == 1
+    assert api.tracked_players.is_tracked(ALPlatform.PC, uid="0000000000000")
+
+
+def test_tracked_index_follows_add_and_delete(mock, match_history_info_response):
+    api = ApexLegendsAPI(api_key='api_key', tracked_players=TrackedPlayerIndex(refresh_interval=60))
+    info_url = BASE_URL + "&uid=0000000000000&history=1&action=info"
+    mock.register_uri('GET', info_url, json=match_history_info_response)
+    mock.register_uri('GET', BASE_URL + "&uid=1234&history=1&action=add", json={"result": "ok"})
+    mock.register_uri('GET', BASE_URL + "&uid=1234&history=1&action=delete", json={"result": "ok"})
+    api.events_by_uid(uid="0000000000000", platform=ALPlatform.PC, action=ALAction.INFO)
+    assert not api.tracked_players.is_stale
+    assert not api.tracked_players.is_tracked(ALPlatform.PC, uid="1234")
+
+    api.add_player_by_uid(player_uid=1234, platform=ALPlatform.PC)
+    assert api.tracked_players.is_tracked(ALPlatform.PC, uid="1234")
+    assert not api.tracked_players.is_tracked(ALPlatform.XBOX, uid="1234")
+
+    api.events_by_uid(uid="1234", platform=ALPlatform.PC, action=ALAction.DELETE)
+    assert not api.tracked_players.is_tracked(ALPlatform.PC, uid="1234")